@@ -1,5 +1,23 @@
 from .core.microframe import MicroFrame
 from .core.printers import StructuredDataPrinter
-from .readers.readers import read_csv
+from .core.lazy import LazyFrame
+from .core.builders import concat, MicroFrameBuilder
+from .core.stats import StatsAccumulator
+from .core.sketches import KLLSketch, HyperLogLog
+from .core.config import set_option, get_option
+from .readers.readers import read_csv, scan_csv
 
-__all__ = [MicroFrame, StructuredDataPrinter, read_csv]
\ No newline at end of file
+__all__ = [
+    MicroFrame,
+    StructuredDataPrinter,
+    LazyFrame,
+    concat,
+    MicroFrameBuilder,
+    StatsAccumulator,
+    KLLSketch,
+    HyperLogLog,
+    set_option,
+    get_option,
+    read_csv,
+    scan_csv,
+]
\ No newline at end of file
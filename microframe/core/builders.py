@@ -0,0 +1,182 @@
+import numpy as np
+from typing import Any, List, Optional
+
+
+def concat(frames: List[Any]):
+    """
+    Concatenates MicroFrames row-wise into a new MicroFrame.
+
+    The frames must have the same column names in the same order. The dtype of every column is promoted
+    across the frames first (for example ``int32`` and ``float64`` give ``float64``, ``U3`` and ``U8`` give
+    ``U8``), then the result is allocated once and each frame is copied into its slice of it.
+
+    :param frames: The frames to concatenate, in order.
+    :type frames: list
+    :return: A new MicroFrame holding the rows of all frames.
+    :rtype: MicroFrame
+    :raises ValueError: If no frames are given, the column names differ, or a column mixes text with
+        other data.
+
+    Example:
+        >>> combined = concat([january, february, march])
+    """
+    frames = list(frames)
+    if not frames:
+        raise ValueError("No frames to concatenate.")
+    dtype = frames[0].values.dtype
+    for frame in frames[1:]:
+        dtype = promote_dtypes(dtype, frame.values.dtype)
+
+    values = np.empty(sum(frame.values.shape[0] for frame in frames), dtype=dtype)
+    offset = 0
+    for frame in frames:
+        length = frame.values.shape[0]
+        for name in dtype.names:
+            values[name][offset:offset + length] = frame.values[name]
+        offset += length
+    return type(frames[0]).from_structured_array(values)
+
+
+def promote_dtypes(dtype: np.dtype, other: np.dtype) -> np.dtype:
+    """
+    Returns the structured dtype that can hold the rows of two structured dtypes with the same field names.
+
+    :param dtype: The first structured dtype.
+    :param other: The second structured dtype.
+    :return: The structured dtype with every field promoted.
+    :rtype: numpy.dtype
+    :raises ValueError: If the field names differ or a field cannot be promoted.
+    """
+    if dtype.names != other.names:
+        raise ValueError(f"Column names {list(other.names)} do not match {list(dtype.names)}.")
+    fields = []
+    for name in dtype.names:
+        first, second = dtype.fields[name][0], other.fields[name][0]
+        if (first.kind in "US") != (second.kind in "US"):
+            raise ValueError(f"Column '{name}' mixes {first} and {second} data.")
+        try:
+            fields.append((name, np.result_type(first, second)))
+        except TypeError:
+            raise ValueError(f"Column '{name}' mixes {first} and {second} data.")
+    return np.dtype(fields)
+
+
+class MicroFrameBuilder:
+    """
+    Collects rows in a buffer with spare capacity, for building a MicroFrame from many small batches.
+
+    The buffer doubles in size whenever it runs out of room, so appending n rows in any number of batches
+    copies O(n) rows in total instead of rebuilding the whole array on every append.
+
+    :param dtype: The structured dtype of the rows.
+    :type dtype: numpy.dtype
+    :param capacity: The number of rows to allocate room for up front.
+    :type capacity: int
+
+    Example:
+        >>> builder = MicroFrameBuilder(mframe.dtypes)
+        >>> for batch in batches:
+        ...     builder.append(batch)
+        >>> result = builder.build()
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int = 1024):
+        """
+        Initializes the MicroFrameBuilder with an empty buffer.
+        """
+        self._buffer = np.empty(capacity, dtype=np.dtype(dtype))
+        self._length = 0
+        self.values = self._buffer[:0]
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, capacity: Optional[int] = None):
+        """
+        Creates a builder that starts with a copy of existing rows.
+
+        :param values: The structured array holding the first rows.
+        :type values: numpy.ndarray
+        :param capacity: The number of rows to allocate room for. Defaults to twice the number of rows.
+        :type capacity: int, optional
+        :return: The new builder.
+        :rtype: MicroFrameBuilder
+        """
+        builder = cls(values.dtype, max(capacity or 2 * values.shape[0], values.shape[0], 1))
+        builder.append(values)
+        return builder
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows collected so far.
+
+        :return: The number of rows.
+        :rtype: int
+        """
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of rows the buffer can hold before it has to grow.
+
+        :return: The capacity.
+        :rtype: int
+        """
+        return self._buffer.shape[0]
+
+    def append(self, rows: Any):
+        """
+        Appends rows at the end of the buffer.
+
+        MicroFrames and structured arrays must have the same column names; if their dtypes are wider, the
+        buffer is promoted as in `concat`. Sequences of rows are converted to the buffer dtype.
+
+        :param rows: A MicroFrame, a structured array, or a list of rows given as lists or tuples.
+        :raises ValueError: If the column names differ or a column cannot be promoted.
+        """
+        rows = self._as_structured(rows)
+        dtype = promote_dtypes(self._buffer.dtype, rows.dtype)
+        stop = self._length + rows.shape[0]
+        if stop > self.capacity or dtype != self._buffer.dtype:
+            self._grow(max(stop, 2 * self.capacity) if stop > self.capacity else self.capacity, dtype)
+        self._buffer[self._length:stop] = rows
+        self._length = stop
+        self.values = self._buffer[:stop]
+
+    def build(self):
+        """
+        Returns a MicroFrame with the rows collected so far.
+
+        The MicroFrame gets its own copy without the spare capacity, so the builder can keep appending.
+
+        :return: A new MicroFrame object.
+        :rtype: MicroFrame
+        """
+        from .microframe import MicroFrame
+
+        return MicroFrame.from_structured_array(self.values.copy())
+
+    def _as_structured(self, rows: Any) -> np.ndarray:
+        """
+        Converts appended rows to a structured array.
+
+        :param rows: A MicroFrame, a structured array, or a list of rows.
+        :return: The rows as a structured array.
+        :rtype: numpy.ndarray
+        """
+        if isinstance(rows, np.ndarray) and rows.dtype.names is not None:
+            return rows
+        if hasattr(rows, "values") and isinstance(rows.values, np.ndarray):
+            return rows.values
+        return np.array([tuple(row) for row in rows], dtype=self._buffer.dtype)
+
+    def _grow(self, capacity: int, dtype: np.dtype):
+        """
+        Moves the collected rows into a new buffer.
+
+        :param capacity: The capacity of the new buffer.
+        :param dtype: The dtype of the new buffer.
+        """
+        buffer = np.empty(capacity, dtype=dtype)
+        for name in dtype.names:
+            buffer[name][:self._length] = self._buffer[name][:self._length]
+        self._buffer = buffer
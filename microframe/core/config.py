@@ -0,0 +1,111 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+_OPTIONS = {"threads": 1}
+_MIN_BLOCK_ROWS = 65536
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def set_option(name: str, value: Any) -> None:
+    """
+    Sets a global MicroFrame option.
+
+    Supported options:
+
+    - ``"threads"``: The number of threads used for per-column and per-row-block work such as `describe`,
+      `to_numpy`, `change_dtypes`, row gathers and `query` masks. NumPy releases the GIL inside these
+      kernels, so wide or long frames scale across cores. Pass None to use one thread per CPU. Defaults to 1.
+
+    :param name: The option name.
+    :type name: str
+    :param value: The new value.
+    :raises KeyError: If the option does not exist.
+    :raises ValueError: If the value is not valid for the option.
+
+    Example:
+        >>> set_option("threads", 8)
+    """
+    if name not in _OPTIONS:
+        raise KeyError(f"Unknown option '{name}'.")
+    if name == "threads":
+        if value is None:
+            value = os.cpu_count() or 1
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError("The number of threads must be a positive integer.")
+        _replace_executor(value)
+    _OPTIONS[name] = value
+
+
+def get_option(name: str) -> Any:
+    """
+    Returns the value of a global MicroFrame option.
+
+    :param name: The option name.
+    :type name: str
+    :return: The current value.
+    :raises KeyError: If the option does not exist.
+    """
+    if name not in _OPTIONS:
+        raise KeyError(f"Unknown option '{name}'.")
+    return _OPTIONS[name]
+
+
+def parallel_map(function: Callable, items: Iterable) -> List[Any]:
+    """
+    Applies a function to every item on the shared thread pool and returns the results in order.
+
+    Runs serially when only one thread is configured, for a single item, and when called from a pool
+    thread, so nested calls cannot exhaust the pool.
+
+    :param function: The function to apply. It must be safe to run concurrently on different items.
+    :param items: The items.
+    :return: The results, in the order of `items`.
+    :rtype: list
+    """
+    items = list(items)
+    if _OPTIONS["threads"] == 1 or len(items) <= 1 or getattr(_worker_state, "active", False):
+        return [function(item) for item in items]
+    return list(_executor.map(_run_in_worker, [function] * len(items), items))
+
+
+def row_blocks(num_rows: int) -> List[tuple]:
+    """
+    Splits rows into one contiguous block per thread, with at least 65536 rows per block.
+
+    :param num_rows: The number of rows.
+    :type num_rows: int
+    :return: ``(start, stop)`` pairs covering all rows in order.
+    :rtype: list
+    """
+    num_blocks = max(1, min(_OPTIONS["threads"], num_rows // _MIN_BLOCK_ROWS))
+    bounds = [num_rows * block // num_blocks for block in range(num_blocks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _run_in_worker(function: Callable, item: Any) -> Any:
+    """
+    Runs a function on a pool thread, marking the thread as busy for nested `parallel_map` calls.
+    """
+    _worker_state.active = True
+    try:
+        return function(item)
+    finally:
+        _worker_state.active = False
+
+
+def _replace_executor(threads: int) -> None:
+    """
+    Replaces the shared thread pool with one of the given size.
+
+    :param threads: The number of threads. A single thread needs no pool.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="microframe") if threads > 1 else None
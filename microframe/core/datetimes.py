@@ -0,0 +1,191 @@
+import re
+from datetime import datetime
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .text import is_ascii
+
+ISO_FORMAT = "ISO8601"
+
+_ISO_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(\.\d{1,9})?)?)?")
+_FIELD_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2, "f": 6}
+
+
+def detect_datetime_format(text: str, formats: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    Finds the format of a date or timestamp string.
+
+    ISO 8601 dates and timestamps without a time zone, such as ``2024-01-31``, ``2024-01-31 12:00`` or
+    ``2024-01-31T12:00:00.250``, are always recognized. Other layouts are recognized when one of `formats`,
+    given as `datetime.strptime` formats, parses the string.
+
+    :param text: The string to inspect.
+    :type text: str
+    :param formats: Additional formats to try, in order, for example ``["%d/%m/%Y"]``.
+    :type formats: iterable of str, optional
+    :return: `ISO_FORMAT`, the first matching format, or None if the string is not a date.
+    :rtype: str or None
+    """
+    if _ISO_PATTERN.fullmatch(text):
+        return ISO_FORMAT
+    for date_format in formats or []:
+        try:
+            datetime.strptime(text, date_format)
+            return date_format
+        except ValueError:
+            continue
+    return None
+
+
+def datetime_unit(values, date_format: str) -> str:
+    """
+    Chooses the resolution for a column of dates: nanoseconds if any value has fractional seconds, else seconds.
+
+    Every value is checked, so a fraction further down the column is not truncated by a unit chosen from
+    the first row.
+
+    :param values: The text values of the column, as an array or a list of strings.
+    :param date_format: The format of the column, as returned by `detect_datetime_format`.
+    :return: ``"ns"`` or ``"s"``.
+    :rtype: str
+    """
+    if date_format != ISO_FORMAT:
+        return "ns" if "%f" in date_format else "s"
+    column = np.asarray(values)
+    if column.dtype.kind not in "SU":
+        column = column.astype(str)
+    separator = b"." if column.dtype.kind == "S" else "."
+    return "ns" if (np.char.find(column, separator) >= 0).any() else "s"
+
+
+def parse_datetimes(column: np.ndarray, unit: str = "s", date_format: Optional[str] = None) -> np.ndarray:
+    """
+    Converts a text column to ``datetime64`` in bulk. Empty strings become NaT.
+
+    ISO 8601 text is parsed by NumPy's own datetime cast. Formats made of fixed-width numeric fields
+    (``%Y %m %d %H %M %S %f``, the latter as six digits) and literal characters, such as ``%d/%m/%Y %H:%M``,
+    are parsed without a Python loop: the digits of every field are read from a byte matrix of the column
+    and combined with datetime64 arithmetic. Values of another length, such as the unpadded ``1/3/2024``
+    that `datetime.strptime` also accepts for ``%d/%m/%Y``, and other formats fall back to
+    `datetime.strptime` per value.
+
+    :param column: The text column.
+    :type column: numpy.ndarray
+    :param unit: The resolution of the result, such as ``"s"`` or ``"ns"``.
+    :type unit: str
+    :param date_format: A `datetime.strptime` format, or None or `ISO_FORMAT` for ISO 8601.
+    :type date_format: str, optional
+    :return: The parsed column.
+    :rtype: numpy.ndarray
+    :raises ValueError: If a value does not match the format or is not a valid date.
+    """
+    dtype = np.dtype(f"datetime64[{unit}]")
+    if date_format is None or date_format == ISO_FORMAT:
+        return column.astype(dtype)
+    layout = _fixed_width_layout(date_format)
+    if layout is None or (column.dtype.kind == "U" and not is_ascii(column)):
+        return _parse_each(column, dtype, date_format)
+    lengths = np.char.str_len(column)
+    irregular = (lengths > 0) & (lengths != layout[1])
+    if not irregular.any():
+        return _parse_fixed_width(column.astype(f"S{layout[1]}"), layout, dtype, date_format)
+    result = np.empty(column.shape[0], dtype=dtype)
+    result[~irregular] = _parse_fixed_width(column[~irregular].astype(f"S{layout[1]}"), layout, dtype, date_format)
+    result[irregular] = _parse_each(column[irregular], dtype, date_format)
+    return result
+
+
+def _parse_each(column: np.ndarray, dtype: np.dtype, date_format: str) -> np.ndarray:
+    """
+    Parses a text column one value at a time with `datetime.strptime`. Empty strings become NaT.
+
+    :param column: The text column, as unicode or byte strings.
+    :param dtype: The datetime64 dtype of the result.
+    :param date_format: A `datetime.strptime` format.
+    :return: The parsed column.
+    :rtype: numpy.ndarray
+    :raises ValueError: If a value does not match the format.
+    """
+    texts = column.tolist()
+    if column.dtype.kind == "S":
+        texts = [text.decode() for text in texts]
+    return np.array([datetime.strptime(text, date_format) if text else None for text in texts], dtype=dtype)
+
+
+def _fixed_width_layout(date_format: str) -> Optional[tuple]:
+    """
+    Splits a format into fixed-width numeric fields and literal characters.
+
+    :param date_format: A `datetime.strptime` format.
+    :return: A list of ``(directive, start, width)`` fields, the total width and a list of
+        ``(position, character)`` literals, or None if the format has other directives.
+    :rtype: tuple or None
+    """
+    fields, literals, position, index = [], [], 0, 0
+    while index < len(date_format):
+        character = date_format[index]
+        if character == "%":
+            directive = date_format[index + 1:index + 2]
+            if directive == "%":
+                literals.append((position, ord("%")))
+                position += 1
+            elif directive in _FIELD_WIDTHS:
+                fields.append((directive, position, _FIELD_WIDTHS[directive]))
+                position += _FIELD_WIDTHS[directive]
+            else:
+                return None
+            index += 2
+            continue
+        if ord(character) >= 128:
+            return None
+        literals.append((position, ord(character)))
+        position += 1
+        index += 1
+    if "Y" not in [directive for directive, _, _ in fields]:
+        return None
+    return fields, position, literals
+
+
+def _parse_fixed_width(column: np.ndarray, layout: tuple, dtype: np.dtype, date_format: str) -> np.ndarray:
+    """
+    Parses a byte string column whose values follow a fixed-width layout.
+
+    :param column: The values as byte strings exactly as wide as the layout.
+    :param layout: The layout returned by `_fixed_width_layout`.
+    :param dtype: The datetime64 dtype of the result.
+    :param date_format: The format, for error messages.
+    :return: The parsed column.
+    :rtype: numpy.ndarray
+    :raises ValueError: If a value does not match the layout or is not a valid date.
+    """
+    fields, width, literals = layout
+    lengths = np.char.str_len(column)
+    empty = lengths == 0
+    codes = np.ascontiguousarray(column).view(np.uint8).reshape(column.shape[0], width)
+    valid = empty | (lengths == width)
+    for position, code in literals:
+        valid &= empty | (codes[:, position] == code)
+
+    parts = {"m": 1, "d": 1}
+    for directive, start, field_width in fields:
+        digits = codes[:, start:start + field_width].astype(np.int64) - ord("0")
+        valid &= empty | ((digits >= 0) & (digits <= 9)).all(axis=1)
+        parts[directive] = digits @ (10 ** np.arange(field_width - 1, -1, -1))
+    if not valid.all():
+        raise ValueError(f"Value '{column[np.argmin(valid)].decode()}' does not match format '{date_format}'.")
+
+    month = np.asarray(parts["m"])
+    months = np.where(empty, 0, (parts["Y"] - 1970) * 12 + month - 1).astype("datetime64[M]")
+    result = months.astype(dtype) + (np.asarray(parts["d"]) - 1).astype("timedelta64[D]")
+    valid = empty | ((result.astype("datetime64[M]") == months) & (month >= 1) & (month <= 12))
+    for directive, unit, limit in (("H", "h", 24), ("M", "m", 60), ("S", "s", 62), ("f", "us", 10 ** 6)):
+        if directive in parts:
+            valid &= empty | (parts[directive] < limit)
+            result = result + parts[directive].astype(f"timedelta64[{unit}]")
+    if not valid.all():
+        raise ValueError(f"Value '{column[np.argmin(valid)].decode()}' is not a valid date.")
+    result = result.astype(dtype)
+    result[empty] = np.datetime64("NaT")
+    return result
+
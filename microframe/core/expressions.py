@@ -0,0 +1,407 @@
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from .config import parallel_map, row_blocks
+from .text import encode_text
+
+
+class ExpressionError(Exception):
+    """Raised when an expression cannot be parsed or evaluated"""
+
+    pass
+
+
+_BINARY_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+    ast.Pow: np.power,
+}
+
+_COMPARISON_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+class Expression:
+    """
+    A column expression parsed once and compiled into NumPy operations.
+
+    Expressions use Python syntax. Names refer to columns, or to variables passed at evaluation time, and
+    the supported operations are arithmetic (``+ - * / // % **``), comparisons (including chained
+    comparisons and ``in``/``not in`` with a list of constants) and the boolean operators ``and``, ``or``,
+    ``not`` (or ``&``, ``|``, ``~``).
+
+    Boolean operators short-circuit over rows: the right operand of ``and`` is only evaluated on the rows
+    where the left operand is True, and the right operand of ``or`` only on the rows where it is False,
+    so each column is read once for the rows that are still undecided.
+
+    :param source: The expression, for example ``"price > 10 and region == 'EU'"``.
+    :type source: str
+    :raises ExpressionError: If the expression is not valid or uses unsupported syntax.
+
+    Example:
+        >>> expression = Expression("price > 10 and region == 'EU'")
+        >>> mask = expression.mask(mframe.values)
+    """
+
+    def __init__(self, source: str):
+        """
+        Initializes the Expression by parsing and compiling the source.
+        """
+        self.source = source
+        self.names = set()
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"Invalid expression '{source}': {e.msg}")
+        self._tree = tree.body
+        self._evaluate = self._compile(tree.body)
+
+    def evaluate(self, values: np.ndarray, rows: Optional[np.ndarray] = None, variables: Optional[dict] = None):
+        """
+        Evaluates the expression over the rows of a structured array.
+
+        :param values: The structured array whose fields the expression refers to.
+        :type values: numpy.ndarray
+        :param rows: Row positions to evaluate on. If None, all rows are used.
+        :type rows: numpy.ndarray, optional
+        :param variables: Values for names that are not columns.
+        :type variables: dict, optional
+        :return: The result, one entry per evaluated row, or a scalar if no column is referenced.
+        :rtype: numpy.ndarray or scalar
+        :raises ExpressionError: If a name is neither a column nor a variable, or an operation fails.
+        """
+        try:
+            return self._evaluate(values, rows, variables or {})
+        except (TypeError, ValueError) as e:
+            raise ExpressionError(f"Error in evaluating '{self.source}': {e}")
+
+    def mask(self, values: np.ndarray, variables: Optional[dict] = None) -> np.ndarray:
+        """
+        Evaluates a boolean expression into a row mask.
+
+        With several threads configured, long arrays are split into row blocks that are evaluated in
+        parallel.
+
+        :param values: The structured array whose fields the expression refers to.
+        :type values: numpy.ndarray
+        :param variables: Values for names that are not columns.
+        :type variables: dict, optional
+        :return: A boolean array with one entry per row.
+        :rtype: numpy.ndarray
+        :raises ExpressionError: If the expression does not evaluate to booleans.
+        """
+        blocks = row_blocks(values.shape[0])
+        if len(blocks) == 1:
+            return self._as_mask(self.evaluate(values, None, variables), values.shape[0])
+        return np.concatenate(parallel_map(
+            lambda block: self._as_mask(self.evaluate(values[block[0]:block[1]], None, variables), block[1] - block[0]),
+            blocks,
+        ))
+
+    def evaluate_blocks(
+            self,
+            values: np.ndarray,
+            out: Optional[np.ndarray] = None,
+            block_size: int = 65536,
+            variables: Optional[dict] = None,
+    ) -> np.ndarray:
+        """
+        Evaluates the expression block by block, writing each block of results into `out`.
+
+        A full-frame evaluation allocates one temporary as long as the frame for every operator. Here the
+        rows are processed in blocks of `block_size`, and every arithmetic operator writes into its own
+        scratch buffer of one block, allocated on the first block and reused for all later ones. The
+        temporaries stay small enough to remain in the CPU cache, and peak memory grows by a few blocks
+        instead of several columns.
+
+        :param values: The structured array whose fields the expression refers to.
+        :type values: numpy.ndarray
+        :param out: The array receiving one result per row, for example a column of `values`. If None, an
+            array of the result dtype is allocated.
+        :type out: numpy.ndarray, optional
+        :param block_size: The number of rows per block.
+        :type block_size: int
+        :param variables: Values for names that are not columns.
+        :type variables: dict, optional
+        :return: `out`, or the newly allocated result.
+        :rtype: numpy.ndarray
+        :raises ExpressionError: If a name is neither a column nor a variable, or an operation fails.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive.")
+        num_rows = values.shape[0]
+        if out is None and num_rows == 0:
+            return np.asarray(self.evaluate(values, None, variables)).reshape(0)
+        kernel = self._compile_kernel(self._tree)
+        variables = variables or {}
+        try:
+            for start in range(0, num_rows, block_size):
+                stop = min(start + block_size, num_rows)
+                result = kernel(values[start:stop], variables)
+                if out is None:
+                    out = np.empty(num_rows, dtype=np.asarray(result).dtype)
+                out[start:stop] = result
+        except (TypeError, ValueError) as e:
+            raise ExpressionError(f"Error in evaluating '{self.source}': {e}")
+        return out
+
+    def _compile_kernel(self, node: ast.AST) -> Callable:
+        """
+        Compiles an AST node into a function of ``(block, variables)`` for `evaluate_blocks`.
+
+        Arithmetic and unary operators get scratch buffers that are owned by the returned function, so every
+        call of `evaluate_blocks` compiles its own kernel. Other operations evaluate like `evaluate` on the
+        block.
+
+        :param node: The node to compile.
+        :return: The compiled function.
+        """
+        if isinstance(node, ast.Name):
+            evaluate_name = self._compile_name(node.id)
+            return lambda block, variables: evaluate_name(block, None, variables)
+        if isinstance(node, ast.Constant):
+            value = node.value
+            return lambda block, variables: value
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            operands = [self._compile_kernel(node.left), self._compile_kernel(node.right)]
+            return self._compile_scratch_operation(_BINARY_OPERATORS[type(node.op)], operands)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return self._compile_scratch_operation(np.negative, [self._compile_kernel(node.operand)])
+        evaluate = self._compile(node)
+        return lambda block, variables: evaluate(block, None, variables)
+
+    @staticmethod
+    def _compile_scratch_operation(function: np.ufunc, operands: list) -> Callable:
+        """
+        Compiles a ufunc call that writes into a scratch buffer reused from block to block.
+
+        :param function: The ufunc to apply.
+        :param operands: The compiled operands.
+        :return: The compiled function.
+        """
+        scratch = []
+
+        def evaluate_operation(block, variables):
+            arguments = [operand(block, variables) for operand in operands]
+            if scratch:
+                return function(*arguments, out=scratch[0][:block.shape[0]])
+            result = function(*arguments)
+            if np.ndim(result) > 0:
+                scratch.append(result)
+            return result
+
+        return evaluate_operation
+
+    def _compile(self, node: ast.AST) -> Callable:
+        """
+        Compiles an AST node into a function of ``(values, rows, variables)``.
+
+        :param node: The node to compile.
+        :return: The compiled function.
+        :raises ExpressionError: If the node uses unsupported syntax.
+        """
+        if isinstance(node, ast.Name):
+            return self._compile_name(node.id)
+        if isinstance(node, ast.Constant):
+            value = node.value
+            return lambda values, rows, variables: value
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            items = [self._compile(item) for item in node.elts]
+            return lambda values, rows, variables: [item(values, rows, variables) for item in items]
+        if isinstance(node, ast.UnaryOp):
+            return self._compile_unary(node)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            is_and = isinstance(node.op, ast.BitAnd)
+            return self._compile_boolean(is_and, [self._compile(node.left), self._compile(node.right)])
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            function = _BINARY_OPERATORS[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda values, rows, variables: function(
+                left(values, rows, variables), right(values, rows, variables)
+            )
+        if isinstance(node, ast.BoolOp):
+            is_and = isinstance(node.op, ast.And)
+            return self._compile_boolean(is_and, [self._compile(operand) for operand in node.values])
+        if isinstance(node, ast.Compare):
+            return self._compile_compare(node)
+        raise ExpressionError(f"Unsupported syntax in expression '{self.source}': {ast.dump(node)}")
+
+    def _compile_name(self, name: str) -> Callable:
+        """
+        Compiles a name into a lookup of the column, or of the variable, with that name.
+
+        :param name: The referenced name.
+        :return: The compiled function.
+        """
+        self.names.add(name)
+
+        def evaluate_name(values, rows, variables):
+            if values.dtype.fields is not None and name in values.dtype.fields:
+                column = values[name]
+                return column if rows is None else column[rows]
+            if name in variables:
+                return variables[name]
+            raise ExpressionError(f"Name '{name}' in expression '{self.source}' is not a column or variable.")
+
+        return evaluate_name
+
+    def _compile_unary(self, node: ast.UnaryOp) -> Callable:
+        """
+        Compiles a unary operation.
+
+        :param node: The unary operation node.
+        :return: The compiled function.
+        """
+        operand = self._compile(node.operand)
+        if isinstance(node.op, (ast.Not, ast.Invert)):
+            return lambda values, rows, variables: np.logical_not(operand(values, rows, variables))
+        if isinstance(node.op, ast.USub):
+            return lambda values, rows, variables: np.negative(operand(values, rows, variables))
+        return operand
+
+    def _compile_compare(self, node: ast.Compare) -> Callable:
+        """
+        Compiles a comparison. Chained comparisons become a short-circuiting ``and`` of their pairs.
+
+        :param node: The comparison node.
+        :return: The compiled function.
+        """
+        operands = [self._compile(node.left)] + [self._compile(comparator) for comparator in node.comparators]
+        pairs = [
+            self._compile_pair(op, operands[position], operands[position + 1])
+            for position, op in enumerate(node.ops)
+        ]
+        if len(pairs) == 1:
+            return pairs[0]
+        return self._compile_boolean(True, pairs)
+
+    def _compile_pair(self, op: ast.cmpop, left: Callable, right: Callable) -> Callable:
+        """
+        Compiles a single comparison between two operands.
+
+        :param op: The comparison operator node.
+        :param left: The compiled left operand.
+        :param right: The compiled right operand.
+        :return: The compiled function.
+        :raises ExpressionError: If the operator is not supported.
+        """
+        if isinstance(op, (ast.In, ast.NotIn)):
+            invert = isinstance(op, ast.NotIn)
+            return lambda values, rows, variables: np.isin(
+                *_align_constants(left(values, rows, variables), right(values, rows, variables)), invert=invert
+            )
+        if type(op) not in _COMPARISON_OPERATORS:
+            raise ExpressionError(f"Unsupported comparison in expression '{self.source}'.")
+        function = _COMPARISON_OPERATORS[type(op)]
+
+        def evaluate_pair(values, rows, variables):
+            first, second = _align_constants(left(values, rows, variables), right(values, rows, variables))
+            return function(np.asarray(first), second)
+
+        return evaluate_pair
+
+    def _compile_boolean(self, is_and: bool, operands: list) -> Callable:
+        """
+        Compiles a short-circuiting ``and`` or ``or`` over several operands.
+
+        :param is_and: True for ``and``, False for ``or``.
+        :param operands: The compiled operands, in evaluation order.
+        :return: The compiled function.
+        """
+
+        def evaluate_boolean(values, rows, variables):
+            num_rows = values.shape[0] if rows is None else rows.shape[0]
+            mask = self._as_mask(operands[0](values, rows, variables), num_rows)
+            for operand in operands[1:]:
+                undecided = mask if is_and else ~mask
+                if not undecided.any():
+                    break
+                positions = np.flatnonzero(undecided)
+                selected = positions if rows is None else rows[positions]
+                mask[positions] = self._as_mask(operand(values, selected, variables), positions.shape[0])
+            return mask
+
+        return evaluate_boolean
+
+    def _as_mask(self, result: Any, num_rows: int) -> np.ndarray:
+        """
+        Converts an operand result into a writable boolean mask with one entry per row.
+
+        :param result: The operand result.
+        :param num_rows: The number of rows the operand was evaluated on.
+        :return: The boolean mask.
+        :rtype: numpy.ndarray
+        :raises ExpressionError: If the result is not boolean.
+        """
+        result = np.asarray(result)
+        if result.dtype != bool:
+            raise ExpressionError(f"Expression '{self.source}' does not evaluate to booleans.")
+        if result.ndim == 0:
+            return np.full(num_rows, bool(result))
+        if result.base is not None:
+            return result.copy()
+        return result
+
+
+def _align_constants(left: Any, right: Any) -> tuple:
+    """
+    Converts strings compared with a byte string (``S``) or date (``datetime64``) column to the column type.
+
+    Text then compares the same in ``U`` and ``S`` columns, and a filter such as ``ts >= '2024-01-01'`` becomes
+    a comparison of 64-bit integers instead of a per-row string parse.
+
+    :param left: The left operand.
+    :param right: The right operand.
+    :return: Both operands, with strings converted if the other operand is such a column.
+    :rtype: tuple
+    """
+    if isinstance(left, np.ndarray) and left.dtype.kind in "SM":
+        return left, _as_column_type(right, left.dtype)
+    if isinstance(right, np.ndarray) and right.dtype.kind in "SM":
+        return _as_column_type(left, right.dtype), right
+    return left, right
+
+
+def _as_column_type(value: Any, dtype: np.dtype) -> Any:
+    """
+    Converts a string constant, a list of them or a unicode array to a byte string or datetime64 dtype.
+
+    :param value: The value to convert.
+    :param dtype: The dtype of the column it is compared with.
+    :return: The converted value, or the value itself if it holds no strings.
+    """
+    if dtype.kind == "S":
+        return encode_text(value)
+    is_text = isinstance(value, str) or (isinstance(value, np.ndarray) and value.dtype.kind == "U")
+    if isinstance(value, (list, tuple, set)):
+        is_text = any(isinstance(item, str) for item in value)
+        value = list(value)
+    return np.asarray(value, dtype=dtype) if is_text else value
+
+
+@lru_cache(maxsize=128)
+def compile_expression(source: str) -> Expression:
+    """
+    Returns the compiled Expression for a source string, reusing earlier compilations.
+
+    :param source: The expression source.
+    :type source: str
+    :return: The compiled expression.
+    :rtype: Expression
+    :raises ExpressionError: If the expression is not valid or uses unsupported syntax.
+    """
+    return Expression(source)
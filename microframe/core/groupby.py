@@ -0,0 +1,212 @@
+import numpy as np
+from typing import List, Union
+from .config import parallel_map
+
+AGGREGATIONS = ("sum", "mean", "count", "min", "max")
+
+
+class GroupBy:
+    """
+    Groups the rows of a MicroFrame by one or more key columns for aggregation.
+
+    Keys are factorized with a single stable sort from `MicroFrame.argsort` when the GroupBy is created, so
+    repeated groupings of an unchanged frame by the same keys reuse the cached permutation. Every aggregated
+    column is then gathered into key order once and reduced per group with `numpy.ufunc.reduceat`, so the
+    cost does not depend on the number of groups and no Python code runs per group. Groups come out sorted
+    by key. NaN values are skipped by every aggregation, and NaN keys form one group. Aggregated columns are
+    processed in parallel when several threads are configured with `set_option`.
+
+    :param frame: The MicroFrame to group.
+    :type frame: MicroFrame
+    :param keys: The name of the key column, or a list of key column names. An empty list puts all rows
+        in one group.
+    :type keys: str or list
+    :raises KeyError: If a key column does not exist.
+
+    Example:
+        >>> mframe.groupby(['region', 'year']).agg({'price': ['sum', 'mean'], 'qty': 'count'})
+    """
+
+    def __init__(self, frame, keys: Union[str, List[str]]):
+        """
+        Initializes the GroupBy and factorizes the keys.
+        """
+        self.frame = frame
+        self.keys = [keys] if isinstance(keys, str) else list(keys)
+        for key in self.keys:
+            if key not in frame.values.dtype.fields:
+                raise KeyError(f"Column '{key}' does not exist.")
+        self.order, self.starts = self._factorize()
+
+    @property
+    def ngroups(self) -> int:
+        """
+        Returns the number of groups.
+
+        :return: The number of groups.
+        :rtype: int
+        """
+        return self.starts.shape[0]
+
+    def agg(self, spec: dict):
+        """
+        Aggregates columns per group.
+
+        The result has one row per group: the key columns followed by one column per aggregation, named
+        ``<column>_<aggregation>``. Sums keep integer columns as 64-bit integers, means are float64, counts
+        are int64, and minimums and maximums keep the column dtype.
+
+        :param spec: A dictionary mapping column names to an aggregation name or a list of them. Supported
+            aggregations are ``"sum"``, ``"mean"``, ``"count"``, ``"min"`` and ``"max"``.
+        :type spec: dict
+        :return: A new MicroFrame with the aggregated values.
+        :rtype: MicroFrame
+        :raises ValueError: If an aggregation is not supported, or is a sum or mean of a non-numeric column.
+        :raises KeyError: If an aggregated column does not exist.
+        """
+        spec = self.normalize_spec(spec)
+        for column in spec:
+            if column not in self.frame.values.dtype.fields:
+                raise KeyError(f"Column '{column}' does not exist.")
+        results = {key: self._take_sorted(self.frame.values[key])[self.starts] for key in self.keys}
+        for reduced in parallel_map(lambda item: self._aggregate_column(*item), spec.items()):
+            results.update(reduced)
+
+        values = np.empty(self.ngroups, dtype=[(name, result.dtype) for name, result in results.items()])
+        for name, result in results.items():
+            values[name] = result
+        return type(self.frame).from_structured_array(values)
+
+    def _aggregate_column(self, column: str, aggregations: List[str]) -> dict:
+        """
+        Gathers one column into key order and computes its aggregations.
+
+        :param column: The column name.
+        :param aggregations: The aggregation names.
+        :return: A dictionary mapping output column names to one value per group.
+        :rtype: dict
+        """
+        sorted_column = self._take_sorted(self.frame.values[column])
+        reduced = {}
+        return {
+            f"{column}_{aggregation}": self._reduce(sorted_column, aggregation, reduced)
+            for aggregation in aggregations
+        }
+
+    @staticmethod
+    def normalize_spec(spec: dict) -> dict:
+        """
+        Validates an aggregation spec and turns every entry into a list of aggregation names.
+
+        :param spec: A dictionary mapping column names to an aggregation name or a list of them.
+        :type spec: dict
+        :return: The normalized spec.
+        :rtype: dict
+        :raises ValueError: If an aggregation is not supported.
+        """
+        normalized = {}
+        for column, aggregations in spec.items():
+            aggregations = [aggregations] if isinstance(aggregations, str) else list(aggregations)
+            for aggregation in aggregations:
+                if aggregation not in AGGREGATIONS:
+                    raise ValueError(f"Unsupported aggregation '{aggregation}'.")
+            normalized[column] = aggregations
+        return normalized
+
+    def _factorize(self) -> tuple:
+        """
+        Sorts the rows by key and finds where each group starts.
+
+        :return: The sort permutation (None when there are no keys) and the group start positions.
+        :rtype: tuple
+        """
+        num_rows = self.frame.values.shape[0]
+        if num_rows == 0:
+            return None, np.empty(0, dtype=np.intp)
+        if not self.keys:
+            return None, np.zeros(1, dtype=np.intp)
+
+        key_columns = [self.frame.values[key] for key in self.keys]
+        order = self.frame.argsort(self.keys)
+
+        boundaries = np.zeros(num_rows, dtype=bool)
+        boundaries[0] = True
+        for column in key_columns:
+            sorted_column = column[order]
+            differs = sorted_column[1:] != sorted_column[:-1]
+            if sorted_column.dtype.kind == "f":
+                differs &= ~(np.isnan(sorted_column[1:]) & np.isnan(sorted_column[:-1]))
+            boundaries[1:] |= differs
+        return order, np.flatnonzero(boundaries)
+
+    def _take_sorted(self, column: np.ndarray) -> np.ndarray:
+        """
+        Gathers a column into key order.
+
+        :param column: The column to gather.
+        :return: The column in key order.
+        :rtype: numpy.ndarray
+        """
+        return column if self.order is None else column[self.order]
+
+    def _reduce(self, sorted_column: np.ndarray, aggregation: str, reduced: dict) -> np.ndarray:
+        """
+        Reduces a column in key order to one value per group.
+
+        Counts and sums are shared between aggregations of the same column through `reduced`.
+
+        :param sorted_column: The column in key order.
+        :param aggregation: The aggregation name.
+        :param reduced: Already computed counts and sums of this column.
+        :return: One value per group.
+        :rtype: numpy.ndarray
+        """
+        if aggregation in ("sum", "mean") and sorted_column.dtype.kind not in "biufc":
+            raise ValueError(f"Cannot compute the {aggregation} of a column of dtype {sorted_column.dtype}.")
+        if self.ngroups == 0:
+            dtypes = {"count": np.int64, "mean": np.float64}
+            return np.empty(0, dtype=dtypes.get(aggregation, sorted_column.dtype))
+
+        is_float = sorted_column.dtype.kind == "f"
+        if aggregation in ("count", "mean") and "count" not in reduced:
+            if is_float:
+                reduced["count"] = np.add.reduceat(~np.isnan(sorted_column), self.starts, dtype=np.int64)
+            else:
+                reduced["count"] = np.diff(np.append(self.starts, sorted_column.shape[0])).astype(np.int64)
+        if aggregation in ("sum", "mean") and "sum" not in reduced:
+            if is_float:
+                reduced["sum"] = np.add.reduceat(np.where(np.isnan(sorted_column), 0, sorted_column), self.starts)
+            else:
+                accumulator = np.uint64 if sorted_column.dtype.kind == "u" else np.int64
+                reduced["sum"] = np.add.reduceat(sorted_column, self.starts, dtype=accumulator)
+
+        if aggregation == "count":
+            return reduced["count"]
+        if aggregation == "sum":
+            return reduced["sum"]
+        if aggregation == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return reduced["sum"] / reduced["count"]
+        if sorted_column.dtype.kind in "SU":
+            return self._text_extreme(sorted_column, aggregation)
+        if aggregation == "min":
+            return np.fmin.reduceat(sorted_column, self.starts)
+        return np.fmax.reduceat(sorted_column, self.starts)
+
+    def _text_extreme(self, sorted_column: np.ndarray, aggregation: str) -> np.ndarray:
+        """
+        Finds the smallest or largest text value of every group.
+
+        NumPy has no ``fmin`` or ``fmax`` for strings, so the values are sorted within their groups with one
+        `numpy.lexsort` by (group, value), which leaves every group at the same positions, and the first or
+        last value of each group is taken.
+
+        :param sorted_column: The text column in key order.
+        :param aggregation: ``"min"`` or ``"max"``.
+        :return: One value per group.
+        :rtype: numpy.ndarray
+        """
+        stops = np.append(self.starts[1:], sorted_column.shape[0])
+        groups = np.repeat(np.arange(self.ngroups), stops - self.starts)
+        ordered = sorted_column[np.lexsort((sorted_column, groups))]
+        return ordered[self.starts] if aggregation == "min" else ordered[stops - 1]
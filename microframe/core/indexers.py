@@ -1,5 +1,7 @@
 import numpy as np
-from typing import TypeVar, Generic, Type, Union, Any, List
+from typing import TypeVar, Generic, Type, Union, Any, List, Optional
+from .indexes import RowIndex
+from .config import parallel_map, row_blocks
 
 
 class StructuredArrayIndexer:
@@ -28,6 +30,8 @@ class StructuredArrayIndexer:
             - Tuple with row and column index: `data[5, 3]`
             - Tuple with row index and column slice: `data[5, 1:4]`
             - Slice for multiple rows: `data[1:5]`
+            - Boolean mask or integer array for rows: `data[mask]`, `data[[0, 4, 2]]`
+            - List of column positions or boolean column mask: `data[:, [0, 2]]`
 
         :param idx: Either a single index to retrieve a row, or a tuple of row and column indices to retrieve an item.
         :type idx: int or tuple
@@ -41,13 +45,16 @@ class StructuredArrayIndexer:
             col_idx = None
         if col_idx is None:
             return self.values[row_idx]
-        column_name = self.columns[col_idx]
-        return self.values[row_idx][column_name]
+        column_name = self._resolve_columns(col_idx)
+        return self.values[column_name][row_idx]
 
     def __setitem__(self, idx: tuple, value: Any) -> None:
         """
         Set a value in the structured array at the specified index.
 
+        When several columns are selected, `value` is either broadcast to every column or, if it is a 2D array
+        with one column per selected column, assigned column by column.
+
         :param idx: A tuple of row and column indices to identify the location for assignment.
         :type idx: tuple
         :param value: The value to be set at the specified index.
@@ -59,8 +66,33 @@ class StructuredArrayIndexer:
         else:
             raise ValueError("Both row and column indices are required for assignment")
 
-        column_name = self.columns[col_idx]
-        self.values[row_idx][column_name] = value
+        column_name = self._resolve_columns(col_idx)
+        if isinstance(column_name, list):
+            per_column = np.ndim(value) == 2 and np.shape(value)[1] == len(column_name)
+            for position, name in enumerate(column_name):
+                self.values[name][row_idx] = np.asarray(value)[:, position] if per_column else value
+        else:
+            self.values[column_name][row_idx] = value
+
+    def _resolve_columns(self, col_idx: Any) -> Union[str, List[str]]:
+        """
+        Translate a column index into field names.
+
+        :param col_idx: A column position, a slice of positions, a list or array of positions, or a boolean mask.
+        :return: A single field name for a single position, otherwise a list of field names.
+        :rtype: str or list
+        :raises IndexError: If a position is out of bounds or a boolean mask has the wrong length.
+        """
+        if _is_integer(col_idx):
+            return str(self.columns[col_idx])
+        if isinstance(col_idx, slice):
+            return [str(name) for name in self.columns[col_idx]]
+        positions = np.asarray(col_idx)
+        if positions.dtype == bool and positions.shape != self.columns.shape:
+            raise IndexError(
+                f"Boolean column index has length {positions.size} but there are {self.columns.size} columns."
+            )
+        return [str(name) for name in self.columns[positions]]
 
 
 T = TypeVar('T')
@@ -83,34 +115,329 @@ class IlocIndexer(Generic[T], StructuredArrayIndexer):
     return_type : Type[T]
         The type of the object that will be returned by the indexer. Typically, this will
         be a `MicroFrame` or similar class that can be initialized from a structured array.
+    owner : T, optional
+        The frame being indexed. When given, results that are views of the owner's buffer are
+        registered with it, and assignments go through the owner's copy-on-write check first.
     """
 
-    def __init__(self, values: np.ndarray, columns: np.ndarray, return_type: Type[T]):
+    def __init__(self, values: np.ndarray, columns: np.ndarray, return_type: Type[T], owner: Optional[T] = None):
         """
         Initializes the indexer with structured array values, column names, and the return type.
         """
         super().__init__(values, columns)  # Initialize the base class
         self.return_type = return_type
+        self.owner = owner
 
     def __getitem__(self, idx: Union[int, tuple]) -> Type[T]:
         """
         Retrieve a subset of the data as the specified return type.
 
-        If a single row is retrieved, it's wrapped in a NumPy array to maintain
-        the structured array format. If a single column is retrieved, it's converted
-        into a structured array with the appropriate field name and dtype.
+        Rows and columns are selected without copying: a single row is taken as a one-row slice of the
+        structured array, and a single column is reinterpreted as a structured array with one named field
+        that shares memory with the original data. Indexing a single cell returns the cell value itself.
 
         :param idx: Index or indices to retrieve data.
         :type idx: int, tuple, or slice
-        :return: A subset of the data as the specified return type.
+        :return: A subset of the data as the specified return type, or a scalar for a single cell.
+        :rtype: T
+        """
+        if isinstance(idx, tuple):
+            row_idx, col_idx = idx
+        else:
+            row_idx = idx
+            col_idx = None
+
+        if _is_integer(row_idx) and _is_integer(col_idx):
+            return super().__getitem__(idx)
+
+        if _is_integer(row_idx):
+            row_idx = self._row_position_to_slice(row_idx)
+        column_name = None if col_idx is None else self._resolve_columns(col_idx)
+
+        if isinstance(row_idx, slice):
+            subset = self.values[row_idx]
+            if isinstance(column_name, str):
+                column = subset[column_name]
+                subset = column.view(np.dtype([(column_name, column.dtype)]))
+            elif column_name is not None:
+                subset = subset[column_name]
+        else:
+            subset = self._gather(self._row_positions(row_idx), column_name)
+        result = self.return_type.from_structured_array(subset)
+        if self.owner is not None:
+            self.owner._finalize_subset(result)
+        return result
+
+    def __setitem__(self, idx: tuple, value: Any) -> None:
+        """
+        Set a value in the structured array at the specified index.
+
+        If the indexer belongs to a frame whose buffer is shared with other frames, the frame
+        first takes a private copy of its buffer, so the assignment is only visible through it.
+
+        :param idx: A tuple of row and column indices to identify the location for assignment.
+        :type idx: tuple
+        :param value: The value to be set at the specified index.
+        :type value: compatible with the column data type
+        :raises ValueError: If only a single index is provided instead of a tuple.
+        """
+        if self.owner is not None:
+            column_name = self._resolve_columns(idx[1]) if isinstance(idx, tuple) else None
+            self.owner._prepare_for_write([column_name] if isinstance(column_name, str) else column_name)
+            self.values = self.owner.values
+        super().__setitem__(idx, value)
+
+    def _row_positions(self, row_idx: Any) -> np.ndarray:
+        """
+        Convert a boolean mask or a sequence of row positions into an integer position array.
+
+        :param row_idx: A boolean mask with one entry per row, or integer row positions.
+        :return: The selected row positions.
+        :rtype: numpy.ndarray
+        :raises IndexError: If a boolean mask does not have one entry per row.
+        """
+        positions = np.asarray(row_idx)
+        if positions.dtype == bool:
+            if positions.shape != self.values.shape:
+                raise IndexError(
+                    f"Boolean row index has length {positions.size} but there are {self.values.shape[0]} rows."
+                )
+            return np.flatnonzero(positions)
+        if positions.size == 0:
+            return positions.astype(np.intp)
+        return positions
+
+    def _gather(self, positions: np.ndarray, column_name: Union[None, str, List[str]]) -> np.ndarray:
+        """
+        Copy the selected rows of the selected columns into a new, densely packed structured array.
+
+        Each selected field is gathered directly into its place in the result, so unselected columns are
+        never read or copied. Positions are bounds checked once up front, so whole rows can be taken with
+        `numpy.take` in clip mode, which writes into the result without buffering. With several threads
+        configured, blocks of rows are gathered in parallel.
+
+        :param positions: The integer row positions to gather.
+        :param column_name: None for all columns, a single field name, or a list of field names.
+        :return: The gathered structured array.
+        :rtype: numpy.ndarray
+        :raises IndexError: If a position is out of bounds.
+        """
+        num_rows = self.values.shape[0]
+        if positions.size > 0:
+            lowest, highest = positions.min(), positions.max()
+            if lowest < -num_rows or highest >= num_rows:
+                raise IndexError(f"Row position out of bounds for {num_rows} rows.")
+            if lowest < 0:
+                positions = np.where(positions < 0, positions + num_rows, positions)
+
+        if column_name is None:
+            result = np.empty(positions.shape[0], dtype=self.values.dtype)
+            names = None
+        else:
+            names = [column_name] if isinstance(column_name, str) else column_name
+            fields = self.values.dtype.fields
+            result = np.empty(positions.shape[0], dtype=[(name, fields[name][0]) for name in names])
+
+        def gather_block(block):
+            start, stop = block
+            if names is None:
+                np.take(self.values, positions[start:stop], out=result[start:stop], mode="clip")
+                return
+            for name in names:
+                result[name][start:stop] = self.values[name][positions[start:stop]]
+
+        parallel_map(gather_block, row_blocks(positions.shape[0]))
+        return result
+
+    def _row_position_to_slice(self, position: int) -> slice:
+        """
+        Convert a single row position into a one-row slice so the row is selected as a view.
+
+        :param position: The row position, negative positions count from the end.
+        :type position: int
+        :return: A slice selecting exactly that row.
+        :rtype: slice
+        :raises IndexError: If the position is out of bounds.
+        """
+        num_rows = self.values.shape[0]
+        if not -num_rows <= position < num_rows:
+            raise IndexError(f"Row index {position} is out of bounds for {num_rows} rows.")
+        if position < 0:
+            position += num_rows
+        return slice(position, position + 1)
+
+
+class LocIndexer(Generic[T], StructuredArrayIndexer):
+    """
+    Provides label based indexing for selection by row label and column name.
+
+    Labels are translated to positions and the selection is then carried out by an `IlocIndexer`,
+    so results have the same view and copy-on-write behaviour as `.iloc`. Column names are looked
+    up in a dictionary from name to position, which keeps selection on wide frames constant time
+    per name. Without a row index, row labels are the row positions, and label slices include
+    their stop label, like `.loc` in pandas.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The numpy structured array to be indexed.
+    columns : numpy.ndarray
+        Column names corresponding to the data in the structured array.
+    return_type : Type[T]
+        The type of the object that will be returned by the indexer.
+    owner : T, optional
+        The frame being indexed, forwarded to the underlying `IlocIndexer`.
+    column_positions : dict, optional
+        A mapping from column name to position. If None, it is built from `columns`.
+    row_index : RowIndex, optional
+        The row index translating row labels to positions. If None, row labels are row positions.
+    """
+
+    def __init__(
+            self,
+            values: np.ndarray,
+            columns: np.ndarray,
+            return_type: Type[T],
+            owner: Optional[T] = None,
+            column_positions: Optional[dict] = None,
+            row_index: Optional[RowIndex] = None,
+    ):
+        """
+        Initializes the indexer with structured array values, column names, and the return type.
+        """
+        super().__init__(values, columns)
+        self.iloc_indexer = IlocIndexer(values, columns, return_type, owner=owner)
+        if column_positions is None:
+            column_positions = {name: position for position, name in enumerate(columns.tolist())}
+        self.column_positions = column_positions
+        self.row_index = row_index
+
+    def __getitem__(self, idx: Any) -> Type[T]:
+        """
+        Retrieve a subset of the data by labels.
+
+        The idx parameter supports:
+            - A row label, a label slice, a list of labels or a boolean mask: `mframe.loc[2:5]`
+            - A tuple of row and column labels: `mframe.loc[:, "price"]`, `mframe.loc[:, ["price", "qty"]]`
+
+        :param idx: Row labels, or a tuple of row labels and column names.
+        :return: A subset of the data as the specified return type, or a scalar for a single cell.
         :rtype: T
+        :raises KeyError: If a row label or column name does not exist.
+        """
+        return self.iloc_indexer[self._to_positions(idx)]
+
+    def __setitem__(self, idx: tuple, value: Any) -> None:
+        """
+        Set values at the specified row labels and column names.
+
+        :param idx: A tuple of row labels and column names.
+        :param value: The value to be set.
+        :raises ValueError: If only a single index is provided instead of a tuple.
+        :raises KeyError: If a row label or column name does not exist.
+        """
+        if not isinstance(idx, tuple):
+            raise ValueError("Both row and column indices are required for assignment")
+        self.iloc_indexer[self._to_positions(idx)] = value
+
+    def _to_positions(self, idx: Any) -> Any:
+        """
+        Translate a label based index into the equivalent positional index.
+
+        :param idx: Row labels, or a tuple of row labels and column names.
+        :return: The positional index for `IlocIndexer`.
         """
-        subset = super().__getitem__(idx)
-        if isinstance(subset, np.void):  # Single row
-            subset = np.array([subset], dtype=subset.dtype)
-        elif isinstance(subset, np.ndarray) and subset.ndim == 1:  # Single column
-            if isinstance(idx, tuple) and isinstance(idx[1], (int, np.integer)):
-                # Create a structured array with a single named field
-                dtype = [(self.columns[idx[1]], subset.dtype)]
-                subset = np.array([tuple([val]) for val in subset], dtype=dtype)
-        return self.return_type.from_structured_array(subset)
+        if isinstance(idx, tuple):
+            row_key, col_key = idx
+            return self._row_positions_for(row_key), self._column_positions_for(col_key)
+        return self._row_positions_for(idx)
+
+    def _row_positions_for(self, row_key: Any) -> Any:
+        """
+        Translate row labels into row positions.
+
+        :param row_key: A row label, a label slice, a list of labels, or a boolean mask.
+        :return: The matching row position, slice, or position array.
+        :raises KeyError: If a row label does not exist.
+        """
+        if self.row_index is not None:
+            return self._indexed_row_positions_for(row_key)
+        num_rows = self.values.shape[0]
+        if isinstance(row_key, slice):
+            stop = row_key.stop
+            if stop is not None and (row_key.step or 1) < 0:
+                stop = stop - 1 if stop > 0 else None
+            elif stop is not None:
+                stop = stop + 1
+            return slice(row_key.start, stop, row_key.step)
+        labels = np.asarray(row_key)
+        if labels.dtype == bool:
+            return row_key
+        if labels.size == 0:
+            return labels.astype(np.intp)
+        if labels.dtype.kind not in "iu" or np.any((labels < 0) | (labels >= num_rows)):
+            raise KeyError(f"Row label {row_key!r} does not exist.")
+        return row_key if labels.ndim == 0 else labels
+
+    def _indexed_row_positions_for(self, row_key: Any) -> Any:
+        """
+        Translate row labels into row positions through the row index.
+
+        :param row_key: A row label, a label slice, a list of labels, or a boolean mask.
+        :return: The matching row positions or slice.
+        :raises KeyError: If a row label does not exist.
+        :raises ValueError: If a label slice has a step.
+        """
+        if isinstance(row_key, slice):
+            if row_key.step is not None:
+                raise ValueError("Label slices on an indexed frame do not support a step.")
+            return self.row_index.slice_locs(row_key.start, row_key.stop)
+        labels = np.asarray(row_key)
+        if labels.dtype == bool:
+            return row_key
+        if labels.ndim == 0:
+            return self.row_index.get_locs(row_key)
+        return self.row_index.get_indexer(labels)
+
+    def _column_positions_for(self, col_key: Any) -> Any:
+        """
+        Translate column names into column positions.
+
+        :param col_key: A column name, a slice of names, a list of names, or a boolean mask.
+        :return: The matching column position, slice, or position list.
+        :raises KeyError: If a column name does not exist.
+        """
+        if isinstance(col_key, str):
+            return self._column_position(col_key)
+        if isinstance(col_key, slice):
+            start = None if col_key.start is None else self._column_position(col_key.start)
+            stop = None if col_key.stop is None else self._column_position(col_key.stop) + 1
+            return slice(start, stop, col_key.step)
+        names = np.asarray(col_key)
+        if names.dtype == bool:
+            return col_key
+        return [self._column_position(name) for name in names.tolist()]
+
+    def _column_position(self, name: str) -> int:
+        """
+        Look up the position of a single column name.
+
+        :param name: The column name.
+        :return: The column position.
+        :raises KeyError: If the column does not exist.
+        """
+        try:
+            return self.column_positions[name]
+        except KeyError:
+            raise KeyError(f"Column '{name}' does not exist.") from None
+
+
+def _is_integer(value: Any) -> bool:
+    """
+    Check whether an index is a single integer position.
+
+    :param value: The index to check.
+    :return: True for Python and NumPy integers, False otherwise (booleans included).
+    :rtype: bool
+    """
+    return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
@@ -0,0 +1,382 @@
+import numpy as np
+from typing import Any, Optional, Union
+from .text import encode_text
+
+
+class RowIndex:
+    """
+    Row labels taken from one column of a MicroFrame.
+
+    Lookups compare the requested labels against every key, which costs a full pass over the column.
+    `SortedIndex` answers the same questions with binary searches.
+
+    :param keys: The key column, one label per row.
+    :type keys: numpy.ndarray
+    """
+
+    def __init__(self, keys: np.ndarray):
+        """
+        Initializes the RowIndex with the key column.
+        """
+        self.keys = keys
+
+    def __len__(self) -> int:
+        """
+        Returns the number of labelled rows.
+
+        :return: The number of rows.
+        :rtype: int
+        """
+        return self.keys.shape[0]
+
+    def get_locs(self, key: Any) -> Union[slice, np.ndarray]:
+        """
+        Finds the rows labelled `key`.
+
+        :param key: The label to look up.
+        :return: The matching row positions.
+        :rtype: slice or numpy.ndarray
+        :raises KeyError: If no row has the label.
+        """
+        positions = np.flatnonzero(self.keys == self._coerce(key))
+        if positions.size == 0:
+            raise KeyError(f"Row label {key!r} does not exist.")
+        return positions
+
+    def get_indexer(self, keys: Any) -> np.ndarray:
+        """
+        Finds the rows for several labels at once.
+
+        Positions are returned label by label, in the order of `keys`.
+
+        :param keys: The labels to look up.
+        :return: The concatenated row positions of every label.
+        :rtype: numpy.ndarray
+        :raises KeyError: If a label does not exist.
+        """
+        positions = [np.asarray(self.get_locs(key)) for key in np.asarray(keys).tolist()]
+        if not positions:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(positions)
+
+    def slice_locs(self, start: Any = None, stop: Any = None) -> Union[slice, np.ndarray]:
+        """
+        Finds the rows whose label lies between `start` and `stop`, both included.
+
+        :param start: The lowest label to include, or None for no lower bound.
+        :param stop: The highest label to include, or None for no upper bound.
+        :return: The matching row positions, in row order.
+        :rtype: slice or numpy.ndarray
+        """
+        mask = np.ones(self.keys.shape[0], dtype=bool)
+        if start is not None:
+            mask &= self.keys >= self._coerce(start)
+        if stop is not None:
+            mask &= self.keys <= self._coerce(stop)
+        return np.flatnonzero(mask)
+
+    def _coerce(self, key: Any) -> Any:
+        """
+        Converts a label to the dtype of the keys where that cannot change its meaning.
+
+        Floats, dates and durations are cast so that, for example, a Python float matches the
+        `float32` value it was stored as. Strings and integers are compared as given, because
+        casting them could truncate the label. Strings looked up in byte string keys are encoded.
+
+        :param key: The label to convert.
+        :return: The converted label.
+        """
+        if self.keys.dtype.kind in "fmM":
+            return np.asarray(key, dtype=self.keys.dtype)
+        if self.keys.dtype.kind == "S":
+            return encode_text(key)
+        return key
+
+
+class SortedIndex(RowIndex):
+    """
+    Row labels kept in sorted order for binary-search lookups.
+
+    The index stores a stable sort permutation of the key column, or nothing at all if the column is
+    already in ascending order, and answers point and range lookups with `numpy.searchsorted`. Both
+    cost O(log n) plus the size of the result. On an already sorted column, lookups return slices,
+    so the selected rows can be taken as views.
+
+    :param keys: The key column, one label per row.
+    :type keys: numpy.ndarray
+    :param permutation: A precomputed stable ascending sort permutation of `keys`. If None, it is
+        computed unless the keys are already sorted.
+    :type permutation: numpy.ndarray, optional
+    """
+
+    def __init__(self, keys: np.ndarray, permutation: Optional[np.ndarray] = None):
+        """
+        Initializes the SortedIndex, sorting the keys if they are not in ascending order.
+        """
+        super().__init__(keys)
+        if permutation is None and not _is_monotonic(keys):
+            permutation = np.argsort(keys, kind="stable")
+        self.permutation = permutation
+        self.sorted_keys = keys if permutation is None else keys[permutation]
+
+    def get_locs(self, key: Any) -> Union[slice, np.ndarray]:
+        """
+        Finds the rows labelled `key` with two binary searches.
+
+        :param key: The label to look up.
+        :return: A slice on an already sorted column, otherwise the row positions.
+        :rtype: slice or numpy.ndarray
+        :raises KeyError: If no row has the label.
+        """
+        key = self._coerce(key)
+        start = np.searchsorted(self.sorted_keys, key, side="left")
+        stop = np.searchsorted(self.sorted_keys, key, side="right")
+        if start == stop:
+            raise KeyError(f"Row label {key!r} does not exist.")
+        return self._positions(int(start), int(stop))
+
+    def get_indexer(self, keys: Any) -> np.ndarray:
+        """
+        Finds the rows for several labels at once with one vectorized pair of binary searches.
+
+        :param keys: The labels to look up.
+        :return: The concatenated row positions of every label, in the order of `keys`.
+        :rtype: numpy.ndarray
+        :raises KeyError: If a label does not exist.
+        """
+        keys = np.atleast_1d(self._coerce(np.asarray(keys)))
+        starts = np.searchsorted(self.sorted_keys, keys, side="left")
+        stops = np.searchsorted(self.sorted_keys, keys, side="right")
+        missing = starts == stops
+        if missing.any():
+            raise KeyError(f"Row labels {keys[missing].tolist()!r} do not exist.")
+        positions = expand_ranges(starts, stops)
+        return positions if self.permutation is None else self.permutation[positions]
+
+    def slice_locs(self, start: Any = None, stop: Any = None) -> Union[slice, np.ndarray]:
+        """
+        Finds the rows whose label lies between `start` and `stop`, both included.
+
+        :param start: The lowest label to include, or None for no lower bound.
+        :param stop: The highest label to include, or None for no upper bound.
+        :return: A slice on an already sorted column, otherwise the row positions in label order.
+        :rtype: slice or numpy.ndarray
+        """
+        lower = 0 if start is None else int(np.searchsorted(self.sorted_keys, self._coerce(start), side="left"))
+        upper = len(self) if stop is None else int(np.searchsorted(self.sorted_keys, self._coerce(stop), side="right"))
+        return self._positions(lower, max(lower, upper))
+
+    def _positions(self, start: int, stop: int) -> Union[slice, np.ndarray]:
+        """
+        Maps a range of sorted positions back to row positions.
+
+        :param start: The first sorted position.
+        :param stop: The sorted position after the last one.
+        :return: A slice when no permutation is needed, otherwise the permuted row positions.
+        :rtype: slice or numpy.ndarray
+        """
+        if self.permutation is None:
+            return slice(start, stop)
+        return self.permutation[start:stop]
+
+
+class HashIndex(RowIndex):
+    """
+    Row labels hashed for constant-time equality lookups.
+
+    The index groups the row positions of equal keys with one stable sort when it is built, then keeps a
+    dictionary from each distinct key to its group. Looking up a key costs one dictionary access no matter
+    how many rows the frame has, and duplicate keys map to all of their rows, in row order.
+
+    :param keys: The key column, one label per row.
+    :type keys: numpy.ndarray
+    """
+
+    def __init__(self, keys: np.ndarray):
+        """
+        Initializes the HashIndex, grouping the row positions of equal keys.
+        """
+        super().__init__(keys)
+        self.permutation = np.argsort(keys, kind="stable")
+        self.buckets = {}
+        self.distinct_keys = keys[:0]
+        self.bucket_starts = self.bucket_stops = np.empty(0, dtype=np.intp)
+        self._slots = None
+        self._slots_built = False
+        if keys.shape[0] == 0:
+            return
+        sorted_keys = keys[self.permutation]
+        boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+        self.bucket_starts = np.concatenate(([0], boundaries))
+        self.bucket_stops = np.concatenate((boundaries, [keys.shape[0]]))
+        self.distinct_keys = sorted_keys[self.bucket_starts]
+        self.buckets = dict(
+            zip(self.distinct_keys.tolist(), zip(self.bucket_starts.tolist(), self.bucket_stops.tolist()))
+        )
+
+    def get_locs(self, key: Any) -> np.ndarray:
+        """
+        Finds the rows labelled `key` with one dictionary access.
+
+        :param key: The label to look up.
+        :return: The matching row positions.
+        :rtype: numpy.ndarray
+        :raises KeyError: If no row has the label.
+        """
+        bucket = self.buckets.get(self._hash_key(key))
+        if bucket is None:
+            raise KeyError(f"Row label {key!r} does not exist.")
+        return self.permutation[bucket[0]:bucket[1]]
+
+    def get_indexer(self, keys: Any) -> np.ndarray:
+        """
+        Finds the rows for several labels at once.
+
+        :param keys: The labels to look up.
+        :return: The concatenated row positions of every label, in the order of `keys`.
+        :rtype: numpy.ndarray
+        :raises KeyError: If a label does not exist.
+        """
+        return self.lookup_positions(keys, skip_missing=False)
+
+    def lookup_positions(self, keys: Any, skip_missing: bool = True) -> np.ndarray:
+        """
+        Finds the rows for a batch of labels, optionally ignoring labels that do not exist.
+
+        :param keys: The labels to look up.
+        :param skip_missing: Whether labels without rows are ignored instead of raising.
+        :return: The concatenated row positions of every label found, in the order of `keys`.
+        :rtype: numpy.ndarray
+        :raises KeyError: If a label does not exist and `skip_missing` is False.
+        """
+        buckets = []
+        for key in np.atleast_1d(np.asarray(keys)).tolist():
+            bucket = self.buckets.get(self._hash_key(key))
+            if bucket is not None:
+                buckets.append(bucket)
+            elif not skip_missing:
+                raise KeyError(f"Row label {key!r} does not exist.")
+        if not buckets:
+            return np.empty(0, dtype=np.intp)
+        starts, stops = np.array(buckets, dtype=np.intp).T
+        return self.permutation[expand_ranges(starts, stops)]
+
+    def probe(self, keys: Any) -> tuple:
+        """
+        Finds the bucket of every label in a large batch, for joins.
+
+        Looking up millions of labels one dictionary access at a time is dominated by Python overhead,
+        so batches are matched in one vectorized pass instead: integer keys within a dense range address a
+        table of buckets directly, and other keys use a binary search over the distinct keys. Labels
+        without rows get an empty range, so the result always has one entry per label.
+
+        :param keys: The labels to look up.
+        :return: The start and stop positions into `permutation` of every label's rows.
+        :rtype: tuple
+        """
+        keys = np.atleast_1d(self._coerce(np.asarray(keys)))
+        slots = self._slot_table() if keys.dtype.kind in "iu" else None
+        if slots is not None:
+            low = self.distinct_keys[0]
+            in_range = (keys >= low) & (keys <= self.distinct_keys[-1])
+            buckets = np.full(keys.shape[0], -1, dtype=np.intp)
+            buckets[in_range] = slots[_offsets(keys[in_range], low)]
+            found = buckets >= 0
+        else:
+            buckets = np.searchsorted(self.distinct_keys, keys)
+            found = buckets < self.distinct_keys.shape[0]
+            found[found] = self.distinct_keys[buckets[found]] == keys[found]
+        starts = np.zeros(keys.shape[0], dtype=np.intp)
+        stops = np.zeros(keys.shape[0], dtype=np.intp)
+        starts[found] = self.bucket_starts[buckets[found]]
+        stops[found] = self.bucket_stops[buckets[found]]
+        return starts, stops
+
+    def _slot_table(self) -> Optional[np.ndarray]:
+        """
+        Returns a table mapping ``key - min_key`` to bucket numbers, -1 for absent keys.
+
+        The table is built on first use and only for integer keys whose range is at most a few times the
+        number of distinct keys, so it stays about as small as the index itself.
+
+        :return: The table, or None if the keys are not dense integers.
+        :rtype: numpy.ndarray or None
+        """
+        if not self._slots_built:
+            self._slots_built = True
+            distinct = self.distinct_keys
+            if distinct.dtype.kind in "iu" and distinct.shape[0] > 0:
+                span = int(distinct[-1]) - int(distinct[0]) + 1
+                if span <= 4 * distinct.shape[0] + 1024:
+                    self._slots = np.full(span, -1, dtype=np.intp)
+                    self._slots[_offsets(distinct, distinct[0])] = np.arange(distinct.shape[0])
+        return self._slots
+
+    def slice_locs(self, start: Any = None, stop: Any = None) -> np.ndarray:
+        """
+        Finds the rows whose label lies between `start` and `stop`, both included.
+
+        Hashing gives no order, so range lookups scan the keys like `RowIndex`.
+
+        :param start: The lowest label to include, or None for no lower bound.
+        :param stop: The highest label to include, or None for no upper bound.
+        :return: The matching row positions, in row order.
+        :rtype: numpy.ndarray
+        """
+        return super().slice_locs(start, stop)
+
+    def _hash_key(self, key: Any) -> Any:
+        """
+        Converts a label to the Python value the buckets are keyed by.
+
+        :param key: The label to convert.
+        :return: A hashable value equal to the stored key it should match.
+        """
+        if self.keys.dtype.kind in "fmM":
+            return np.asarray(key, dtype=self.keys.dtype).item()
+        if self.keys.dtype.kind == "S":
+            return encode_text(key)
+        return key
+
+
+def expand_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """
+    Concatenates the integer ranges `[starts[i], stops[i])` without a Python loop.
+
+    :param starts: The first value of every range.
+    :param stops: The value after the last one of every range.
+    :return: All values of all ranges, range by range.
+    :rtype: numpy.ndarray
+    """
+    counts = stops - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.intp)
+    range_offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - range_offsets, counts) + np.arange(total)
+
+
+def _offsets(keys: np.ndarray, low: Any) -> np.ndarray:
+    """
+    Computes the distance of integer keys from the lowest key as table positions.
+
+    The subtraction is done in 64 bits, because in the dtype of narrow keys such as `int8` the distance
+    between two keys can overflow. The keys must lie in a range no larger than the table.
+
+    :param keys: The integer keys, none lower than `low`.
+    :param low: The lowest key.
+    :return: The position of every key in the table.
+    :rtype: numpy.ndarray
+    """
+    return (keys.astype(np.int64) - np.asarray(low).astype(np.int64)).astype(np.intp)
+
+
+def _is_monotonic(keys: np.ndarray) -> bool:
+    """
+    Checks whether the keys are in ascending order.
+
+    :param keys: The keys to check.
+    :return: True if every key is greater than or equal to the previous one.
+    :rtype: bool
+    """
+    return bool(np.all(keys[1:] >= keys[:-1]))
@@ -0,0 +1,91 @@
+import numpy as np
+from typing import Optional
+
+
+class ColumnBuffer:
+    """
+    A read-only, zero-copy export of the rows of one column, or of all columns, of a MicroFrame.
+
+    The buffer exposes the NumPy array interface, so ``numpy.asarray(buffer)`` and any library that reads
+    ``__array_interface__`` get a read-only view of the MicroFrame data without a copy. `as_memoryview` returns
+    a Python memoryview over the same memory. A column of a structured array is strided: consumers must honour the
+    ``strides`` of the interface.
+
+    The exported data never changes. While a buffer, or an array made from it, is alive, the MicroFrame
+    treats it like a view and moves its own data to a private copy before the next in-place write, exactly
+    as it does for `iloc` views.
+
+    :param values: The array to export.
+    :type values: numpy.ndarray
+
+    Example:
+        >>> buffer = mframe.column_buffer('price')
+        >>> prices = np.asarray(buffer)
+        >>> raw = buffer.as_memoryview()
+    """
+
+    def __init__(self, values: np.ndarray):
+        """
+        Initializes the ColumnBuffer over an array.
+        """
+        self._values = values
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in the buffer.
+
+        :return: The number of rows.
+        :rtype: int
+        """
+        return self._values.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Returns the dtype of the exported values.
+
+        :return: The dtype.
+        :rtype: numpy.dtype
+        """
+        return self._values.dtype
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        Describes the exported memory: its address, shape, strides and type, marked read-only.
+
+        :return: The NumPy array interface dictionary, version 3.
+        :rtype: dict
+        """
+        interface = dict(self._values.__array_interface__)
+        interface["data"] = (interface["data"][0], True)
+        if interface.get("strides") is None:
+            interface["strides"] = self._values.strides
+        return interface
+
+    def __array__(self, dtype=None, copy: Optional[bool] = None) -> np.ndarray:
+        """
+        Returns the exported values as a NumPy array, following the NumPy 2 `copy` semantics.
+
+        :param dtype: The dtype of the result. A different dtype requires a copy.
+        :param copy: True to always copy, False to never copy, None to copy only if needed.
+        :return: A read-only view, or a writeable copy.
+        :rtype: numpy.ndarray
+        :raises ValueError: If `copy` is False but a copy is needed for `dtype`.
+        """
+        view = np.asarray(self)
+        if copy or (dtype is not None and np.dtype(dtype) != view.dtype):
+            if copy is False:
+                raise ValueError(f"Cannot export values of dtype {view.dtype} as {dtype} without a copy.")
+            return view.astype(view.dtype if dtype is None else dtype)
+        return view
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a read-only Python memoryview of the exported values, without a copy.
+
+        :return: The memoryview, following the PEP 3118 buffer protocol.
+        :rtype: memoryview
+        :raises ValueError: If NumPy cannot export the dtype through the buffer protocol, as for dates.
+        """
+        return memoryview(np.asarray(self))
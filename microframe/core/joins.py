@@ -0,0 +1,203 @@
+import numpy as np
+
+from .indexes import expand_ranges, _is_monotonic
+from .text import as_text_kind
+
+JOIN_TYPES = ("inner", "left", "outer")
+
+
+def join(left, right, on: str, how: str = "inner", suffix: str = "_right"):
+    """
+    Joins two MicroFrames on the equality of one key column.
+
+    If the key columns of both frames are already in ascending order, the rows are matched with a
+    sort-merge join: two vectorized binary searches of the left keys in the right keys. Otherwise a hash
+    join builds a `HashIndex` on the smaller frame, reusing one made with `create_hash_index`, and probes
+    it with the keys of the other frame. Either way the matches become two arrays of row positions, and
+    every output column is assembled with one gather into a single new structured array.
+
+    Rows come out in left row order, duplicate matches in right row order. For left and outer joins,
+    columns of rows without a match are filled with NaN (integer and boolean columns become float64),
+    NaT for dates and durations, and empty strings for text. Outer joins add the unmatched right rows at
+    the end and take their key from the right frame; the key column keeps a dtype that holds the keys of
+    both frames. NaN keys never match.
+
+    :param left: The left frame.
+    :type left: MicroFrame
+    :param right: The right frame.
+    :type right: MicroFrame
+    :param on: The name of the key column, present in both frames.
+    :type on: str
+    :param how: ``"inner"``, ``"left"`` or ``"outer"``.
+    :type how: str
+    :param suffix: Appended to right column names that are also left column names.
+    :type suffix: str
+    :return: A new MicroFrame with the left columns followed by the right columns except the key.
+    :rtype: MicroFrame
+    :raises KeyError: If a frame has no column `on`.
+    :raises ValueError: If `how` is not a supported join type.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"Unsupported join type '{how}'. Use one of {', '.join(JOIN_TYPES)}.")
+    for frame in (left, right):
+        if on not in frame.values.dtype.fields:
+            raise KeyError(f"Column '{on}' does not exist.")
+
+    left_rows, right_rows = _match_rows(left, right, on)
+    left_rows, right_rows = _add_unmatched_rows(left_rows, right_rows, left.values.shape[0], right.values.shape[0], how)
+
+    columns = {}
+    for name in left.values.dtype.names:
+        if name == on and how == "outer":
+            columns[name] = _coalesce_keys(left.values[on], right.values[on], left_rows, right_rows)
+        else:
+            columns[name] = _gather(left.values[name], left_rows)
+    for name in right.values.dtype.names:
+        if name == on:
+            continue
+        output_name = name + suffix if name in columns else name
+        columns[output_name] = _gather(right.values[name], right_rows)
+
+    values = np.empty(left_rows.shape[0], dtype=[(name, column.dtype) for name, column in columns.items()])
+    for name, column in columns.items():
+        values[name] = column
+    return type(left).from_structured_array(values)
+
+
+def _match_rows(left, right, on: str) -> tuple:
+    """
+    Finds all pairs of left and right rows with equal keys.
+
+    Byte string keys match unicode keys with the same text: the keys probing the other frame are converted
+    to its text kind first.
+
+    :param left: The left frame.
+    :param right: The right frame.
+    :param on: The key column.
+    :return: The left and right row positions of every match, in left row order.
+    :rtype: tuple
+    """
+    left_keys, right_keys = left.values[on], right.values[on]
+    if _is_monotonic(left_keys) and _is_monotonic(right_keys):
+        left_keys = as_text_kind(left_keys, right_keys.dtype.kind)
+        starts = np.searchsorted(right_keys, left_keys, side="left")
+        stops = np.searchsorted(right_keys, left_keys, side="right")
+        if left_keys.dtype.kind == "f":
+            stops[np.isnan(left_keys)] = starts[np.isnan(left_keys)]
+        return _expand_matches(starts, stops, None)
+
+    if right_keys.shape[0] <= left_keys.shape[0]:
+        index = right._hash_index(on)
+        return _expand_matches(*index.probe(as_text_kind(left_keys, right_keys.dtype.kind)), index.permutation)
+
+    index = left._hash_index(on)
+    right_rows, left_rows = _expand_matches(
+        *index.probe(as_text_kind(right_keys, left_keys.dtype.kind)), index.permutation
+    )
+    order = np.argsort(left_rows, kind="stable")
+    return left_rows[order], right_rows[order]
+
+
+def _expand_matches(starts: np.ndarray, stops: np.ndarray, permutation) -> tuple:
+    """
+    Turns the matching range of every probe row into pairs of row positions.
+
+    :param starts: The first matching build position of every probe row.
+    :param stops: The build position after the last match of every probe row.
+    :param permutation: Maps build positions to build rows, or None if they are the same.
+    :return: The probe and build row positions of every match.
+    :rtype: tuple
+    """
+    probe_rows = np.repeat(np.arange(starts.shape[0]), stops - starts)
+    build_rows = expand_ranges(starts, stops)
+    if permutation is not None:
+        build_rows = permutation[build_rows]
+    return probe_rows, build_rows
+
+
+def _add_unmatched_rows(
+    left_rows: np.ndarray, right_rows: np.ndarray, num_left: int, num_right: int, how: str
+) -> tuple:
+    """
+    Adds the rows that a left or outer join keeps without a match, marked by position -1 on the other side.
+
+    :param left_rows: The left row positions of the matches.
+    :param right_rows: The right row positions of the matches.
+    :param num_left: The number of left rows.
+    :param num_right: The number of right rows.
+    :param how: The join type.
+    :return: The left and right row positions of every output row.
+    :rtype: tuple
+    """
+    if how == "inner":
+        return left_rows, right_rows
+    unmatched = np.ones(num_left, dtype=bool)
+    unmatched[left_rows] = False
+    if unmatched.any():
+        left_rows = np.concatenate((left_rows, np.flatnonzero(unmatched)))
+        right_rows = np.concatenate((right_rows, np.full(int(unmatched.sum()), -1)))
+        order = np.argsort(left_rows, kind="stable")
+        left_rows, right_rows = left_rows[order], right_rows[order]
+    if how == "outer":
+        unmatched = np.ones(num_right, dtype=bool)
+        unmatched[right_rows[right_rows >= 0]] = False
+        left_rows = np.concatenate((left_rows, np.full(int(unmatched.sum()), -1)))
+        right_rows = np.concatenate((right_rows, np.flatnonzero(unmatched)))
+    return left_rows, right_rows
+
+
+def _coalesce_keys(left_keys: np.ndarray, right_keys: np.ndarray, left_rows: np.ndarray, right_rows: np.ndarray):
+    """
+    Builds the key column of an outer join, taking each key from the side that has the row.
+
+    Every output row has a key on at least one side, so the column never needs a missing value. Its dtype
+    holds the keys of both sides, for example the wider of two text widths.
+
+    :param left_keys: The left key column.
+    :param right_keys: The right key column.
+    :param left_rows: The left row of every output row, -1 for right-only rows.
+    :param right_rows: The right row of every output row.
+    :return: The key column.
+    :rtype: numpy.ndarray
+    """
+    keys = np.empty(left_rows.shape[0], dtype=np.result_type(left_keys.dtype, right_keys.dtype))
+    from_left = left_rows >= 0
+    keys[from_left] = left_keys[left_rows[from_left]]
+    keys[~from_left] = right_keys[right_rows[~from_left]]
+    return keys
+
+
+def _gather(column: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """
+    Takes the values at `positions` from a column, filling position -1 with a missing value.
+
+    :param column: The column to gather from.
+    :param positions: The row positions, -1 for missing rows.
+    :return: The gathered column.
+    :rtype: numpy.ndarray
+    """
+    missing = positions < 0
+    if not missing.any():
+        return column[positions]
+    dtype = column.dtype
+    if dtype.kind in "iub":
+        dtype = np.dtype(np.float64)
+    result = np.empty(positions.shape[0], dtype=dtype)
+    if column.shape[0] > 0:
+        result[:] = column[np.where(missing, 0, positions)]
+    result[missing] = _missing_value(dtype)
+    return result
+
+
+def _missing_value(dtype: np.dtype):
+    """
+    Returns the value that marks a missing entry in a column of the given dtype.
+
+    :param dtype: The column dtype.
+    :return: NaN, NaT or an empty string.
+    """
+    if dtype.kind in "mM":
+        return np.array("NaT", dtype=dtype)
+    if dtype.kind in "US":
+        return ""
+    return np.nan
@@ -0,0 +1,457 @@
+import ast
+from collections import namedtuple
+from typing import Any, Callable, List, Optional
+
+from .expressions import compile_expression
+from .groupby import GroupBy
+
+PlanStep = namedtuple("PlanStep", ["kind", "argument"])
+PlanStep.__doc__ = """
+One recorded operation of a lazy query plan.
+
+:ivar kind: One of ``"select"``, ``"filter"``, ``"rename"``, ``"cast"`` or ``"aggregate"``.
+:ivar argument: The column list, expression, mapping or aggregation of the step.
+"""
+
+
+class Scan:
+    """
+    The source of a lazy query plan.
+
+    A scan reads either an existing MicroFrame or a file through a reader function such as `read_csv`.
+    The optimizer pushes projections and filters into the scan, so only the needed columns are loaded and
+    rows are filtered before any other step runs.
+
+    :param source: A MicroFrame, or the path handed to `reader`.
+    :type source: MicroFrame or str
+    :param reader: A function ``reader(path, usecols=None)`` returning a MicroFrame. None for MicroFrame sources.
+    :type reader: callable, optional
+    :param columns: The columns to load, or None for all columns.
+    :type columns: list, optional
+    :param predicates: Filter expressions applied right after loading.
+    :type predicates: list, optional
+    """
+
+    def __init__(
+            self,
+            source: Any,
+            reader: Optional[Callable] = None,
+            columns: Optional[List[str]] = None,
+            predicates: Optional[List[str]] = None,
+    ):
+        """
+        Initializes the Scan with its source and pushed down projection and filters.
+        """
+        self.source = source
+        self.reader = reader
+        self.columns = columns
+        self.predicates = list(predicates or [])
+
+    def read(self):
+        """
+        Loads the projected columns of the source and applies the pushed down filters.
+
+        MicroFrame sources are read as views, so nothing is copied until a later step needs to.
+
+        :return: A new MicroFrame object holding the scanned data.
+        :rtype: MicroFrame
+        """
+        if self.reader is not None:
+            frame = self.reader(self.source, usecols=self.columns)
+        elif self.columns is None:
+            frame = self.source.iloc[:]
+        else:
+            wanted = set(self.columns)
+            frame = self.source.loc[:, [name for name in self.source.columns.tolist() if name in wanted]]
+        for predicate in self.predicates:
+            frame = frame.query(predicate)
+        return frame
+
+    def describe(self) -> str:
+        """
+        Describes the scan for `LazyFrame.explain`.
+
+        :return: A one-line description.
+        :rtype: str
+        """
+        source = f"csv '{self.source}'" if self.reader is not None else f"MicroFrame {self.source.shape}"
+        columns = "*" if self.columns is None else self.columns
+        description = f"SCAN {source} columns={columns}"
+        if self.predicates:
+            description += f" filter={' and '.join(self.predicates)}"
+        return description
+
+
+class LazyFrame:
+    """
+    A query plan over a MicroFrame or a file, executed only on `collect`.
+
+    Each method records a step and returns a new LazyFrame; nothing is read or computed. Before running,
+    `collect` optimizes the plan: adjacent steps of the same kind are merged, filters are moved ahead of
+    selections, renames and unrelated casts down into the scan, and only the columns that later steps use
+    are loaded, dropping casts and renames of dead columns. The whole pipeline then touches the data once.
+
+    :param scan: The source of the plan.
+    :type scan: Scan
+    :param steps: The recorded steps, in order.
+    :type steps: list, optional
+
+    Example:
+        >>> plan = (mframe.lazy()
+        ...         .filter("price > 10")
+        ...         .rename({"price": "unit_price"})
+        ...         .select(["unit_price", "region"]))
+        >>> print(plan.explain())
+        >>> result = plan.collect()
+    """
+
+    def __init__(self, scan: Scan, steps: Optional[List[PlanStep]] = None):
+        """
+        Initializes the LazyFrame with a scan and the steps recorded so far.
+        """
+        self.scan = scan
+        self.steps = list(steps or [])
+
+    def select(self, columns: List[str]) -> "LazyFrame":
+        """
+        Records a projection onto the given columns, in the given order.
+
+        :param columns: The columns to keep.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        """
+        return self._with_step("select", list(columns))
+
+    def filter(self, expression: str) -> "LazyFrame":
+        """
+        Records a row filter, written as a `MicroFrame.query` expression.
+
+        :param expression: A boolean expression over the columns.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        :raises ExpressionError: If the expression is invalid.
+        """
+        compile_expression(expression)
+        return self._with_step("filter", expression)
+
+    def rename(self, new_columns: dict) -> "LazyFrame":
+        """
+        Records a column rename.
+
+        :param new_columns: A dictionary mapping old column names to new column names.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        """
+        return self._with_step("rename", dict(new_columns))
+
+    def cast(self, dtypes_dict: dict) -> "LazyFrame":
+        """
+        Records a change of column data types.
+
+        :param dtypes_dict: A dictionary mapping column names to their new data types.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        """
+        return self._with_step("cast", dict(dtypes_dict))
+
+    def agg(self, spec: dict) -> "LazyFrame":
+        """
+        Records an aggregation of whole columns into a single row.
+
+        Output columns are named ``<column>_<aggregation>``, as in `GroupBy.agg`.
+
+        :param spec: A dictionary mapping column names to an aggregation name or a list of them. Supported
+            aggregations are ``"sum"``, ``"mean"``, ``"count"``, ``"min"`` and ``"max"``.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        :raises ValueError: If an aggregation is not supported.
+        """
+        return self._with_step("aggregate", ((), GroupBy.normalize_spec(spec)))
+
+    def groupby(self, keys) -> "LazyGroupBy":
+        """
+        Starts recording a grouped aggregation.
+
+        :param keys: The name of the key column, or a list of key column names.
+        :return: A builder whose `agg` records the aggregation.
+        :rtype: LazyGroupBy
+        """
+        return LazyGroupBy(self, [keys] if isinstance(keys, str) else list(keys))
+
+    def optimize(self) -> "LazyFrame":
+        """
+        Returns the optimized version of this plan.
+
+        :return: An equivalent plan with filters and projections pushed into the scan.
+        :rtype: LazyFrame
+        """
+        scan = Scan(self.scan.source, self.scan.reader, self.scan.columns, self.scan.predicates)
+        steps = _merge_adjacent_steps(self.steps)
+        steps = _push_down_filters(steps)
+        while steps and steps[0].kind == "filter":
+            scan.predicates.append(steps.pop(0).argument)
+        if len(scan.predicates) > 1:
+            scan.predicates = [_combine_filters(scan.predicates)]
+        steps, needed = _push_down_projection(steps)
+        if needed is not None:
+            for predicate in scan.predicates:
+                needed = _extend_unique(needed, _expression_names(predicate))
+            scan.columns = needed if scan.columns is None else [name for name in scan.columns if name in needed]
+        return LazyFrame(scan, steps)
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        Describes the plan, one step per line, starting at the scan.
+
+        :param optimized: Whether to describe the optimized plan instead of the plan as recorded.
+        :return: The plan description.
+        :rtype: str
+        """
+        plan = self.optimize() if optimized else self
+        lines = [plan.scan.describe()]
+        for step in plan.steps:
+            lines.append(f"  {step.kind.upper()} {step.argument}")
+        return "\n".join(lines)
+
+    def collect(self):
+        """
+        Optimizes and executes the plan.
+
+        :return: The result of the plan.
+        :rtype: MicroFrame
+        """
+        plan = self.optimize()
+        frame = plan.scan.read()
+        for kind, argument in plan.steps:
+            if kind == "select":
+                frame = frame.loc[:, argument]
+            elif kind == "filter":
+                frame = frame.query(argument)
+            elif kind == "rename":
+                frame.rename(argument)
+            elif kind == "cast":
+                frame.change_dtypes(argument)
+            elif kind == "aggregate":
+                keys, spec = argument
+                frame = GroupBy(frame, list(keys)).agg(spec)
+        return frame
+
+    def _with_step(self, kind: str, argument: Any) -> "LazyFrame":
+        """
+        Returns a copy of the plan with one more step.
+
+        :param kind: The kind of step.
+        :param argument: The argument of the step.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        """
+        return LazyFrame(self.scan, self.steps + [PlanStep(kind, argument)])
+
+
+class LazyGroupBy:
+    """
+    Records a grouped aggregation on a LazyFrame.
+
+    :param plan: The plan to extend.
+    :type plan: LazyFrame
+    :param keys: The key column names.
+    :type keys: list
+    """
+
+    def __init__(self, plan: LazyFrame, keys: List[str]):
+        """
+        Initializes the LazyGroupBy with the plan and the key columns.
+        """
+        self.plan = plan
+        self.keys = keys
+
+    def agg(self, spec: dict) -> LazyFrame:
+        """
+        Records the aggregation of columns per group, with the semantics of `GroupBy.agg`.
+
+        :param spec: A dictionary mapping column names to an aggregation name or a list of them.
+        :return: The extended plan.
+        :rtype: LazyFrame
+        :raises ValueError: If an aggregation is not supported.
+        """
+        return self.plan._with_step("aggregate", (tuple(self.keys), GroupBy.normalize_spec(spec)))
+
+
+def _merge_adjacent_steps(steps: List[PlanStep]) -> List[PlanStep]:
+    """
+    Merges neighbouring steps of the same kind into one step.
+
+    Consecutive casts become one cast where later types win, consecutive renames are composed,
+    consecutive selections keep the last one and consecutive filters are combined with ``and``.
+
+    :param steps: The plan steps.
+    :return: The merged steps.
+    :rtype: list
+    """
+    merged = []
+    for step in steps:
+        previous = merged[-1] if merged else None
+        if previous is None or previous.kind != step.kind or step.kind == "aggregate":
+            merged.append(step)
+        elif step.kind == "cast":
+            merged[-1] = PlanStep("cast", {**previous.argument, **step.argument})
+        elif step.kind == "rename":
+            merged[-1] = PlanStep("rename", _compose_renames(previous.argument, step.argument))
+        elif step.kind == "select":
+            merged[-1] = step
+        elif step.kind == "filter":
+            merged[-1] = PlanStep("filter", _combine_filters([previous.argument, step.argument]))
+    return merged
+
+
+def _compose_renames(first: dict, second: dict) -> dict:
+    """
+    Composes two renames into one equivalent rename.
+
+    :param first: The rename applied first.
+    :param second: The rename applied second.
+    :return: The composed rename.
+    :rtype: dict
+    """
+    composed = {old: second.get(new, new) for old, new in first.items()}
+    for old, new in second.items():
+        if old not in first.values():
+            composed[old] = new
+    return composed
+
+
+def _push_down_filters(steps: List[PlanStep]) -> List[PlanStep]:
+    """
+    Moves every filter as early in the plan as its meaning allows.
+
+    A filter moves ahead of a selection that keeps all of its columns, ahead of a rename (its column names
+    are translated back) and ahead of a cast that does not touch its columns. It never moves ahead of
+    another filter or an aggregation.
+
+    :param steps: The plan steps.
+    :return: The reordered steps.
+    :rtype: list
+    """
+    reordered = []
+    for step in steps:
+        if step.kind != "filter":
+            reordered.append(step)
+            continue
+        expression = step.argument
+        position = len(reordered)
+        while position > 0:
+            previous = reordered[position - 1]
+            names = _expression_names(expression)
+            if previous.kind == "select" and set(names) <= set(previous.argument):
+                pass
+            elif previous.kind == "cast" and not set(names) & set(previous.argument):
+                pass
+            elif previous.kind == "rename" and not set(names) & (
+                set(previous.argument) - set(previous.argument.values())
+            ):
+                inverse = {new: old for old, new in previous.argument.items()}
+                expression = _rename_expression(expression, inverse)
+            else:
+                break
+            position -= 1
+        if position > 0 and reordered[position - 1].kind == "filter":
+            combined = _combine_filters([reordered[position - 1].argument, expression])
+            reordered[position - 1] = PlanStep("filter", combined)
+        else:
+            reordered.insert(position, PlanStep("filter", expression))
+    return reordered
+
+
+def _push_down_projection(steps: List[PlanStep]) -> tuple:
+    """
+    Works out which columns each step needs, from the last step back to the scan.
+
+    Selections shrink to the columns used later, and casts and renames of columns that are never used
+    are dropped. A rename is kept while a later step uses its old name, so that step fails as it would
+    without a plan.
+
+    :param steps: The plan steps.
+    :return: The pruned steps and the columns the scan must load, or None if every column is needed.
+    :rtype: tuple
+    """
+    needed = None
+    pruned = []
+    for kind, argument in reversed(steps):
+        if kind == "aggregate":
+            keys, spec = argument
+            needed = _extend_unique(list(keys), list(spec))
+        elif kind == "select":
+            argument = [name for name in argument if needed is None or name in needed]
+            needed = list(argument)
+        elif kind == "filter":
+            if needed is not None:
+                needed = _extend_unique(needed, _expression_names(argument))
+        elif kind == "rename":
+            if needed is not None:
+                argument = {old: new for old, new in argument.items() if new in needed or old in needed}
+                inverse = {new: old for old, new in argument.items()}
+                needed = [inverse.get(name, name) for name in needed]
+            if not argument:
+                continue
+        elif kind == "cast":
+            if needed is not None:
+                argument = {name: dtype for name, dtype in argument.items() if name in needed}
+            if not argument:
+                continue
+        pruned.append(PlanStep(kind, argument))
+    pruned.reverse()
+    return pruned, needed
+
+
+def _extend_unique(names: list, extra: list) -> list:
+    """
+    Appends the names from `extra` that are not in `names` yet.
+
+    :param names: The names so far.
+    :param extra: The names to add.
+    :return: The combined names, without duplicates.
+    :rtype: list
+    """
+    return names + [name for name in extra if name not in names]
+
+
+def _combine_filters(expressions: List[str]) -> str:
+    """
+    Combines filter expressions into one expression that keeps rows passing all of them.
+
+    :param expressions: The filter expressions.
+    :return: The combined expression.
+    :rtype: str
+    """
+    return " and ".join(f"({expression})" for expression in expressions)
+
+
+def _expression_names(expression: str) -> list:
+    """
+    Returns the names an expression refers to, in order of appearance.
+
+    :param expression: The expression source.
+    :return: The referenced names.
+    :rtype: list
+    """
+    names = []
+    for node in ast.walk(ast.parse(expression.strip(), mode="eval")):
+        if isinstance(node, ast.Name) and node.id not in names:
+            names.append(node.id)
+    return names
+
+
+def _rename_expression(expression: str, mapping: dict) -> str:
+    """
+    Rewrites the names in an expression.
+
+    :param expression: The expression source.
+    :param mapping: A dictionary mapping names to their replacements.
+    :return: The rewritten expression.
+    :rtype: str
+    """
+    tree = ast.parse(expression.strip(), mode="eval")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            node.id = mapping.get(node.id, node.id)
+    return ast.unparse(tree)
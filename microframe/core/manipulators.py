@@ -1,4 +1,9 @@
+import sys
 import numpy as np
+from typing import Optional
+from .config import parallel_map
+from .text import fit_text_dtype
+from .datetimes import ISO_FORMAT, datetime_unit, parse_datetimes
 
 
 class ArrayManipulationError(Exception):
@@ -15,14 +20,19 @@ class StructuredArrayManipulator:
     :type values: numpy.ndarray
     :param columns: Column names corresponding to the data.
     :type columns: numpy.ndarray
+    :param column_positions: A mapping from column name to position. If None, it is built from `columns`.
+    :type column_positions: dict, optional
     """
 
-    def __init__(self, values: np.ndarray, columns: np.ndarray):
+    def __init__(self, values: np.ndarray, columns: np.ndarray, column_positions: Optional[dict] = None):
         """
         Initializes the StructuredArrayManipulator with the structured array and its column names.
         """
         self.values = values
         self.columns = columns
+        if column_positions is None:
+            column_positions = {name: position for position, name in enumerate(columns.tolist())}
+        self.column_positions = column_positions
 
     def rename(self, new_columns: dict) -> None:
         """
@@ -33,11 +43,11 @@ class StructuredArrayManipulator:
         :raises ArrayManipulationError: If the old column name doesn't exist or the new column name already exists.
         """
         for old_name, new_name in new_columns.items():
-            if old_name not in self.columns:
+            if old_name not in self.column_positions:
                 raise ArrayManipulationError(
                     f"Column '{old_name}' does not exist and cannot be renamed."
                 )
-            if new_name in self.columns and new_name != old_name:
+            if new_name in self.column_positions and new_name != old_name:
                 raise ArrayManipulationError(
                     f"Column '{new_name}' already exists. Duplicate names are not allowed."
                 )
@@ -53,52 +63,271 @@ class StructuredArrayManipulator:
             [new_columns.get(old_name, old_name) for old_name in self.columns]
         )
         self.columns = new_columns_array
+        self.column_positions = {name: position for position, name in enumerate(new_columns_array.tolist())}
 
-    def change_dtypes(self, dtypes_dict: dict) -> None:
+    def change_dtypes(self, dtypes_dict: dict, date_format: Optional[str] = None) -> None:
         """
         Changes the data types of specified columns in the structured array.
 
+        Text types without a width, ``"S"`` (or ``"bytes"``) and ``"U"`` (or ``"str"``), get the width of the
+        longest value. ``"S"`` stores one byte per character and falls back to ``U`` for non-ASCII text.
+
+        Text converted to ``datetime64`` is parsed in bulk, as ISO 8601 or with `date_format`. Without a unit,
+        as in ``"datetime64"``, nanoseconds are used if any value has fractional seconds, else seconds.
+
         :param dtypes_dict: A dictionary mapping column names to their new data types.
         :type dtypes_dict: dict
+        :param date_format: The `datetime.strptime` format of text converted to dates. If None, ISO 8601.
+        :type date_format: str, optional
         :raises ArrayManipulationError: If the column doesn't exist or the type conversion is invalid.
         """
         try:
             for column_name, data_type in dtypes_dict.items():
-                if column_name not in self.columns:
+                if column_name not in self.column_positions:
                     raise ArrayManipulationError(
                         f"Column '{column_name}' does not exist and cannot have its data "
                         f"type changed."
                     )
 
-            # Create a list of tuples for new dtypes
-            new_dtypes = [
-                (name, dtypes_dict.get(name, self.values.dtype.fields[name][0]))
-                for name in self.values.dtype.names
-            ]
+            # Create a list of tuples for new dtypes, fitting the width of unsized text types
+            new_dtypes = []
+            for name in self.values.dtype.names:
+                data_type = np.dtype(dtypes_dict.get(name, self.values.dtype.fields[name][0]))
+                if data_type.kind in "SU" and data_type.itemsize == 0:
+                    data_type = fit_text_dtype(self.values[name], data_type.kind)
+                if data_type.kind == "M" and np.datetime_data(data_type)[0] == "generic":
+                    data_type = np.dtype(f"datetime64[{self._datetime_unit(self.values[name], date_format)}]")
+                new_dtypes.append((name, data_type))
             new_values = np.zeros(self.values.shape, dtype=new_dtypes)
 
-            for name in self.values.dtype.names:
-                dtypes = dtypes_dict.get(name, self.values.dtype.fields[name][0])
-                new_values[name] = self.values[name].astype(dtypes)
+            def cast_column(name):
+                column = self.values[name]
+                target = new_values.dtype.fields[name][0]
+                if target.kind == "M" and column.dtype.kind in "SU":
+                    column = parse_datetimes(column, np.datetime_data(target)[0], date_format)
+                new_values[name] = column
+
+            parallel_map(cast_column, self.values.dtype.names)
 
             self.values = new_values
         except ValueError as e:
             raise ArrayManipulationError(f"TypeError: {e}")
 
-    def to_numpy(self):
+    def memory_usage(self, deep: bool = False) -> dict:
+        """
+        Returns the number of bytes each column of the structured array holds.
+
+        Records of column selections can hold padding where unselected fields were. Each column is charged
+        for the bytes up to the next column, so the sizes add up to everything the records occupy.
+
+        :param deep: Whether to add the size of the Python objects referenced by object columns.
+        :type deep: bool
+        :return: A dictionary mapping each column name to its size in bytes.
+        :rtype: dict
+        """
+        fields = self.values.dtype.fields
+        offsets = sorted((fields[name][1], name) for name in self.values.dtype.names)
+        ends = [offset for offset, _ in offsets[1:]] + [self.values.dtype.itemsize]
+        widths = {}
+        for position, ((offset, name), end) in enumerate(zip(offsets, ends)):
+            widths[name] = end - (offset if position > 0 else 0)
+        usage = {}
+        for name in self.values.dtype.names:
+            column = self.values[name]
+            usage[str(name)] = column.shape[0] * widths[name]
+            if deep and column.dtype.kind == "O":
+                usage[str(name)] += sum(sys.getsizeof(item) for item in column)
+        return usage
+
+    def narrowest_dtypes(self) -> dict:
+        """
+        Finds, for every column, the smallest dtype that holds all of its values without loss.
+
+        Integers get the narrowest integer type of the same signedness that covers their range. Floats
+        stay floats: float64 columns become float32 when every value survives the round trip. Text gets the
+        width of its longest value, stored as bytes (``S``) when it is entirely ASCII. Other columns keep
+        their dtype.
+
+        :return: A dictionary mapping column names to their narrowest dtype, for columns that can shrink.
+        :rtype: dict
+        """
+        dtypes = {}
+        for name in self.values.dtype.names:
+            column = self.values[name]
+            dtype = self._narrowest_dtype(column) if column.shape[0] > 0 else column.dtype
+            if dtype.itemsize < column.dtype.itemsize or dtype.kind != column.dtype.kind:
+                dtypes[str(name)] = dtype
+        return dtypes
+
+    @staticmethod
+    def _narrowest_dtype(column: np.ndarray) -> np.dtype:
+        """
+        Finds the smallest dtype that holds all values of a non-empty column without loss.
+
+        :param column: The column.
+        :return: The narrowest dtype, or the column dtype if it cannot shrink.
+        :rtype: numpy.dtype
+        """
+        kind = column.dtype.kind
+        if kind == "f":
+            if column.dtype.itemsize > 4 and np.array_equal(
+                    column.astype(np.float32).astype(column.dtype), column, equal_nan=True):
+                return np.dtype(np.float32)
+            return column.dtype
+        if kind in "iu":
+            lowest, highest = column.min(), column.max()
+            for itemsize in (1, 2, 4, 8):
+                candidate = np.dtype(f"{kind}{itemsize}")
+                info = np.iinfo(candidate)
+                if info.min <= lowest and highest <= info.max:
+                    return candidate
+            return column.dtype
+        if kind in "SU":
+            return fit_text_dtype(column)
+        return column.dtype
+
+    @staticmethod
+    def _datetime_unit(column: np.ndarray, date_format: Optional[str]) -> str:
+        """
+        Chooses the datetime64 unit for a column converted to dates without an explicit unit.
+
+        :param column: The column being converted.
+        :param date_format: The format of text columns, or None for ISO 8601.
+        :return: ``"ns"`` or ``"s"``.
+        :rtype: str
+        """
+        if column.dtype.kind not in "SU":
+            return "s"
+        return datetime_unit(column, date_format or ISO_FORMAT)
+
+    def assign(self, name: str, column: np.ndarray) -> None:
+        """
+        Adds a column, or replaces a column with data of a different dtype, in one structured copy.
+
+        The other columns are copied into the new structured array with a single assignment, and a new
+        column is appended after the existing ones.
+
+        :param name: The name of the column.
+        :type name: str
+        :param column: The column data, one value per row.
+        :type column: numpy.ndarray
+        :raises ArrayManipulationError: If the column cannot be stored in a structured array.
+        """
+        kept = [existing for existing in self.values.dtype.names if existing != name]
+        try:
+            new_dtypes = [
+                (existing, column.dtype if existing == name else self.values.dtype.fields[existing][0])
+                for existing in self.values.dtype.names
+            ]
+            if name not in self.column_positions:
+                new_dtypes.append((name, column.dtype))
+            new_values = np.empty(self.values.shape, dtype=new_dtypes)
+        except TypeError as e:
+            raise ArrayManipulationError(f"Column '{name}' cannot be stored: {e}")
+        if kept:
+            new_values[kept] = self.values[kept]
+        new_values[name] = column
+
+        self.values = new_values
+        self.columns = np.array(new_values.dtype.names)
+        self.column_positions = {column_name: position for position, column_name in enumerate(new_values.dtype.names)}
+
+    def to_numpy(self, columns=None, dtype=None, copy=False):
         """
         Converts the structured array to a regular 2D NumPy array (matrix).
 
-        This conversion will result in a 2D NumPy array with each column corresponding to a field in the structured array.
-        All fields must be of a type that can be cast to a common dtype.
+        This conversion will result in a 2D NumPy array with each column corresponding to a field in the
+        structured array. When the selected fields share a dtype and sit next to each other in every record,
+        the result is a strided view of the structured array and no data is copied. Otherwise the result is
+        allocated once and filled column by column.
 
+        :param columns: Names of the columns to convert. If None, all columns are converted.
+        :type columns: list, optional
+        :param dtype: Data type of the result. If None, the common dtype of the selected columns is used.
+        :type dtype: str or numpy.dtype, optional
+        :param copy: Whether to always return a copy, even when a view is possible, defaults to False.
+        :type copy: bool, optional
         :return: A 2D NumPy array representation of the structured array.
         :rtype: numpy.ndarray
-        :raises ArrayManipulationError: If the conversion is not possible due to incompatible data types.
+        :raises ArrayManipulationError: If a column doesn't exist or the conversion is not possible due to
+            incompatible data types.
         """
+        names = self._resolve_column_names(columns)
+        field_dtypes = [self.values.dtype.fields[name][0] for name in names]
         try:
-            # Extract each column and stack them horizontally to form a 2D array
-            columns = [self.values[field] for field in self.values.dtype.names]
-            return np.column_stack(columns)
-        except ValueError as e:
-            raise ArrayManipulationError(f"Error in converting to a regular 2D NumPy array: {e}")
\ No newline at end of file
+            target_dtype = np.dtype(dtype) if dtype is not None else self._common_dtype(field_dtypes)
+
+            view = self._uniform_view(names, target_dtype)
+            if view is not None:
+                return view.copy() if copy else view
+
+            result = np.empty((self.values.shape[0], len(names)), dtype=target_dtype)
+
+            def fill_column(position):
+                result[:, position] = self.values[names[position]]
+
+            parallel_map(fill_column, range(len(names)))
+            return result
+        except (TypeError, ValueError) as e:
+            raise ArrayManipulationError(f"Error in converting to a regular 2D NumPy array: {e}")
+
+    def _resolve_column_names(self, columns) -> list:
+        """
+        Validates a column selection and returns it as a list of field names.
+
+        :param columns: A column name, a list of column names, or None for all columns.
+        :return: The selected field names.
+        :rtype: list
+        :raises ArrayManipulationError: If a selected column doesn't exist.
+        """
+        if columns is None:
+            return list(self.values.dtype.names)
+        if isinstance(columns, str):
+            columns = [columns]
+        fields = self.values.dtype.fields
+        for name in columns:
+            if name not in fields:
+                raise ArrayManipulationError(f"Column '{name}' does not exist.")
+        return list(columns)
+
+    @staticmethod
+    def _common_dtype(field_dtypes: list) -> np.dtype:
+        """
+        Finds the dtype that stacking the given field dtypes side by side would produce.
+
+        :param field_dtypes: The dtypes of the fields to be stacked.
+        :return: The common dtype.
+        :rtype: numpy.dtype
+        """
+        if not field_dtypes:
+            return np.dtype(float)
+        return np.concatenate([np.empty(0, dtype=field_dtype) for field_dtype in field_dtypes]).dtype
+
+    def _uniform_view(self, names: list, target_dtype: np.dtype):
+        """
+        Builds a 2D view over the selected fields if their memory layout allows it.
+
+        The fields must all have `target_dtype` and be laid out back to back inside each record, so that the
+        selection forms a regular grid with one stride between rows and one stride between columns.
+
+        :param names: The selected field names.
+        :param target_dtype: The requested dtype of the result.
+        :return: A 2D view sharing memory with the structured array, or None if no view is possible.
+        :rtype: numpy.ndarray or None
+        """
+        if not names:
+            return None
+        fields = self.values.dtype.fields
+        itemsize = target_dtype.itemsize
+        first_offset = fields[names[0]][1]
+        for position, name in enumerate(names):
+            field_dtype, offset = fields[name][:2]
+            if field_dtype != target_dtype or offset != first_offset + position * itemsize:
+                return None
+
+        first_column = self.values[names[0]]
+        return np.lib.stride_tricks.as_strided(
+            first_column,
+            shape=(first_column.shape[0], len(names)),
+            strides=(first_column.strides[0], itemsize),
+        )
@@ -1,8 +1,22 @@
 import numpy as np
+from numpy.lib.recfunctions import repack_fields
 from typing import List, Any, Optional
 from .printers import StructuredDataPrinter
 from .manipulators import StructuredArrayManipulator
-from .indexers import IlocIndexer
+from .indexers import IlocIndexer, LocIndexer
+from .indexes import RowIndex, SortedIndex, HashIndex
+from .references import BufferReferences
+from .expressions import compile_expression
+from .lazy import LazyFrame, Scan
+from .groupby import GroupBy
+from .joins import join
+from .builders import MicroFrameBuilder
+from .stats import StatsAccumulator, column_quantiles, numeric_columns, summary_frame
+from .sketches import KLLSketch, HyperLogLog
+from .config import parallel_map
+from .interop import ColumnBuffer
+from .text import ByteStringColumn
+from .shared import map_partitions, create_shared_values, attach_shared_values
 
 
 class MicroFrame:
@@ -36,6 +50,14 @@ class MicroFrame:
     values : np.ndarray
         A structured numpy array representing the data.
 
+    Notes
+    -----
+    Frames returned by `iloc` are views that share the parent's buffer whenever NumPy can express the
+    selection as a view. Sharing is copy-on-write: the first assignment through `iloc` on a frame whose
+    buffer is shared gives that frame a private copy, so a mutation only ever affects the frame it was
+    applied to. While the buffer is shared, `mframe[column]` and `to_numpy` views are read-only, so they
+    cannot write through to another frame either. Arrays obtained directly from `values` bypass this
+    bookkeeping.
 
 
     Examples
@@ -82,6 +104,7 @@ class MicroFrame:
 
         self.columns = self._initialize_columns(data, columns)
         self.values = self._initialize_values(data, dtypes, self.columns)
+        self._initialize_state()
 
     @classmethod
     def from_structured_array(cls, data: np.ndarray, columns: Optional[List[str]] = None):
@@ -100,8 +123,20 @@ class MicroFrame:
         instance = cls.__new__(cls)
         instance.columns = cls._initialize_columns_from_structured_array(data, columns)
         instance.values = data
+        instance._initialize_state()
         return instance
 
+    def _initialize_state(self):
+        """
+        Initialize the bookkeeping that accompanies the data: buffer sharing, the row index and cached sorts.
+        """
+        self._references = BufferReferences(self)
+        self._index_spec = None
+        self._index = None
+        self._hash_indexes = {}
+        self._sort_cache = {}
+        self._builder = None
+
     @staticmethod
     def _initialize_columns_from_structured_array(
             data: np.ndarray, columns: Optional[List[str]] = None
@@ -196,12 +231,56 @@ class MicroFrame:
         to access columns of the MicroFrame as if it were a dictionary, using the
         column names as keys.
 
+        Byte string (``S``) columns are returned as a `ByteStringColumn` view, so comparing them with Python
+        strings, as in ``mframe.filter(mframe['name'] == 'ab')``, works as for unicode columns. The column is
+        a read-only view while another frame shares the buffer, for example after taking an `iloc` slice,
+        and while the row index, a hash index or a cached sort order is built from it. Assign with
+        ``mframe[column] = values`` or `iloc` instead, which keep these up to date.
+
         :param column_header: The header (name) of the column to be accessed.
         :type column_header: str
         :return: The column data.
         :rtype: numpy.ndarray
         """
-        return self.values[column_header]
+        column = self.values[column_header]
+        if column.dtype.kind == "S":
+            column = column.view(ByteStringColumn)
+        return self._protect_view(column, [column_header])
+
+    def __setitem__(self, column_header, value):
+        """
+        Sets a column using square bracket notation, adding it if it does not exist.
+
+        Scalars and arrays of the column's dtype are written into the existing column in place. Arrays of
+        another dtype replace the column with their own dtype, and new columns are appended after the existing
+        ones. Both take a single structured copy of the data, never a loop over rows.
+
+        :param column_header: The header (name) of the column to set.
+        :type column_header: str
+        :param value: A scalar, or an array with one value per row.
+        :raises ValueError: If an array does not have one value per row.
+
+        Example::
+
+            >>> mframe['margin'] = mframe['rev'] - mframe['cost']
+            >>> mframe['flag'] = 0
+
+        """
+        value = np.asarray(value)
+        if value.ndim > 0 and value.shape != (len(self),):
+            raise ValueError(f"Column '{column_header}' needs {len(self)} values, got shape {value.shape}.")
+        column_positions = self._get_column_positions()
+        if column_header in column_positions and (value.ndim == 0 or value.dtype == self.values.dtype[column_header]):
+            self._prepare_for_write([column_header])
+            self.values[column_header] = value
+            return
+
+        if value.ndim == 0:
+            value = np.full(len(self), value)
+        manipulator = StructuredArrayManipulator(self.values, self.columns, column_positions)
+        manipulator.assign(column_header, value)
+        self.columns = manipulator.columns
+        self._replace_values(manipulator.values)
 
     def __len__(self):
         """
@@ -282,110 +361,645 @@ class MicroFrame:
 
             >>> mframe.rename({'old_name1': 'new_name1', 'old_name2': 'new_name2'})
         """
-        manipulator = StructuredArrayManipulator(self.values, self.columns)
+        manipulator = StructuredArrayManipulator(self.values, self.columns, self._get_column_positions())
         manipulator.rename(new_columns)
         self.columns = manipulator.columns
-        self.values = manipulator.values
+        self._replace_values(manipulator.values)
+        if self._index_spec is not None:
+            index_column, is_sorted = self._index_spec
+            self._index_spec = (new_columns.get(index_column, index_column), is_sorted)
+        self._hash_indexes = {new_columns.get(column, column): None for column in self._hash_indexes}
 
-    def change_dtypes(self, dtypes_dict: dict):
+    def select(self, columns):
+        """
+        Returns a new MicroFrame with only the given columns, in the given order.
+
+        The result is a view of this frame's data, so no values are copied; writes to either frame copy the
+        data first, so the two frames never see each other's changes.
+
+        :param columns: The name of a column, or a list of column names.
+        :return: A new MicroFrame object viewing the selected columns.
+        :rtype: MicroFrame
+        :raises KeyError: If a column does not exist.
+
+        Example::
+
+            >>> features = mframe.select(['x1', 'x2'])
+
+        """
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        column_positions = self._get_column_positions()
+        for column in columns:
+            if column not in column_positions:
+                raise KeyError(f"Column '{column}' does not exist.")
+        subset = MicroFrame.from_structured_array(self.values[columns])
+        self._finalize_subset(subset)
+        return subset
+
+    def drop(self, columns):
+        """
+        Returns a new MicroFrame without the given columns.
+
+        Like `select`, the result is a view of this frame's data.
+
+        :param columns: The name of a column, or a list of column names.
+        :return: A new MicroFrame object viewing the remaining columns.
+        :rtype: MicroFrame
+        :raises KeyError: If a column does not exist.
+
+        Example::
+
+            >>> mframe.drop(columns=['internal_id'])
+
+        """
+        columns = {columns} if isinstance(columns, str) else set(columns)
+        column_positions = self._get_column_positions()
+        for column in columns:
+            if column not in column_positions:
+                raise KeyError(f"Column '{column}' does not exist.")
+        return self.select([column for column in column_positions if column not in columns])
+
+    def change_dtypes(self, dtypes_dict: dict, date_format: Optional[str] = None):
         """
         Changes the data types of the columns of the MicroFrame.
 
         This method uses the StructuredArrayManipulator class to change the data types
         of the columns of the MicroFrame based on the provided mapping.
 
+        Text columns converted to ``datetime64`` are parsed in bulk, as ISO 8601 or with `date_format`,
+        so that date filters compare 8-byte integers instead of strings.
+
         :param dtypes_dict: A dictionary mapping column names to their new data types.
+        :param date_format: The `datetime.strptime` format of text converted to dates, for example
+            ``"%d/%m/%Y"``. If None, ISO 8601 is expected.
 
         Example::
 
             >>> mframe.change_dtypes({'column1': 'float64', 'column2': 'int32'})
+            >>> mframe.change_dtypes({'day': 'datetime64[s]'}, date_format='%d/%m/%Y')
+
+        """
+        manipulator = StructuredArrayManipulator(self.values, self.columns, self._get_column_positions())
+        manipulator.change_dtypes(dtypes_dict, date_format=date_format)
+        self._replace_values(manipulator.values)
+
+    def memory_usage(self, deep: bool = False) -> dict:
+        """
+        Reports the memory each column of the MicroFrame occupies.
+
+        :param deep: Whether to add the size of the Python objects referenced by object columns.
+        :return: A dictionary mapping each column name to its size in bytes.
+        :rtype: dict
+
+        Example::
+
+            >>> mframe.memory_usage(deep=True)
+            {'id': 400000, 'name': 40000000, 'price': 400000}
 
         """
-        manipulator = StructuredArrayManipulator(self.values, self.columns)
-        manipulator.change_dtypes(dtypes_dict)
-        self.values = manipulator.values
+        manipulator = StructuredArrayManipulator(self.values, self.columns, self._get_column_positions())
+        return manipulator.memory_usage(deep=deep)
 
-    def to_numpy(self):
+    def optimize_dtypes(self) -> int:
+        """
+        Shrinks every column to the smallest dtype that holds its values without loss.
+
+        Integers are downcast to the narrowest type covering their current range, and float64 columns
+        become float32 when no value changes; floats are never turned into integers. Text is cut to the
+        width of its longest value and stored as one byte per character (``S``) when it is entirely ASCII,
+        instead of four. Columns are converted with one structured copy, as by `change_dtypes`.
+
+        Narrow integer columns keep their NumPy arithmetic: results are computed in the column's own
+        dtype and wrap around silently on overflow, so after shrinking ``qty`` to ``int8``,
+        ``mframe.eval("qty * 100")`` can overflow. Cast a column back up with `change_dtypes` before
+        arithmetic that may leave its range, and do not call this on columns that will receive larger values.
+
+        :return: The number of bytes saved.
+        :rtype: int
+
+        Example::
+
+            >>> mframe = read_csv('data.csv')
+            >>> saved = mframe.optimize_dtypes()
+
+        """
+        manipulator = StructuredArrayManipulator(self.values, self.columns, self._get_column_positions())
+        before = sum(manipulator.memory_usage().values())
+        dtypes = manipulator.narrowest_dtypes()
+        if dtypes:
+            self.change_dtypes(dtypes)
+        return before - sum(self.memory_usage().values())
+
+    def to_numpy(self, columns: Optional[List[str]] = None, dtype=None, copy: bool = False):
         """
         Converts the MicroFrame to a regular 2D NumPy array (matrix).
 
         This conversion will result in a 2D NumPy array with each column corresponding to a field in the MicroFrame.
-        All fields must be of a type that can be cast to a common dtype.
-
+        All fields must be of a type that can be cast to a common dtype. When the selected columns share a dtype
+        and are stored next to each other, the result is a view of the MicroFrame data rather than a copy, so
+        writing to it writes to the MicroFrame. The view is read-only while another frame shares the data
+        or an index or cached sort order is built from one of the columns.
+        Pass `copy=True` to always get an independent array.
+
+        :param columns: Names of the columns to convert. If None, all columns are converted.
+        :param dtype: Data type of the result. If None, the common dtype of the selected columns is used.
+        :param copy: Whether to always return a copy, even when a view is possible.
         :return: A 2D NumPy array representation of the MicroFrame data.
         :rtype: numpy.ndarray
 
         Example::
 
             >>> numpy_array = mframe.to_numpy()
+            >>> features = mframe.to_numpy(columns=['x1', 'x2'], dtype='float32')
+
+        """
+        manipulator = StructuredArrayManipulator(self.values, self.columns, self._get_column_positions())
+        array = manipulator.to_numpy(columns=columns, dtype=dtype, copy=copy)
+        return self._protect_view(array, list(self.values.dtype.names) if columns is None else columns)
+
+    def __array__(self, dtype=None, copy: Optional[bool] = None):
+        """
+        Exports the rows as a structured NumPy array, so ``numpy.asarray(mframe)`` works without a copy.
+
+        Without a copy the result is a read-only view of the MicroFrame data. It never changes: while it is
+        alive, the MicroFrame copies its own data before its next in-place write, as for `iloc` views. For
+        a 2D array of one dtype, use `to_numpy`.
+
+        :param dtype: The dtype of the result. A different dtype requires a copy.
+        :param copy: True to always copy, False to never copy, None to copy only if needed.
+        :return: The rows as a structured array.
+        :rtype: numpy.ndarray
+        :raises ValueError: If `copy` is False but a copy is needed for `dtype`.
+
+        Example::
+
+            >>> rows = np.asarray(mframe)
+
+        """
+        return self._export(self.values).__array__(dtype=dtype, copy=copy)
+
+    def column_buffer(self, column: str) -> ColumnBuffer:
+        """
+        Exports one column without a copy, through the NumPy array interface and Python memoryviews.
+
+        Reading the column through the returned buffer never copies it, and the data seen through the buffer
+        never changes: while the buffer or any array made from it is alive, the MicroFrame copies its own data
+        before its next in-place write. Reads, `iloc` slices, `select` and `drop` keep exported buffers valid
+        and share their memory. Writes such as assigning to a column, `eval` into a column or `change_dtypes`
+        leave exported buffers with the data as it was when they were exported.
+
+        :param column: The name of the column.
+        :return: A read-only buffer over the column.
+        :rtype: ColumnBuffer
+        :raises KeyError: If the column does not exist.
+
+        Example::
+
+            >>> prices = np.asarray(mframe.column_buffer('price'))
+            >>> raw = mframe.column_buffer('price').as_memoryview()
+
+        """
+        if column not in self._get_column_positions():
+            raise KeyError(f"Column '{column}' does not exist.")
+        return self._export(self.values[column])
+
+    def _export(self, values: np.ndarray) -> ColumnBuffer:
+        """
+        Wraps data of this frame in a ColumnBuffer that is registered as a reader of the buffer.
+
+        :param values: The frame data or one of its columns.
+        :return: The registered buffer.
+        :rtype: ColumnBuffer
+        """
+        buffer = ColumnBuffer(values)
+        self._references.add(buffer)
+        return buffer
+
+    def query(self, expression: str, **variables):
+        """
+        Returns the rows for which a boolean expression over the columns is True.
+
+        The expression is parsed once and cached, then evaluated with NumPy column operations. ``and`` and
+        ``or`` short-circuit over rows: the right operand is only evaluated, and its columns only read, for
+        the rows the left operand has not already decided. Names that are not columns are looked up in
+        `variables`.
+
+        :param expression: A boolean expression, for example ``"price > 10 and region == 'EU'"``.
+        :param variables: Values for names in the expression that are not columns.
+        :return: A new MicroFrame holding the matching rows.
+        :rtype: MicroFrame
+        :raises ExpressionError: If the expression is invalid or does not evaluate to booleans.
+
+        Example::
+
+            >>> mframe.query("price > 10 and region == 'EU'")
+            >>> mframe.query("price > limit", limit=10)
+
+        """
+        mask = compile_expression(expression).mask(self.values, variables)
+        return self.iloc[mask]
+
+    def eval(self, expression: str, out=None, block_size: int = 65536, **variables):
+        """
+        Evaluates a column expression in cache-sized blocks of rows.
+
+        The expression uses the syntax of `query`, typically arithmetic such as ``"(a * b + c) / d"``. Instead
+        of allocating a frame-length temporary for every operator, rows are evaluated `block_size` at a time
+        with scratch buffers reused between blocks, and each block of results is written straight into its
+        target.
+
+        :param expression: The expression to evaluate.
+        :param out: Where to write the result. The name of an existing column is overwritten in place (values
+            are cast to the column dtype), a new name adds a column, and an array with one entry per row is
+            filled. If None, a new array is returned.
+        :param block_size: The number of rows evaluated at a time.
+        :param variables: Values for names in the expression that are not columns.
+        :return: The result column or array.
+        :rtype: numpy.ndarray
+        :raises ExpressionError: If the expression is invalid or cannot be evaluated.
+        :raises ValueError: If an `out` array does not have one entry per row.
+
+        Example::
+
+            >>> mframe.eval("(a * b + c) / d", out="score")
+            >>> mframe.eval("price * rate", out="price", rate=1.1)
+
+        """
+        compiled = compile_expression(expression)
+        if isinstance(out, str):
+            if out in self._get_column_positions():
+                self._prepare_for_write([out])
+                return compiled.evaluate_blocks(self.values, self.values[out], block_size, variables)
+            self[out] = compiled.evaluate_blocks(self.values, None, block_size, variables)
+            return self.values[out]
+        if out is not None and out.shape != (len(self),):
+            raise ValueError(f"out needs shape ({len(self)},), got {out.shape}.")
+        return compiled.evaluate_blocks(self.values, out, block_size, variables)
+
+    def filter(self, mask):
+        """
+        Returns the rows where a boolean mask is True.
+
+        :param mask: A boolean array-like with one entry per row.
+        :return: A new MicroFrame holding the selected rows.
+        :rtype: MicroFrame
+        :raises IndexError: If the mask does not have one entry per row.
+        :raises TypeError: If the mask is not boolean.
+
+        Example::
+
+            >>> mframe.filter(mframe['price'] > 10)
+
+        """
+        mask = np.asarray(mask)
+        if mask.dtype != bool:
+            raise TypeError("The mask must be a boolean array.")
+        return self.iloc[mask]
+
+    def append(self, rows):
+        """
+        Appends rows to the end of the MicroFrame in place.
+
+        The first append moves the data into a buffer with spare capacity, which doubles whenever it fills up,
+        so appending many small batches copies each row only a constant number of times on average. Frames
+        that were taken as views before the append keep seeing the rows they had. Column dtypes are promoted
+        when appended frames need wider types, as in `concat`.
+
+        :param rows: A MicroFrame or structured array with the same column names, or a list of rows given as
+            lists or tuples of values.
+        :raises ValueError: If the column names differ or a column cannot be promoted.
+
+        Example::
+
+            >>> mframe.append([(4.0, 'd'), (5.0, 'e')])
+            >>> mframe.append(other_mframe)
+
+        """
+        if self._builder is None or self._builder.values is not self.values:
+            self._builder = MicroFrameBuilder.from_values(self.values)
+            self._replace_values(self._builder.values)
+        self._builder.append(rows)
+        self.values = self._builder.values
+        self._invalidate_caches()
+
+    def sort_values(self, by, ascending=True, kind: str = "stable"):
+        """
+        Returns a new MicroFrame with the rows sorted by one or more columns.
+
+        The sort permutation comes from `argsort` and is cached, so sorting an unchanged frame by the same
+        keys again only gathers the rows.
+
+        :param by: The name of the column to sort by, or a list of names, most significant first.
+        :param ascending: Whether to sort ascending, either for all keys or as a list with one entry per key.
+        :param kind: The NumPy sorting algorithm for single-key sorts. Multi-key sorts are always stable.
+        :return: A new MicroFrame with the sorted rows.
+        :rtype: MicroFrame
+        :raises KeyError: If a column does not exist.
+        :raises ValueError: If `ascending` does not have one entry per key.
+
+        Example::
+
+            >>> mframe.sort_values(by=['region', 'price'], ascending=[True, False])
+
+        """
+        return self.iloc[self.argsort(by, ascending=ascending, kind=kind)]
+
+    def argsort(self, by, ascending=True, kind: str = "stable") -> np.ndarray:
+        """
+        Returns the permutation that sorts the rows by one or more columns, without reordering them.
+
+        Single keys are sorted with `numpy.argsort`, several keys with `numpy.lexsort`. Descending keys keep
+        ties in row order, and NaN values sort last in either direction. The permutation is cached until the
+        data of a key column changes through the MicroFrame, and is returned read-only because it is shared
+        between calls.
+
+        :param by: The name of the column to sort by, or a list of names, most significant first.
+        :param ascending: Whether to sort ascending, either for all keys or as a list with one entry per key.
+        :param kind: The NumPy sorting algorithm for single-key sorts. Multi-key sorts are always stable.
+        :return: The row positions in sorted order.
+        :rtype: numpy.ndarray
+        :raises KeyError: If a column does not exist.
+        :raises ValueError: If `ascending` does not have one entry per key.
+
+        Example::
+
+            >>> order = mframe.argsort('price', ascending=False)
+            >>> top_prices = mframe['price'][order[:10]]
+
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        ascending = [ascending] * len(by) if isinstance(ascending, bool) else list(ascending)
+        if len(ascending) != len(by):
+            raise ValueError("ascending must have one entry per sort key.")
+        for column in by:
+            if column not in self._get_column_positions():
+                raise KeyError(f"Column '{column}' does not exist.")
+
+        cache_key = (tuple(by), tuple(ascending), kind)
+        permutation = self._sort_cache.get(cache_key)
+        if permutation is None:
+            keys = [self._sort_key(self.values[column], is_ascending) for column, is_ascending in zip(by, ascending)]
+            if len(keys) == 1:
+                permutation = np.argsort(keys[0], kind=kind)
+            else:
+                permutation = np.lexsort(keys[::-1])
+            permutation.flags.writeable = False
+            self._sort_cache[cache_key] = permutation
+        return permutation
+
+    @staticmethod
+    def _sort_key(column: np.ndarray, ascending: bool) -> np.ndarray:
+        """
+        Returns the array to sort by for one key column.
+
+        Descending keys are replaced by their negated ranks among the distinct values, which works for
+        every dtype and keeps ties in row order. NaN values get a rank above all others so they stay last.
+
+        :param column: The key column.
+        :param ascending: Whether the key sorts ascending.
+        :return: The column itself, or the negated ranks for a descending key.
+        :rtype: numpy.ndarray
+        """
+        if ascending:
+            return column
+        _, ranks = np.unique(column, return_inverse=True)
+        keys = -ranks.astype(np.int64)
+        if column.dtype.kind in "fc":
+            keys[np.isnan(column)] = 1
+        return keys
+
+    def groupby(self, keys):
+        """
+        Groups the rows by one or more key columns for aggregation.
+
+        The keys are factorized with one sort, and `agg` reduces every group with vectorized kernels, so
+        there is no Python loop per group.
+
+        :param keys: The name of the key column, or a list of key column names.
+        :return: A GroupBy object whose `agg` method returns a new MicroFrame.
+        :rtype: GroupBy
+        :raises KeyError: If a key column does not exist.
+
+        Example::
+
+            >>> mframe.groupby('region').agg({'price': ['sum', 'mean', 'count', 'min', 'max']})
+            >>> mframe.groupby(['region', 'year']).agg({'qty': 'sum'})
+
+        """
+        return GroupBy(self, keys)
+
+    def join(self, other, on: str, how: str = "inner", suffix: str = "_right"):
+        """
+        Joins this frame with another frame on the equality of a key column.
+
+        Already sorted keys are matched with a sort-merge join, other keys with a hash join built on the
+        smaller frame (reusing an index from `create_hash_index`). The output columns are gathered in one
+        pass each, so no Python code runs per row. Rows come out in the order of this frame.
+
+        :param other: The right frame.
+        :type other: MicroFrame
+        :param on: The name of the key column, present in both frames.
+        :param how: ``"inner"`` keeps matched rows only, ``"left"`` also keeps the rows of this frame without
+            a match, and ``"outer"`` additionally keeps the unmatched rows of `other`. Missing values are NaN
+            (integer columns become float64), NaT or empty strings.
+        :param suffix: Appended to the names of right columns that are also columns of this frame.
+        :return: A new MicroFrame with the columns of this frame followed by the other columns except the key.
+        :rtype: MicroFrame
+        :raises KeyError: If a frame has no column `on`.
+        :raises ValueError: If `how` is not supported.
+
+        Example::
+
+            >>> orders.join(customers, on='customer_id', how='left')
+
+        """
+        return join(self, other, on, how=how, suffix=suffix)
+
+    def map_partitions(self, function, partitions: Optional[int] = None, workers: Optional[int] = None):
+        """
+        Applies a Python function to row ranges of the MicroFrame in parallel worker processes.
+
+        Meant for CPU-heavy Python code that threads cannot speed up. The rows are placed once in shared
+        memory and every worker gets a zero-copy, read-only MicroFrame view of its range; writing to the view
+        makes a private copy first. The results are concatenated in row order into one new frame.
+
+        :param function: Called with each partition, returns a MicroFrame or a structured array. It must be
+            defined at module level so it can be sent to the workers.
+        :param partitions: The number of row ranges. Defaults to the number of workers.
+        :param workers: The number of worker processes. Defaults to the number of CPUs.
+        :return: A new MicroFrame with the results of all partitions.
+        :rtype: MicroFrame
+        :raises ValueError: If `partitions` or `workers` is smaller than 1, or the results cannot be concatenated.
+        :raises TypeError: If the function does not return a MicroFrame or a structured array.
+
+        Example::
+
+            >>> def score(part):
+            ...     part['score'] = [expensive_model(row) for row in part.values]
+            ...     return part.select(['id', 'score'])
+            >>> scores = mframe.map_partitions(score, partitions=16, workers=8)
+
+        """
+        return map_partitions(self, function, partitions=partitions, workers=workers)
+
+    def lazy(self):
+        """
+        Starts a lazy query plan over the MicroFrame.
+
+        Operations on the returned LazyFrame are recorded instead of executed. `collect` optimizes the
+        recorded plan and runs it in one go, so a multi-step pipeline reads the data once.
+
+        :return: An empty plan reading this MicroFrame.
+        :rtype: LazyFrame
+
+        Example::
+
+            >>> result = mframe.lazy().filter("price > 10").select(['price', 'region']).collect()
 
         """
-        manipulator = StructuredArrayManipulator(self.values, self.columns)
-        return manipulator.to_numpy()
+        return LazyFrame(Scan(self))
 
-    def describe(self):
+    def describe(self, percentiles: Optional[List[float]] = None):
         """
         Generates descriptive statistics summarizing the central tendency,
         dispersion, and shape of the dataset's distribution, excluding NaN values.
 
         This method targets numeric data and provides an overview of statistical
-        characteristics of numeric columns, including count, mean, standard deviation,
-        minimum, and maximum values.
+        characteristics of numeric (integer and floating point) columns.
 
-        NaN values are excluded from the calculations. The results are printed in a
-        tabular format to the console.
+        Each column is read in a single blocked pass that accumulates all moments at once,
+        and the optional percentiles come from one partition of the column.
 
         **Statistics computed:**
 
         - *count*: The number of non-NaN values.
         - *mean*: The mean of the values.
         - *std*: The sample standard deviation of the values.
+        - *percentiles*: The requested percentiles, labelled like ``25%``.
         - *min*: The minimum value.
         - *max*: The maximum value.
 
-        The method prints the summary to the console and does not return a value.
+        :param percentiles: Quantiles to include, between 0 and 1, for example ``[0.25, 0.5, 0.75]``.
+        :return: A new MicroFrame with a ``stats`` column naming each statistic and one float64 column per
+            numeric column. Print it with `head`.
+        :rtype: MicroFrame
+        :raises ValueError: If a percentile is not between 0 and 1.
 
-        :raises TypeError: If columns contain types that cannot be converted to float.
-        :raises ValueError: If computations encounter issues like an empty column.
+        Example::
+
+            >>> summary = mframe.describe(percentiles=[0.5])
+            >>> summary.head(num_rows=10)
+
+        """
+        percentiles = list(percentiles or [])
+        if any(not 0 <= percentile <= 1 for percentile in percentiles):
+            raise ValueError("Percentiles must be between 0 and 1.")
+
+        accumulator = StatsAccumulator(numeric_columns(self.values)).update(self)
+        quantiles = {}
+        if percentiles:
+            by_column = parallel_map(
+                lambda column: column_quantiles(self.values[column], percentiles), accumulator.columns
+            )
+            for position, percentile in enumerate(percentiles):
+                quantiles[f"{percentile * 100:g}%"] = [values[position] for values in by_column]
+        return summary_frame(MicroFrame, accumulator.columns, accumulator.moments, quantiles)
+
+    def approx_quantiles(self, columns, quantiles: List[float], k: int = 200):
+        """
+        Estimates quantiles of numeric columns in linear time and bounded memory.
+
+        Each column is summarized by a `KLLSketch` instead of being sorted, so the rank error of every
+        estimate is about 1.7 / k. The quantiles 0 and 1 are exact. To summarize data in chunks or across
+        processes, update and merge `KLLSketch` objects directly.
+
+        :param columns: The name of a numeric column, or a list of names.
+        :param quantiles: The quantiles to estimate, between 0 and 1.
+        :param k: The sketch size. Larger values give more accurate estimates.
+        :return: A new MicroFrame with a ``quantile`` column and one float64 column of estimates per column.
+        :rtype: MicroFrame
+        :raises KeyError: If a column does not exist.
+        :raises TypeError: If a column is not numeric.
+        :raises ValueError: If a quantile is not between 0 and 1.
 
         Example::
 
-            >>> mframe.describe()
+            >>> mframe.approx_quantiles(['latency', 'size'], [0.5, 0.9, 0.99]).head()
 
         """
-        # Identify numeric columns and their data types
-        numeric_columns = [name for (name, dtype) in self.values.dtype.fields.items() if
-                           np.issubdtype(dtype[0], np.number)]
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        for column in columns:
+            if column not in self._get_column_positions():
+                raise KeyError(f"Column '{column}' does not exist.")
+            if self.values.dtype[column].kind not in "iuf":
+                raise TypeError(f"Column '{column}' is not numeric.")
+
+        values = np.empty(len(quantiles), dtype=[("quantile", np.float64)] + [(name, np.float64) for name in columns])
+        values["quantile"] = quantiles
+        for column in columns:
+            values[column] = KLLSketch(k).update(self.values[column]).quantiles(quantiles)
+        return MicroFrame.from_structured_array(values)
+
+    def approx_nunique(self, columns=None, precision: int = 14) -> dict:
+        """
+        Estimates the number of distinct values per column in linear time and bounded memory.
 
-        # Initialize statistics dictionary
-        stats = {
-            "count": [],
-            "mean": [],
-            "std": [],
-            "min": [],
-            "max": [],
-        }
-        for key in stats.keys():
-            stats[key].append(key)
+        Each column is summarized by a `HyperLogLog` sketch of 2**precision bytes, with a relative error of
+        about 1.04 / sqrt(2**precision). NaN values are not counted. To count across chunks or processes,
+        update and merge `HyperLogLog` objects directly.
 
-        # Compute statistics for each numeric column, excluding NaN values
-        for col in numeric_columns:
-            column_data = self.values[col].astype(float)  # Convert to float for calculations
-            valid_data = column_data[~np.isnan(column_data)]  # Exclude NaN values
-            stats["count"].append(np.count_nonzero(~np.isnan(column_data)))
-            stats["mean"].append(np.round(np.nanmean(column_data), 3))
-            stats["std"].append(
-                np.round(np.nanstd(column_data, ddof=1), 3))  # Sample standard deviation excluding NaN
-            stats["min"].append(np.round(np.nanmin(column_data), 3))
-            stats["max"].append(np.round(np.nanmax(column_data), 3))
+        :param columns: The name of a column, or a list of names. If None, all columns are counted.
+        :param precision: The sketch precision, between 4 and 18.
+        :return: A dictionary mapping each column name to its estimated distinct count.
+        :rtype: dict
+        :raises KeyError: If a column does not exist.
 
-        # Prepare the data for printing
-        data = [value for value in stats.values()]
-        headers = ['stats'] + numeric_columns
+        Example::
 
-        # Print the statistics using StructuredDataPrinter
-        summary_printer = StructuredDataPrinter(data, columns=headers, max_value_length=20)
-        summary_printer.structured_print(max_width=80, num_cols=None, num_rows=10)
+            >>> mframe.approx_nunique(['user_id', 'country'])
+
+        """
+        if columns is None:
+            columns = list(self._get_column_positions())
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        for column in columns:
+            if column not in self._get_column_positions():
+                raise KeyError(f"Column '{column}' does not exist.")
+        return {column: HyperLogLog(precision).update(self.values[column]).estimate() for column in columns}
+
+    @property
+    def columns(self):
+        """
+        Returns the column names of the MicroFrame.
+
+        Assigning new column names also drops the cached mapping from column name to position
+        used by `loc` and the column manipulation methods.
+
+        :return: An array of column names.
+        :rtype: numpy.ndarray
+
+        Example::
+
+            >>> mframe.columns
+
+        """
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns: np.ndarray):
+        self._columns = columns
+        self._column_positions = None
+
+    def _get_column_positions(self) -> dict:
+        """
+        Returns the cached mapping from column name to column position, building it on first use.
+
+        :return: A dictionary mapping each column name to its position.
+        :rtype: dict
+        """
+        if self._column_positions is None:
+            self._column_positions = {name: position for position, name in enumerate(self._columns.tolist())}
+        return self._column_positions
 
     @property
     def dtypes(self):
@@ -464,4 +1078,363 @@ class MicroFrame:
             >>> first_row = mframe.iloc[0]  # First row of the MicroFrame
             >>> last_row = mframe.iloc[-1] # Last row of the MicroFrame
         """
-        return IlocIndexer(self.values, self.columns, MicroFrame)
+        return IlocIndexer(self.values, self.columns, MicroFrame, owner=self)
+
+    @property
+    def loc(self):
+        """
+        Provides label based indexing for selection by row label and column name.
+
+        This property returns an instance of LocIndexer, which translates row labels and column
+        names to positions and selects through `iloc`. Column names are resolved through a cached
+        dictionary, so selecting by name costs the same on a frame with ten columns or ten thousand.
+        Without a row index, row labels are the row positions and label slices include their stop label.
+
+        :return: An instance of LocIndexer for label based indexing.
+        :rtype: LocIndexer
+
+        Example::
+
+            >>> prices = mframe.loc[:, 'price']  # Single column by name
+            >>> subset = mframe.loc[0:9, ['price', 'qty']]  # Rows 0 to 9 inclusive, two columns
+        """
+        return LocIndexer(
+            self.values,
+            self.columns,
+            MicroFrame,
+            owner=self,
+            column_positions=self._get_column_positions(),
+            row_index=self.index,
+        )
+
+    def copy(self):
+        """
+        Returns a MicroFrame with its own copy of the data.
+
+        :return: A new MicroFrame that shares no memory with this one.
+        :rtype: MicroFrame
+
+        Example::
+
+            >>> snapshot = mframe.copy()
+
+        """
+        return MicroFrame.from_structured_array(self._packed_copy(), list(self.columns))
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Supports pickling, sending only the rows, the column names and the index settings.
+
+        Row views are packed first, so only the visible rows and columns are sent. The rows are pickled as
+        a NumPy array, which with protocol 5 and a `buffer_callback` is handed over as an out-of-band buffer
+        instead of being copied into the pickle stream. Rows that are not repacked are exported read-only,
+        as by `__array__`, so a frame loaded from such a buffer copies it on its first write, and this frame
+        copies its own data before its next write while the buffer is alive.
+
+        :param protocol: The pickle protocol.
+        :return: The function that rebuilds the frame and its arguments.
+        :rtype: tuple
+
+        Example::
+
+            >>> buffers = []
+            >>> data = pickle.dumps(mframe, protocol=5, buffer_callback=buffers.append)
+            >>> restored = pickle.loads(data, buffers=buffers)
+
+        """
+        values = np.ascontiguousarray(repack_fields(self.values))
+        if np.may_share_memory(values, self.values):
+            values = np.asarray(self._export(values))
+        state = (list(self.columns), self._index_spec, list(self._hash_indexes))
+        return type(self)._from_pickle, (values, state)
+
+    @classmethod
+    def _from_pickle(cls, values: np.ndarray, state: tuple):
+        """
+        Rebuilds a pickled MicroFrame.
+
+        :param values: The structured array of rows.
+        :param state: The column names, the row index setting and the hash index columns.
+        :return: The restored MicroFrame.
+        :rtype: MicroFrame
+        """
+        columns, index_spec, hash_index_columns = state
+        instance = cls.from_structured_array(values, columns)
+        instance._index_spec = index_spec
+        instance._hash_indexes = dict.fromkeys(hash_index_columns)
+        return instance
+
+    def to_shared(self):
+        """
+        Copies the MicroFrame into a named shared memory segment that other processes can attach to.
+
+        Hand the segment name to another process and call `MicroFrame.attach` there, instead of sending a
+        pickled copy of the rows. The caller owns the segment: call `close` when done with it in this
+        process and `unlink` once no process needs it.
+
+        :return: The shared memory segment holding the rows.
+        :rtype: multiprocessing.shared_memory.SharedMemory
+
+        Example::
+
+            >>> segment = mframe.to_shared()
+            >>> pool.apply(work, (segment.name,))
+            >>> segment.close()
+            >>> segment.unlink()
+
+        """
+        return create_shared_values(repack_fields(self.values))
+
+    @classmethod
+    def attach(cls, name: str):
+        """
+        Creates a MicroFrame over the rows in a shared memory segment made by `to_shared`, without copying them.
+
+        The frame is read-only: its first write copies the rows into private memory, so the shared rows never
+        change under another process. The segment stays mapped while the frame or any view of it is alive.
+
+        :param name: The name of the segment.
+        :type name: str
+        :return: A new MicroFrame reading the shared rows.
+        :rtype: MicroFrame
+        :raises FileNotFoundError: If no segment has this name.
+
+        Example::
+
+            >>> def work(name):
+            ...     mframe = MicroFrame.attach(name)
+            ...     return mframe.describe()
+
+        """
+        return cls.from_structured_array(attach_shared_values(name))
+
+    def set_index(self, column: str, sorted: bool = False):
+        """
+        Uses a column as the row labels for `loc`.
+
+        With `sorted=True` the index keeps the column in sorted order, either as a stable sort permutation or,
+        if the column is already ascending, as the column itself. Point lookups `mframe.loc[key]` and range
+        lookups `mframe.loc[a:b]` then use binary search and cost O(log n) instead of a scan over every row.
+        Range lookups return rows in label order. The column stays in the MicroFrame, and the index is rebuilt
+        on first use after the data changes.
+
+        :param column: The name of the column holding the row labels.
+        :param sorted: Whether to keep the labels sorted for binary-search lookups.
+        :raises KeyError: If the column does not exist.
+
+        Example::
+
+            >>> mframe.set_index('ts', sorted=True)
+            >>> mframe.loc['2024-01-01':'2024-01-31']
+
+        """
+        if column not in self._get_column_positions():
+            raise KeyError(f"Column '{column}' does not exist.")
+        self._index_spec = (column, sorted)
+        self._index = None
+
+    def reset_index(self):
+        """
+        Removes the row index, so row labels for `loc` are row positions again. Hash indexes created with
+        `create_hash_index` are separate from the row index and are kept.
+
+        Example::
+
+            >>> mframe.reset_index()
+
+        """
+        self._index_spec = None
+        self._index = None
+
+    @property
+    def index(self):
+        """
+        Returns the row index set with `set_index`, building it if needed.
+
+        :return: The row index, or None if no index is set.
+        :rtype: RowIndex or None
+
+        Example::
+
+            >>> mframe.index
+
+        """
+        if self._index is None and self._index_spec is not None:
+            column, is_sorted = self._index_spec
+            keys = self.values[column]
+            if is_sorted:
+                self._index = SortedIndex(keys, permutation=self._sort_cache.get(((column,), (True,), "stable")))
+            else:
+                self._index = RowIndex(keys)
+        return self._index
+
+    def create_hash_index(self, column: str):
+        """
+        Builds a hash index on a column for fast equality lookups with `lookup`.
+
+        The index maps every distinct key to the positions of its rows, so duplicate keys are supported.
+        Each lookup costs one dictionary access per key, independent of the number of rows. The index is
+        kept until the data of the column changes, and then rebuilt on the next lookup.
+
+        :param column: The name of the key column.
+        :raises KeyError: If the column does not exist.
+
+        Example::
+
+            >>> mframe.create_hash_index('customer_id')
+            >>> customers = mframe.lookup([1017, 2291])
+
+        """
+        if column not in self._get_column_positions():
+            raise KeyError(f"Column '{column}' does not exist.")
+        self._hash_indexes[column] = HashIndex(self.values[column])
+
+    def lookup(self, keys, column: Optional[str] = None):
+        """
+        Returns the rows whose key matches any of `keys`, using a hash index.
+
+        Rows are returned key by key in the order of `keys`, and in row order for duplicate keys. Keys
+        without matching rows are skipped.
+
+        :param keys: A single key or a sequence of keys to look up.
+        :param column: The hash indexed column to search. May be omitted if exactly one column has a hash index.
+        :return: A new MicroFrame holding the matching rows.
+        :rtype: MicroFrame
+        :raises ValueError: If `column` is omitted and there is not exactly one hash index, or if `column`
+            has no hash index.
+
+        Example::
+
+            >>> mframe.lookup(['C-17', 'C-42'], column='customer_id')
+
+        """
+        if column is None:
+            if len(self._hash_indexes) != 1:
+                raise ValueError("Specify the column to look up; there is not exactly one hash index.")
+            column = next(iter(self._hash_indexes))
+        if column not in self._hash_indexes:
+            raise ValueError(f"Column '{column}' has no hash index. Call create_hash_index first.")
+        return self.iloc[self._hash_index(column).lookup_positions(keys)]
+
+    def _hash_index(self, column: str) -> HashIndex:
+        """
+        Returns a hash index on a column, reusing the one created by `create_hash_index` if there is one.
+
+        Indexes for columns without `create_hash_index` are built for the caller and not kept.
+
+        :param column: The name of the key column.
+        :return: The hash index.
+        :rtype: HashIndex
+        """
+        if column not in self._hash_indexes:
+            return HashIndex(self.values[column])
+        if self._hash_indexes[column] is None:
+            self._hash_indexes[column] = HashIndex(self.values[column])
+        return self._hash_indexes[column]
+
+    def _finalize_subset(self, subset):
+        """
+        Carries this frame's bookkeeping over to a frame selected from it.
+
+        Views are registered as readers of this frame's buffer; frames whose values were copied during
+        selection share nothing and are left untracked. The row index setting is kept when the index
+        column was selected.
+
+        :param subset: The derived frame.
+        :type subset: MicroFrame
+        """
+        if np.may_share_memory(subset.values, self.values):
+            subset._references.discard(subset)
+            subset._references = self._references
+            self._references.add(subset)
+        if self._index_spec is not None and self._index_spec[0] in subset.values.dtype.fields:
+            subset._index_spec = self._index_spec
+
+    def _protect_view(self, array: np.ndarray, columns: List[str]) -> np.ndarray:
+        """
+        Makes a view of this frame's buffer read-only while writes through it would go unnoticed.
+
+        That is the case while another frame shares the buffer, where a write would bypass copy-on-write,
+        and for columns that an index or a cached sort order depends on, where a write would leave it stale.
+
+        :param array: An array returned to the caller, a view of the buffer or a copy.
+        :param columns: The columns the array covers.
+        :return: The array, marked read-only if it is a view that must not be written to.
+        :rtype: numpy.ndarray
+        """
+        guarded = self._references.has_other_referrers(self) or not self._derived_columns().isdisjoint(columns)
+        if array.flags.writeable and guarded and np.may_share_memory(array, self.values):
+            array = array.view(type(array))
+            array.flags.writeable = False
+        return array
+
+    def _derived_columns(self) -> set:
+        """
+        Returns the columns that the row index, a hash index or a cached sort order is built from.
+
+        :return: The column names.
+        :rtype: set
+        """
+        columns = set(self._hash_indexes)
+        if self._index_spec is not None:
+            columns.add(self._index_spec[0])
+        for key in self._sort_cache:
+            columns.update(key[0])
+        return columns
+
+    def _ensure_owned(self):
+        """
+        Gives this frame a private copy of its buffer if any other frame shares it.
+
+        Called before every in-place write so that the write cannot be observed through another frame.
+        """
+        if self._references.has_other_referrers(self) or not self.values.flags.writeable:
+            self._replace_values(self._packed_copy())
+
+    def _packed_copy(self) -> np.ndarray:
+        """
+        Copies the rows into a new structured array without the padding of column selections.
+
+        Views from `iloc` or `select` keep the record size of the frame they came from, so copying them
+        as they are would hold every unselected column's bytes as padding.
+
+        :return: The copy, with the fields packed back to back.
+        :rtype: numpy.ndarray
+        """
+        return self.values.astype(repack_fields(self.values.dtype))
+
+    def _prepare_for_write(self, columns: Optional[List[str]] = None):
+        """
+        Readies the frame for an in-place write: takes a private buffer if needed and drops derived caches.
+
+        :param columns: The columns about to be written, or None if any column may change.
+        """
+        self._ensure_owned()
+        self._invalidate_caches(columns)
+
+    def _invalidate_caches(self, columns: Optional[List[str]] = None):
+        """
+        Drops the structures derived from the data, so they are rebuilt from the current values on next use.
+
+        :param columns: The columns whose data changed, or None if any column may have changed.
+        """
+        if self._index_spec is not None and (columns is None or self._index_spec[0] in columns):
+            self._index = None
+        for column in self._hash_indexes:
+            if columns is None or column in columns:
+                self._hash_indexes[column] = None
+        for key in list(self._sort_cache):
+            if columns is None or any(column in columns for column in key[0]):
+                del self._sort_cache[key]
+
+    def _replace_values(self, values: np.ndarray):
+        """
+        Rebinds the frame to a newly allocated structured array that no other frame shares.
+
+        :param values: The new structured array.
+        :type values: numpy.ndarray
+        """
+        self._references.discard(self)
+        self.values = values
+        self._references = BufferReferences(self)
+        self._invalidate_caches()
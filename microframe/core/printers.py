@@ -37,14 +37,15 @@ class StructuredDataPrinter:
 
     def _truncate_value(self, value):
         """
-        Truncate a value if it exceeds the maximum length set for the column.
+        Truncate a value if it exceeds the maximum length set for the column. Byte strings are decoded, so
+        they print like text.
 
         :param value: The value to be truncated.
         :type value: str
         :return: The truncated value with an ellipsis if it exceeds the maximum length.
         :rtype: str
         """
-        str_value = str(value)
+        str_value = value.decode("utf-8", errors="replace") if isinstance(value, bytes) else str(value)
         if len(str_value) > self.max_value_length:
             return str_value[: self.max_value_length - 3] + "..."
         return str_value
@@ -0,0 +1,61 @@
+import weakref
+
+
+class BufferReferences:
+    """
+    Tracks the MicroFrame objects that share one structured buffer.
+
+    Every MicroFrame holds a BufferReferences object. Frames produced as views of another frame (for example
+    through `iloc` slicing) are added to their parent's object, so a frame can tell whether any other live frame
+    still reads its buffer before writing to it. Frames are held through weak references and drop out of the
+    set once they are garbage collected.
+
+    :param owner: The frame that allocated or adopted the buffer, if any.
+    :type owner: MicroFrame, optional
+    """
+
+    def __init__(self, owner=None):
+        """
+        Initializes the BufferReferences with an optional first referrer.
+        """
+        self._referrers = weakref.WeakSet()
+        if owner is not None:
+            self.add(owner)
+
+    def add(self, frame) -> None:
+        """
+        Registers a frame as a reader of the buffer.
+
+        :param frame: The frame sharing the buffer.
+        :type frame: MicroFrame
+        """
+        self._referrers.add(frame)
+
+    def discard(self, frame) -> None:
+        """
+        Removes a frame from the readers of the buffer, if present.
+
+        :param frame: The frame that no longer shares the buffer.
+        :type frame: MicroFrame
+        """
+        self._referrers.discard(frame)
+
+    def has_other_referrers(self, frame) -> bool:
+        """
+        Checks whether any live frame other than `frame` shares the buffer.
+
+        :param frame: The frame asking before a write.
+        :type frame: MicroFrame
+        :return: True if another frame would observe writes to the buffer.
+        :rtype: bool
+        """
+        return any(referrer is not frame for referrer in self._referrers)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of live frames sharing the buffer.
+
+        :return: The number of referrers.
+        :rtype: int
+        """
+        return len(self._referrers)
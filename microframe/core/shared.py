@@ -0,0 +1,193 @@
+import ast
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+from numpy.lib.recfunctions import repack_fields
+
+from .builders import concat
+
+_HEADER_ALIGNMENT = 64
+_LENGTH_BYTES = 8
+
+
+def create_shared_values(values: np.ndarray) -> shared_memory.SharedMemory:
+    """
+    Copies a structured array into a new shared memory segment.
+
+    The segment starts with a small header that records the dtype and the number of rows, followed by the
+    rows at a 64-byte aligned offset, so another process can attach to the segment knowing only its name.
+    Padding left by column selections is not copied.
+    The caller owns the segment and must `unlink` it once no process needs it any more.
+
+    :param values: The structured array to share.
+    :type values: numpy.ndarray
+    :return: The new segment.
+    :rtype: multiprocessing.shared_memory.SharedMemory
+    """
+    dtype = repack_fields(values.dtype, recurse=True)
+    header = {"descr": _plain_descr(dtype_to_descr(dtype)), "rows": values.shape[0], "tracker": _tracker_id()}
+    header = repr(header).encode("ascii")
+    offset = -(-(_LENGTH_BYTES + len(header)) // _HEADER_ALIGNMENT) * _HEADER_ALIGNMENT
+    segment = shared_memory.SharedMemory(create=True, size=offset + values.shape[0] * dtype.itemsize)
+    segment.buf[:_LENGTH_BYTES] = len(header).to_bytes(_LENGTH_BYTES, "little")
+    segment.buf[_LENGTH_BYTES:_LENGTH_BYTES + len(header)] = header
+    np.asarray(_SharedBuffer(segment, dtype, values.shape[0], offset, writeable=True))[:] = values
+    return segment
+
+
+def attach_shared_values(name: str, writeable: bool = False) -> np.ndarray:
+    """
+    Maps the structured array stored by `create_shared_values` into this process without copying it.
+
+    The returned array keeps the segment open for as long as it or any view of it is alive. Attaching
+    never makes this process responsible for the segment: it is not removed when this process exits, so
+    any number of independent processes can attach and the creator stays the only one to `unlink` it.
+
+    :param name: The name of the segment.
+    :type name: str
+    :param writeable: Whether the array may be written to. Writes are seen by every attached process.
+    :type writeable: bool
+    :return: The rows stored in the segment.
+    :rtype: numpy.ndarray
+    :raises FileNotFoundError: If no segment has this name.
+    """
+    if sys.version_info >= (3, 13):
+        segment = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        segment = shared_memory.SharedMemory(name=name)
+    length = int.from_bytes(segment.buf[:_LENGTH_BYTES], "little")
+    header = ast.literal_eval(bytes(segment.buf[_LENGTH_BYTES:_LENGTH_BYTES + length]).decode("ascii"))
+    tracker = _tracker_id()
+    if tracker is not None and tracker != header.get("tracker"):
+        resource_tracker.unregister(segment._name, "shared_memory")
+    offset = -(-(_LENGTH_BYTES + length) // _HEADER_ALIGNMENT) * _HEADER_ALIGNMENT
+    dtype = descr_to_dtype(header["descr"])
+    return np.asarray(_SharedBuffer(segment, dtype, header["rows"], offset, writeable=writeable))
+
+
+def map_partitions(frame, function: Callable, partitions: Optional[int] = None, workers: Optional[int] = None):
+    """
+    Applies a function to contiguous row ranges of a frame in a pool of worker processes.
+
+    The rows are copied once into a shared memory segment. Every worker attaches to the segment and
+    receives a read-only MicroFrame view of its row range, so only the segment name and the range are
+    sent to the workers instead of a pickled copy of the data. The results are concatenated in partition
+    order into one preallocated frame. The segment is removed when all partitions are done.
+
+    :param frame: The frame to process.
+    :type frame: MicroFrame
+    :param function: Called with each partition, returns a MicroFrame or a structured array. It is sent to
+        the workers by pickling, so it must be defined at module level.
+    :param partitions: The number of row ranges. Defaults to the number of workers.
+    :param workers: The number of worker processes. Defaults to the number of CPUs.
+    :return: A new MicroFrame with the results of all partitions, in row order.
+    :rtype: MicroFrame
+    :raises ValueError: If `partitions` or `workers` is smaller than 1, or the results cannot be concatenated.
+    :raises TypeError: If the function does not return a MicroFrame or a structured array.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    partitions = workers if partitions is None else partitions
+    if workers < 1 or partitions < 1:
+        raise ValueError("The number of partitions and workers must be positive.")
+
+    num_rows = frame.values.shape[0]
+    bounds = [num_rows * partition // partitions for partition in range(partitions + 1)]
+    segment = create_shared_values(frame.values)
+    try:
+        tasks = [(segment.name, start, stop, type(frame), function) for start, stop in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=min(workers, partitions)) as executor:
+            results = list(executor.map(_run_partition, tasks))
+    finally:
+        segment.close()
+        segment.unlink()
+    return concat([type(frame).from_structured_array(values) for values in results])
+
+
+def _tracker_id() -> Optional[list]:
+    """
+    Identifies the resource tracker that removes this process's shared memory segments when it exits.
+
+    Before Python 3.13, opening a segment always registers it with the opening process's tracker, which then
+    unlinks the segment at exit even though another process created it. Processes started from the creator,
+    as by `map_partitions`, share its tracker through an inherited pipe and must keep the registration, so
+    the tracker is identified by that pipe and compared with the one recorded by `create_shared_values`.
+
+    :return: The device and inode of the tracker pipe, or None if opening a segment does not register it.
+    :rtype: list or None
+    """
+    if os.name != "posix" or sys.version_info >= (3, 13):
+        return None
+    resource_tracker.ensure_running()
+    info = os.fstat(resource_tracker._resource_tracker._fd)
+    return [info.st_dev, info.st_ino]
+
+
+def _plain_descr(descr):
+    """
+    Converts a dtype description to plain Python strings, ints and tuples, whose repr `ast.literal_eval` reads.
+
+    Field names given as NumPy strings, as the names of MicroFrame columns are, would otherwise be written
+    as ``np.str_('name')``.
+
+    :param descr: A description returned by `numpy.lib.format.dtype_to_descr`, or a part of it.
+    :return: The same description built from built-in types only.
+    """
+    if isinstance(descr, str):
+        return str(descr)
+    if isinstance(descr, list):
+        return [_plain_descr(field) for field in descr]
+    if isinstance(descr, tuple):
+        return tuple(_plain_descr(part) for part in descr)
+    return int(descr)
+
+
+def _run_partition(task: tuple) -> np.ndarray:
+    """
+    Runs the function of `map_partitions` on one row range inside a worker process.
+
+    :param task: The segment name, the first and the stop row, the frame class and the function.
+    :return: The structured array of the result.
+    :rtype: numpy.ndarray
+    :raises TypeError: If the function does not return a MicroFrame or a structured array.
+    """
+    name, start, stop, frame_type, function = task
+    result = function(frame_type.from_structured_array(attach_shared_values(name)[start:stop]))
+    values = getattr(result, "values", result)
+    if not isinstance(values, np.ndarray) or values.dtype.names is None:
+        raise TypeError(f"map_partitions functions must return a MicroFrame, not {type(result).__name__}.")
+    return values
+
+
+class _SharedBuffer:
+    """
+    Exposes the rows in a shared memory segment through the NumPy array interface.
+
+    Arrays created from this object keep it, and so the segment, alive. The segment is closed only when the
+    last array is garbage collected, never while an array still points into it.
+
+    :param segment: The shared memory segment.
+    :param dtype: The structured dtype of the rows.
+    :param num_rows: The number of rows.
+    :param offset: The byte offset of the first row.
+    :param writeable: Whether arrays over the buffer may be written to.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, dtype: np.dtype, num_rows: int, offset: int,
+                 writeable: bool):
+        """
+        Initializes the _SharedBuffer with the location of the rows.
+        """
+        self.segment = segment
+        address = np.frombuffer(segment.buf, dtype=np.uint8).ctypes.data + offset
+        self.__array_interface__ = {
+            "version": 3,
+            "shape": (num_rows,),
+            "typestr": dtype.str,
+            "descr": dtype.descr,
+            "data": (address, not writeable),
+        }
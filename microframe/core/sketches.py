@@ -0,0 +1,288 @@
+import numpy as np
+from typing import Optional, Sequence
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+
+class KLLSketch:
+    """
+    A mergeable sketch of a numeric distribution for approximate quantiles (Karnin, Lang and Liberty).
+
+    Values are kept in a stack of compactors. Items on level h stand for 2**h original values, and a level
+    that outgrows its capacity is sorted and every other item, starting at a random offset, is promoted to
+    the level above. Capacities shrink geometrically towards the lower levels, so the sketch holds
+    O(k log(n / k)) values however many it has seen, and the rank error of a quantile is about 1.7 / k
+    with high probability. Batches are added and compacted with whole-array NumPy operations.
+
+    :param k: The capacity of the top level. Larger values give more accurate quantiles.
+    :type k: int
+    :param seed: Seed for the random compaction offsets, for reproducible sketches.
+    :type seed: int, optional
+    :raises ValueError: If `k` is smaller than 8.
+
+    Example:
+        >>> sketch = KLLSketch()
+        >>> for chunk in read_csv('big.csv', chunksize=100_000):
+        ...     sketch.update(chunk['latency'])
+        >>> sketch.quantiles([0.5, 0.99])
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Initializes an empty KLLSketch.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values the sketch currently stores.
+
+        :return: The number of stored values.
+        :rtype: int
+        """
+        return sum(level.shape[0] for level in self._levels)
+
+    def update(self, values: np.ndarray) -> "KLLSketch":
+        """
+        Adds a batch of values to the sketch. NaN values are ignored.
+
+        :param values: The values to add.
+        :type values: numpy.ndarray
+        :return: This sketch.
+        :rtype: KLLSketch
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Adds the values summarized by another sketch to this one.
+
+        :param other: The other sketch.
+        :type other: KLLSketch
+        :return: This sketch.
+        :rtype: KLLSketch
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for height, level in enumerate(other._levels):
+            self._levels[height] = np.concatenate((self._levels[height], level))
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """
+        Estimates quantiles of the values seen so far.
+
+        The quantiles 0 and 1 are the exact minimum and maximum.
+
+        :param quantiles: The quantiles to estimate, between 0 and 1.
+        :type quantiles: sequence of float
+        :return: One estimate per quantile, NaN if the sketch is empty.
+        :rtype: numpy.ndarray
+        :raises ValueError: If a quantile is not between 0 and 1.
+        """
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if ((quantiles < 0) | (quantiles > 1)).any():
+            raise ValueError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            return np.full(quantiles.shape, np.nan)
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(level.shape[0], 2 ** height) for height, level in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, quantiles * cumulative[-1], side="left")
+        estimates = items[order][np.minimum(positions, items.shape[0] - 1)]
+        estimates = np.clip(estimates, self.min, self.max)
+        estimates[quantiles == 0] = self.min
+        estimates[quantiles == 1] = self.max
+        return estimates
+
+    def _capacity(self, height: int) -> int:
+        """
+        Returns the capacity of a level, which shrinks by 2/3 per level below the top.
+
+        :param height: The level.
+        :return: The number of items the level may hold.
+        :rtype: int
+        """
+        depth = len(self._levels) - 1 - height
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """
+        Compacts the lowest overfull level until the sketch fits in its total capacity.
+        """
+        while sum(level.shape[0] for level in self._levels) > sum(map(self._capacity, range(len(self._levels)))):
+            height = next(
+                height for height, level in enumerate(self._levels) if level.shape[0] > self._capacity(height)
+            )
+            if height + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            items = np.sort(self._levels[height])
+            kept = items[:items.shape[0] % 2]
+            promoted = items[kept.shape[0]:][self._rng.integers(2)::2]
+            self._levels[height] = kept
+            self._levels[height + 1] = np.concatenate((self._levels[height + 1], promoted))
+
+
+class HyperLogLog:
+    """
+    A mergeable sketch for approximate distinct counts (Flajolet et al.).
+
+    Every value is hashed to 64 bits. The top `precision` bits choose one of 2**precision registers, and
+    the register keeps the largest number of trailing zero bits seen in the rest of the hash, plus one.
+    The sketch uses 2**precision bytes however many values it sees, and the relative error of the
+    estimate is about 1.04 / sqrt(2**precision), under 1% with the default precision.
+
+    Numbers, dates and durations are hashed through their bits with the splitmix64 finalizer, and text
+    through FNV-1a over its code points followed by splitmix64, all vectorized. Integers and floats are
+    hashed differently, so sketches that are merged should come from columns of the same dtype kind.
+
+    :param precision: The number of index bits, between 4 and 18.
+    :type precision: int
+    :raises ValueError: If `precision` is out of range.
+
+    Example:
+        >>> sketch = HyperLogLog()
+        >>> for chunk in read_csv('big.csv', chunksize=100_000):
+        ...     sketch.update(chunk['user_id'])
+        >>> sketch.estimate()
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Initializes an empty HyperLogLog.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, values: np.ndarray) -> "HyperLogLog":
+        """
+        Adds a batch of values to the sketch. NaN values are ignored.
+
+        :param values: The values to add.
+        :type values: numpy.ndarray
+        :return: This sketch.
+        :rtype: HyperLogLog
+        """
+        hashes = hash_values(np.asarray(values).ravel())
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        lowest_bit = rest & (~rest + np.uint64(1))
+        with np.errstate(divide="ignore"):
+            rank = np.where(rest == 0, rest_bits + 1, np.log2(lowest_bit.astype(np.float64)) + 1)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Adds the values summarized by another sketch to this one.
+
+        :param other: The other sketch.
+        :type other: HyperLogLog
+        :return: This sketch.
+        :rtype: HyperLogLog
+        :raises ValueError: If the sketches have different precisions.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        """
+        Estimates the number of distinct values seen so far.
+
+        :return: The estimated distinct count.
+        :rtype: int
+        """
+        size = self.registers.shape[0]
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(size, 0.7213 / (1 + 1.079 / size))
+        raw = alpha * size * size / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * size and empty > 0:
+            return int(round(size * np.log(size / empty)))
+        return int(round(raw))
+
+
+def hash_values(values: np.ndarray) -> np.ndarray:
+    """
+    Hashes the values of a one-dimensional array to uint64, dropping NaN values.
+
+    :param values: The values to hash: numbers, booleans, dates, durations or text.
+    :type values: numpy.ndarray
+    :return: One 64-bit hash per value.
+    :rtype: numpy.ndarray
+    :raises TypeError: If the dtype cannot be hashed.
+    """
+    kind = values.dtype.kind
+    if kind == "f":
+        values = values.astype(np.float64)
+        values = values[~np.isnan(values)] + 0.0
+        bits = values.view(np.uint64)
+    elif kind in "iub":
+        bits = values.astype(np.int64).view(np.uint64)
+    elif kind in "mM":
+        bits = values.view(np.int64).view(np.uint64)
+    elif kind in "US":
+        bits = _fnv1a(values)
+    else:
+        raise TypeError(f"Cannot hash values of dtype {values.dtype}.")
+    return _splitmix64(bits)
+
+
+def _fnv1a(values: np.ndarray) -> np.ndarray:
+    """
+    Hashes fixed-width strings with FNV-1a over their code points, one character position at a time.
+
+    Padding at the end of shorter strings is skipped, so a string hashes the same in any width.
+
+    :param values: A ``U`` or ``S`` array.
+    :return: One hash per string.
+    :rtype: numpy.ndarray
+    """
+    code_type = np.uint32 if values.dtype.kind == "U" else np.uint8
+    width = values.dtype.itemsize // np.dtype(code_type).itemsize
+    codes = np.ascontiguousarray(values).view(code_type).reshape(values.shape[0], width).astype(np.uint64)
+    hashes = np.full(values.shape[0], _FNV_OFFSET, dtype=np.uint64)
+    for position in range(width):
+        code = codes[:, position]
+        hashes = np.where(code != 0, (hashes ^ code) * _FNV_PRIME, hashes)
+    return hashes
+
+
+def _splitmix64(bits: np.ndarray) -> np.ndarray:
+    """
+    Mixes 64-bit integers with the splitmix64 finalizer, so that similar inputs get unrelated hashes.
+
+    :param bits: The input bits.
+    :return: The mixed bits.
+    :rtype: numpy.ndarray
+    """
+    bits = bits + np.uint64(0x9E3779B97F4A7C15)
+    bits = (bits ^ (bits >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    bits = (bits ^ (bits >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return bits ^ (bits >> np.uint64(31))
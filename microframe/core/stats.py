@@ -0,0 +1,241 @@
+import numpy as np
+from collections import namedtuple
+from typing import List, Optional, Sequence
+from .config import parallel_map
+
+Moments = namedtuple("Moments", ["count", "mean", "m2", "min", "max"])
+Moments.__doc__ = """
+Summary of the non-NaN values of a column, or of several columns when the fields are arrays.
+
+:ivar count: The number of values.
+:ivar mean: The mean of the values, 0 when there are none.
+:ivar m2: The sum of squared deviations from the mean.
+:ivar min: The smallest value, NaN when there are none.
+:ivar max: The largest value, NaN when there are none.
+"""
+
+EMPTY_MOMENTS = Moments(0, 0.0, 0.0, np.nan, np.nan)
+
+
+def merge_moments(first: Moments, second: Moments) -> Moments:
+    """
+    Combines the moments of two disjoint sets of values with the parallel formulas of Chan et al.
+
+    Works on scalars and, element by element, on arrays.
+
+    :param first: The moments of the first set.
+    :param second: The moments of the second set.
+    :return: The moments of both sets together.
+    :rtype: Moments
+    """
+    count = first.count + second.count
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(count > 0, second.count / np.maximum(count, 1), 0.0)
+    delta = second.mean - first.mean
+    return Moments(
+        count,
+        first.mean + delta * weight,
+        first.m2 + second.m2 + delta * delta * first.count * weight,
+        np.fmin(first.min, second.min),
+        np.fmax(first.max, second.max),
+    )
+
+
+def column_moments(column: np.ndarray, block_size: int = 65536) -> Moments:
+    """
+    Computes the moments of a numeric column in one pass, ignoring NaN values.
+
+    The column is read once, one cache-sized block at a time. Every block is converted to float64, reduced
+    to its count, mean, sum of squared deviations, minimum and maximum while it is still in the cache, and
+    merged into the running moments.
+
+    :param column: The numeric column.
+    :type column: numpy.ndarray
+    :param block_size: The number of values per block.
+    :type block_size: int
+    :return: The moments of the column.
+    :rtype: Moments
+    """
+    moments = EMPTY_MOMENTS
+    has_nan = column.dtype.kind == "f"
+    for start in range(0, column.shape[0], block_size):
+        block = np.array(column[start:start + block_size], dtype=np.float64)
+        if has_nan:
+            block = block[~np.isnan(block)]
+        if block.size == 0:
+            continue
+        minimum, maximum = block.min(), block.max()
+        mean = block.mean()
+        np.subtract(block, mean, out=block)
+        moments = merge_moments(moments, Moments(block.size, mean, np.dot(block, block), minimum, maximum))
+    return moments
+
+
+def column_quantiles(column: np.ndarray, quantiles: Sequence[float]) -> np.ndarray:
+    """
+    Computes quantiles of a numeric column with one partition, ignoring NaN values.
+
+    All order statistics needed by the quantiles are placed with a single `numpy.partition` call, and
+    quantiles between two of them are interpolated linearly, as by `numpy.quantile`.
+
+    :param column: The numeric column.
+    :type column: numpy.ndarray
+    :param quantiles: The quantiles to compute, between 0 and 1.
+    :type quantiles: sequence of float
+    :return: One value per quantile, NaN if the column has no values.
+    :rtype: numpy.ndarray
+    """
+    quantiles = np.asarray(quantiles, dtype=np.float64)
+    values = np.array(column, dtype=np.float64)
+    if column.dtype.kind == "f":
+        values = values[~np.isnan(values)]
+    if values.size == 0 or quantiles.size == 0:
+        return np.full(quantiles.shape, np.nan)
+    positions = quantiles * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, values.size - 1)
+    values.partition(np.unique(np.concatenate((lower, upper))))
+    return values[lower] + (values[upper] - values[lower]) * (positions - lower)
+
+
+def numeric_columns(values: np.ndarray) -> List[str]:
+    """
+    Returns the names of the integer and floating point fields of a structured array.
+
+    :param values: The structured array.
+    :return: The numeric field names, in order.
+    :rtype: list
+    """
+    return [name for name in values.dtype.names if values.dtype.fields[name][0].kind in "iuf"]
+
+
+def summary_frame(frame_type, columns: List[str], moments: Moments, quantiles: Optional[dict] = None):
+    """
+    Builds the table returned by `MicroFrame.describe`.
+
+    The table has a ``stats`` column naming each statistic (count, mean, std, the requested quantiles and
+    min and max), followed by one float64 column per summarized column. The standard deviation is the
+    sample standard deviation; statistics of columns without values are NaN.
+
+    :param frame_type: The MicroFrame class to create.
+    :param columns: The summarized column names.
+    :param moments: The moments of the columns, with one array entry per column.
+    :param quantiles: A dictionary mapping row labels such as ``"50%"`` to one value per column.
+    :return: A new MicroFrame with the summary.
+    :rtype: MicroFrame
+    """
+    count = np.asarray(moments.count, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rows = {
+            "count": count,
+            "mean": np.where(count > 0, moments.mean, np.nan),
+            "std": np.where(count > 1, np.sqrt(moments.m2 / (count - 1)), np.nan),
+        }
+    rows.update(quantiles or {})
+    rows["min"] = moments.min
+    rows["max"] = moments.max
+
+    labels = list(rows)
+    dtype = [("stats", f"U{max(map(len, labels))}")] + [(name, np.float64) for name in columns]
+    values = np.empty(len(labels), dtype=dtype)
+    values["stats"] = labels
+    for position, name in enumerate(columns):
+        values[name] = [rows[label][position] for label in labels]
+    return frame_type.from_structured_array(values)
+
+
+class StatsAccumulator:
+    """
+    Mergeable running statistics of numeric columns, for data that arrives in chunks.
+
+    Each `update` folds the count, mean, sum of squared deviations, minimum and maximum of every column of a
+    chunk into the running state with the parallel formulas of Chan et al., and `merge` combines the states
+    of accumulators that saw different chunks, for example in different processes. The results are exact
+    up to floating point rounding and do not depend on how the data was split, so a file far larger than
+    memory can be summarized chunk by chunk. Columns are summarized in parallel when several threads are
+    configured with `set_option`.
+
+    :param columns: The columns to summarize. If None, the numeric columns of the first chunk are used.
+    :type columns: list, optional
+    :param block_size: The number of values per block when a chunk column is read.
+    :type block_size: int
+
+    Example:
+        >>> accumulator = StatsAccumulator()
+        >>> for chunk in read_csv('big.csv', chunksize=100_000):
+        ...     accumulator.update(chunk)
+        >>> accumulator.to_frame().head()
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, block_size: int = 65536):
+        """
+        Initializes the StatsAccumulator with no data seen.
+        """
+        self.columns = None if columns is None else list(columns)
+        self.block_size = block_size
+        self.moments = None if columns is None else _empty_moments(len(self.columns))
+
+    def update(self, frame) -> "StatsAccumulator":
+        """
+        Adds the rows of a chunk to the statistics.
+
+        :param frame: The chunk.
+        :type frame: MicroFrame
+        :return: This accumulator.
+        :rtype: StatsAccumulator
+        :raises KeyError: If the chunk lacks a summarized column.
+        """
+        if self.columns is None:
+            self.columns = numeric_columns(frame.values)
+            self.moments = _empty_moments(len(self.columns))
+        for column in self.columns:
+            if column not in frame.values.dtype.fields:
+                raise KeyError(f"Column '{column}' does not exist.")
+        chunk = parallel_map(lambda column: column_moments(frame.values[column], self.block_size), self.columns)
+        chunk = Moments(*np.array(chunk, dtype=np.float64).reshape(-1, len(Moments._fields)).T)
+        self.moments = merge_moments(self.moments, chunk)
+        return self
+
+    def merge(self, other: "StatsAccumulator") -> "StatsAccumulator":
+        """
+        Adds the statistics of another accumulator, which saw different rows, to this one.
+
+        :param other: The other accumulator.
+        :type other: StatsAccumulator
+        :return: This accumulator.
+        :rtype: StatsAccumulator
+        :raises ValueError: If both accumulators have seen data for different columns.
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns, self.moments = list(other.columns), other.moments
+            return self
+        if self.columns != other.columns:
+            raise ValueError(f"Cannot merge statistics of columns {other.columns} into {self.columns}.")
+        self.moments = merge_moments(self.moments, other.moments)
+        return self
+
+    def to_frame(self):
+        """
+        Returns the statistics in the layout of `MicroFrame.describe`, without percentiles.
+
+        :return: A new MicroFrame with count, mean, std, min and max of every column.
+        :rtype: MicroFrame
+        """
+        from .microframe import MicroFrame
+
+        if self.columns is None:
+            return summary_frame(MicroFrame, [], _empty_moments(0))
+        return summary_frame(MicroFrame, self.columns, self.moments)
+
+
+def _empty_moments(size: int) -> Moments:
+    """
+    Returns the moments of `size` columns without values.
+
+    :param size: The number of columns.
+    :return: The empty moments, one array entry per column.
+    :rtype: Moments
+    """
+    return Moments(np.zeros(size), np.zeros(size), np.zeros(size), np.full(size, np.nan), np.full(size, np.nan))
@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Any
+
+
+def fit_text_dtype(column: np.ndarray, kind: str = "S") -> np.dtype:
+    """
+    Returns the narrowest text dtype that holds every value of a column.
+
+    Byte strings (``S``) store one byte per character and are used only for ASCII text. Text with other
+    characters falls back to ``U``, which stores four bytes per character, so every ``S`` column can be
+    decoded as ASCII and compared with Python strings.
+
+    :param column: The column. Non-text columns are measured by their string form.
+    :type column: numpy.ndarray
+    :param kind: ``"S"`` to prefer byte strings, ``"U"`` for unicode strings.
+    :type kind: str
+    :return: ``S<n>`` or ``U<n>``, where n is the length of the longest value and at least 1.
+    :rtype: numpy.dtype
+    """
+    if column.dtype.kind not in "SU":
+        column = column.astype(str)
+    width = max(int(np.char.str_len(column).max()), 1) if column.shape[0] > 0 else 1
+    if kind == "S" and (column.dtype.kind == "S" or is_ascii(column)):
+        return np.dtype(f"S{width}")
+    return np.dtype(f"U{width}")
+
+
+def is_ascii(column: np.ndarray) -> bool:
+    """
+    Checks whether a unicode (``U``) column holds only ASCII characters.
+
+    :param column: The column.
+    :type column: numpy.ndarray
+    :return: True if every character is below code point 128.
+    :rtype: bool
+    """
+    codes = np.ascontiguousarray(column).view(np.uint32)
+    return codes.size == 0 or int(codes.max()) < 128
+
+
+def encode_text(value: Any) -> Any:
+    """
+    Encodes Python strings, sequences of strings and unicode arrays for comparison with a byte string column.
+
+    :param value: A constant, a list of constants or an array.
+    :return: The value with every string encoded as UTF-8 bytes; other values are returned unchanged.
+    """
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (list, tuple, set)):
+        return [encode_text(item) for item in value]
+    if isinstance(value, np.ndarray) and value.dtype.kind == "U":
+        return np.char.encode(value, "utf-8")
+    return value
+
+
+def as_text_kind(column: np.ndarray, kind: str) -> np.ndarray:
+    """
+    Converts a text column to byte strings (``S``) or unicode strings (``U``) so it compares with another.
+
+    Byte strings are encoded and decoded as UTF-8, which keeps the order of the values, so sorted keys stay
+    sorted. Columns that are not text, or already of the requested kind, are returned unchanged.
+
+    :param column: The column.
+    :type column: numpy.ndarray
+    :param kind: ``"S"`` or ``"U"``, the text kind of the other column.
+    :type kind: str
+    :return: The converted column.
+    :rtype: numpy.ndarray
+    """
+    if column.dtype.kind == "U" and kind == "S":
+        return np.char.encode(column, "utf-8")
+    if column.dtype.kind == "S" and kind == "U":
+        return np.char.decode(column, "utf-8")
+    return column
+
+
+class ByteStringColumn(np.ndarray):
+    """
+    A byte string (``S``) column that compares with Python strings and unicode arrays.
+
+    NumPy never finds bytes equal to str, so ``column == "ab"`` on a plain ``S`` array is False everywhere.
+    This view encodes the str operands of comparisons first, and returns plain arrays from every operation.
+    Its values are still bytes, for example when read with ``column[0]`` or `tolist`.
+    """
+
+    _COMPARISONS = (np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Runs a ufunc on the plain arrays, encoding text operands of comparisons.
+        """
+        inputs = [np.asarray(value) if isinstance(value, ByteStringColumn) else value for value in inputs]
+        if "out" in kwargs:
+            kwargs["out"] = tuple(
+                np.asarray(value) if isinstance(value, ByteStringColumn) else value for value in kwargs["out"]
+            )
+        if method == "__call__" and ufunc in self._COMPARISONS:
+            inputs = [encode_text(value) for value in inputs]
+        return getattr(ufunc, method)(*inputs, **kwargs)
@@ -1 +1 @@
-from .readers import read_csv
+from .readers import read_csv, scan_csv
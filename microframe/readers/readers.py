@@ -1,18 +1,46 @@
-from .utils.csv_utils import open_csv, infer_column_dtypes
+from typing import Iterator, List, Optional, Union
+from .utils.csv_utils import (
+    open_csv, iter_csv_chunks, infer_column_dtypes, infer_datetime_formats, fit_text_dtypes, project_columns
+)
+from ..core.datetimes import ISO_FORMAT
 from ..core.microframe import MicroFrame
+from ..core.lazy import LazyFrame, Scan
 
 
-def read_csv(file_path: str) -> MicroFrame:
+def read_csv(
+        file_path: str,
+        usecols: Optional[List[str]] = None,
+        chunksize: Optional[int] = None,
+        compact_strings: bool = False,
+        date_formats: Optional[List[str]] = None,
+) -> Union[MicroFrame, Iterator[MicroFrame]]:
     """
     Reads a CSV file and constructs a `MicroFrame` object from it.
 
     The function reads the CSV file specified by `file_path`, infers the data types of its columns, and returns a
     `MicroFrame` object containing the data and inferred data types.
 
+    With `chunksize`, the file is read lazily and an iterator of MicroFrames with at most `chunksize` rows each is
+    returned instead, so files larger than memory can be processed chunk by chunk. The data types are inferred
+    from the first chunk and used for all chunks.
+
     :param file_path: The path to the CSV file to be read.
     :type file_path: str
-    :return: A `MicroFrame` object containing the data from the CSV file.
-    :rtype: MicroFrame
+    :param usecols: Names of the columns to load, kept in file order. If None, all columns are loaded.
+    :type usecols: list, optional
+    :param chunksize: The number of rows per chunk. If None, the whole file is read into one MicroFrame.
+    :type chunksize: int, optional
+    :param compact_strings: Whether to fit text columns to their longest value instead of using ``U100``,
+        storing ASCII text as byte strings (``S<n>``) with one byte per character. Text with other characters
+        falls back to ``U<n>``. Queries and printing treat byte string columns like text. With `chunksize`,
+        every chunk is fitted separately.
+    :type compact_strings: bool
+    :param date_formats: `datetime.strptime` formats of date columns that are not ISO 8601, for example
+        ``["%d/%m/%Y %H:%M"]``. ISO 8601 dates and timestamps are always detected. Date columns are parsed
+        in bulk into ``datetime64[s]``, or ``datetime64[ns]`` when any value has fractional seconds.
+    :type date_formats: list, optional
+    :return: A `MicroFrame` object containing the data from the CSV file, or an iterator of chunks.
+    :rtype: MicroFrame or iterator
     :raises FileNotFoundError: If the specified file does not exist.
     :raises csv.Error: If an error occurs during CSV reading.
     :raises TypeError: If the contents of the CSV file are not in the expected format.
@@ -22,7 +50,14 @@ def read_csv(file_path: str) -> MicroFrame:
         >>> from microframe.readers.readers import read_csv
         >>> microframe = read_csv('path/to/your.csv')
         >>> print(microframe)
+        >>> for chunk in read_csv('path/to/big.csv', chunksize=100_000):
+        ...     accumulator.update(chunk)
     """
+    if chunksize is not None:
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive.")
+        return _read_csv_chunks(file_path, usecols, chunksize, compact_strings, date_formats)
+
     csv_content = open_csv(file_path)
     if not csv_content or not csv_content[0]:
         raise ValueError("The CSV file is empty or does not contain headers.")
@@ -33,5 +68,95 @@ def read_csv(file_path: str) -> MicroFrame:
     if not data:
         raise ValueError("The CSV file does not contain data rows.")
 
-    dtypes = infer_column_dtypes(data)
-    return MicroFrame(data, dtypes, columns)
+    if usecols is not None:
+        columns, data = project_columns(columns, data, usecols)
+
+    dtypes = infer_column_dtypes(data, date_formats)
+    formats = infer_datetime_formats(data[0], date_formats)
+    return _build_frame(data, dtypes, columns, formats, compact_strings)
+
+
+def _read_csv_chunks(
+        file_path: str,
+        usecols: Optional[List[str]],
+        chunksize: int,
+        compact_strings: bool = False,
+        date_formats: Optional[List[str]] = None,
+) -> Iterator[MicroFrame]:
+    """
+    Reads a CSV file lazily as MicroFrames of at most `chunksize` rows.
+
+    :param file_path: The path to the CSV file to be read.
+    :param usecols: Names of the columns to load, or None for all columns.
+    :param chunksize: The number of rows per chunk.
+    :param compact_strings: Whether to fit the text columns of every chunk to its longest value.
+    :param date_formats: Formats of date columns that are not ISO 8601.
+    :return: An iterator of MicroFrames.
+    :rtype: iterator
+    :raises ValueError: If the CSV file is empty or does not contain data rows.
+    """
+    dtypes = None
+    for columns, data in iter_csv_chunks(file_path, chunksize):
+        if usecols is not None:
+            columns, data = project_columns(columns, data, usecols)
+        if dtypes is None:
+            dtypes = infer_column_dtypes(data, date_formats)
+            formats = infer_datetime_formats(data[0], date_formats)
+        yield _build_frame(data, dtypes, columns, formats, compact_strings)
+    if dtypes is None:
+        raise ValueError("The CSV file does not contain data rows.")
+
+
+def _build_frame(data: list, dtypes: list, columns: list, formats: list, compact_strings: bool) -> MicroFrame:
+    """
+    Builds a MicroFrame from CSV rows, parsing date columns in bulk.
+
+    ISO 8601 dates are parsed by NumPy while the rows are stored. Columns in other date formats are stored
+    as fitted text first and then converted with one vectorized parse per format.
+
+    :param data: The data rows.
+    :param dtypes: The inferred data types.
+    :param columns: The column names.
+    :param formats: The detected date format of every column, or None for columns that are not dates.
+    :param compact_strings: Whether to fit the text columns to their longest value.
+    :return: The new MicroFrame.
+    :rtype: MicroFrame
+    """
+    custom = {
+        position: date_format for position, date_format in enumerate(formats)
+        if date_format not in (None, ISO_FORMAT) and dtypes[position].startswith("datetime64")
+    }
+    build_dtypes = ["U100" if position in custom else dtype for position, dtype in enumerate(dtypes)]
+    if compact_strings or custom:
+        fitted = fit_text_dtypes(data, build_dtypes)
+        build_dtypes = [
+            fitted[position] if compact_strings or position in custom else dtype
+            for position, dtype in enumerate(build_dtypes)
+        ]
+    frame = MicroFrame(data, build_dtypes, columns)
+    for date_format in set(custom.values()):
+        frame.change_dtypes(
+            {frame.columns[position]: dtypes[position] for position, value in custom.items() if value == date_format},
+            date_format=date_format,
+        )
+    return frame
+
+
+def scan_csv(file_path: str) -> LazyFrame:
+    """
+    Starts a lazy query plan that reads a CSV file.
+
+    Nothing is read until `collect` is called. The optimizer pushes projections into the read, so only the
+    columns the plan uses are loaded, and applies pushed down filters right after loading.
+
+    :param file_path: The path to the CSV file to be read.
+    :type file_path: str
+    :return: An empty plan reading the CSV file.
+    :rtype: LazyFrame
+
+    Example:
+        >>> from microframe.readers.readers import scan_csv
+        >>> plan = scan_csv('path/to/your.csv').filter("price > 10").select(['price'])
+        >>> microframe = plan.collect()
+    """
+    return LazyFrame(Scan(file_path, reader=read_csv))
@@ -1,4 +1,9 @@
 import csv
+from itertools import islice
+from operator import itemgetter
+from typing import List, Optional
+
+from ...core.datetimes import detect_datetime_format, datetime_unit
 
 
 def open_csv(file_path: str) -> list:
@@ -28,6 +33,70 @@ def open_csv(file_path: str) -> list:
         raise csv.Error(f"An error occurred while reading the CSV file: {str(e)}")
 
 
+def iter_csv_chunks(file_path: str, chunksize: int):
+    """
+    Reads a CSV file lazily, a fixed number of rows at a time.
+
+    Only one chunk of rows is held in memory at once, so files larger than memory can be processed.
+
+    :param file_path: The path to the CSV file.
+    :type file_path: str
+    :param chunksize: The maximum number of data rows per chunk.
+    :type chunksize: int
+    :return: An iterator of ``(header, rows)`` tuples, where `rows` is a list of at most `chunksize` rows.
+    :rtype: iterator
+    :raises TypeError: If the provided file_path is not a string.
+    :raises FileNotFoundError: If no file exists at the given file_path.
+    :raises csv.Error: If there's an error reading the CSV file.
+    :raises ValueError: If the CSV file is empty or does not contain headers.
+    """
+    if not isinstance(file_path, str):
+        raise TypeError("The file_path must be a string.")
+
+    try:
+        with open(file_path, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file, delimiter=",")
+            header = next(reader, None)
+            if not header:
+                raise ValueError("The CSV file is empty or does not contain headers.")
+            while True:
+                rows = list(islice(reader, chunksize))
+                if not rows:
+                    return
+                yield header, rows
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file at path {file_path} does not exist.")
+    except csv.Error as e:
+        raise csv.Error(f"An error occurred while reading the CSV file: {str(e)}")
+
+
+def project_columns(header: list, data: list, usecols: list) -> tuple:
+    """
+    Keeps only the named columns of CSV contents, in file order.
+
+    :param header: The header row of the CSV.
+    :type header: list
+    :param data: The data rows of the CSV.
+    :type data: list
+    :param usecols: The names of the columns to keep.
+    :type usecols: list
+    :return: The projected header and the projected data rows.
+    :rtype: tuple
+    :raises ValueError: If a requested column is not in the header.
+    """
+    missing = [name for name in usecols if name not in header]
+    if missing:
+        raise ValueError(f"Columns {missing} are not in the CSV header.")
+
+    wanted = set(usecols)
+    positions = [position for position, name in enumerate(header) if name in wanted]
+    if len(positions) == 1:
+        position = positions[0]
+        return [header[position]], [[row[position]] for row in data]
+    getter = itemgetter(*positions)
+    return list(getter(header)), [list(getter(row)) for row in data]
+
+
 def is_float(string: str) -> bool:
     """
     Checks if a given string can be converted to a float.
@@ -44,12 +113,19 @@ def is_float(string: str) -> bool:
         return False
 
 
-def infer_column_dtypes(data: list) -> list:
+def infer_column_dtypes(data: list, date_formats: Optional[List[str]] = None) -> list:
     """
     Infers the data types of columns based on the first row of the data.
 
+    Numbers become ``float32``. ISO 8601 dates and timestamps, and values matching one of `date_formats`,
+    become ``datetime64[s]``, or ``datetime64[ns]`` when any value of the column has fractional seconds.
+    Other values become ``U100`` text.
+
     :param data: A 2D list where each inner list represents a data row.
     :type data: list
+    :param date_formats: Additional `datetime.strptime` formats to recognize as dates, for example
+        ``["%d/%m/%Y"]``.
+    :type date_formats: list, optional
     :return: A list of inferred data types for each column.
     :rtype: list
     :raises TypeError: If the provided data is not a list or if the first row is not a list.
@@ -69,7 +145,50 @@ def infer_column_dtypes(data: list) -> list:
     numeric_default_type = "float32"
     string_default_type = "U100"
 
-    return [
-        numeric_default_type if is_float(item) else string_default_type
-        for item in data[0]
-    ]
+    dtypes = []
+    for position, (item, date_format) in enumerate(zip(data[0], infer_datetime_formats(data[0], date_formats))):
+        if is_float(item):
+            dtypes.append(numeric_default_type)
+        elif date_format is not None:
+            dtypes.append(f"datetime64[{datetime_unit([row[position] for row in data], date_format)}]")
+        else:
+            dtypes.append(string_default_type)
+    return dtypes
+
+
+def infer_datetime_formats(row: list, date_formats: Optional[List[str]] = None) -> list:
+    """
+    Detects which values of a row are dates, and in which format.
+
+    :param row: A data row.
+    :type row: list
+    :param date_formats: Additional `datetime.strptime` formats to recognize as dates.
+    :type date_formats: list, optional
+    :return: One entry per value: the detected format (``"ISO8601"`` for ISO 8601) or None if it is not a date.
+    :rtype: list
+    """
+    return [None if is_float(item) else detect_datetime_format(item, date_formats) for item in row]
+
+
+def fit_text_dtypes(data: list, dtypes: list) -> list:
+    """
+    Narrows the text dtypes of inferred columns to the longest value in the data.
+
+    Columns whose values are all ASCII are stored as byte strings (``S<n>``), one byte per character;
+    columns with other characters fall back to unicode strings (``U<n>``), four bytes per character.
+
+    :param data: A 2D list where each inner list represents a data row.
+    :type data: list
+    :param dtypes: The inferred data types, one per column.
+    :type dtypes: list
+    :return: The data types with every text type fitted to the data.
+    :rtype: list
+    """
+    fitted = list(dtypes)
+    for position, dtype in enumerate(dtypes):
+        if not dtype.startswith("U"):
+            continue
+        cells = [row[position] for row in data]
+        width = max(max(map(len, cells), default=1), 1)
+        fitted[position] = f"S{width}" if all(map(str.isascii, cells)) else f"U{width}"
+    return fitted
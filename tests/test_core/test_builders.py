@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.builders import concat, promote_dtypes, MicroFrameBuilder
+
+
+@pytest.fixture
+def first_microframe():
+    return MicroFrame([["1", "a"], ["2", "b"]], ["int32", "U1"], ["num", "char"])
+
+
+@pytest.fixture
+def second_microframe():
+    return MicroFrame([["2.5", "ccc"]], ["float64", "U3"], ["num", "char"])
+
+
+def test_concat_promotes_dtypes(first_microframe, second_microframe):
+    result = concat([first_microframe, second_microframe, first_microframe])
+
+    assert result.values.dtype == np.dtype([("num", np.float64), ("char", "U3")])
+    assert result.values.tolist() == [(1.0, "a"), (2.0, "b"), (2.5, "ccc"), (1.0, "a"), (2.0, "b")]
+
+
+def test_concat_errors(first_microframe):
+    renamed = first_microframe.copy()
+    renamed.rename({"num": "number"})
+    text = MicroFrame([["x", "y"]], ["U1", "U1"], ["num", "char"])
+
+    with pytest.raises(ValueError):
+        concat([])
+    with pytest.raises(ValueError):
+        concat([first_microframe, renamed])
+    with pytest.raises(ValueError):
+        concat([first_microframe, text])
+
+
+def test_promote_dtypes():
+    promoted = promote_dtypes(np.dtype([("a", "i2"), ("b", "U2")]), np.dtype([("a", "i8"), ("b", "U1")]))
+    assert promoted == np.dtype([("a", "i8"), ("b", "U2")])
+
+
+def test_builder_grows_geometrically(first_microframe):
+    builder = MicroFrameBuilder(first_microframe.dtypes, capacity=2)
+    capacities = set()
+    for _ in range(100):
+        builder.append([(7, "z")])
+        capacities.add(builder.capacity)
+
+    assert len(builder) == 100
+    assert capacities == {2, 4, 8, 16, 32, 64, 128}
+    assert builder.build().shape == (100, 2)
+
+
+def test_builder_appends_frames_and_arrays(first_microframe, second_microframe):
+    builder = MicroFrameBuilder.from_values(first_microframe.values)
+    builder.append(second_microframe)
+    builder.append(first_microframe.values[:1])
+
+    result = builder.build()
+    assert result.values.tolist() == [(1.0, "a"), (2.0, "b"), (2.5, "ccc"), (1.0, "a")]
+    assert not np.may_share_memory(result.values, builder.values)
+
+
+def test_microframe_append_reuses_capacity(first_microframe):
+    first_microframe.append([(3, "c")])
+    buffer = first_microframe._builder._buffer
+    first_microframe.append([(4, "d")])
+
+    assert first_microframe._builder._buffer is buffer
+    assert list(first_microframe["num"]) == [1, 2, 3, 4]
+    assert first_microframe.shape == (4, 2)
+
+
+def test_microframe_append_keeps_views_and_caches_consistent(first_microframe, second_microframe):
+    view = first_microframe.iloc[:]
+    first_microframe.create_hash_index("char")
+    first_microframe.append(second_microframe)
+    first_microframe.iloc[0, 0] = 10.0
+
+    assert view.shape == (2, 2)
+    assert list(view["num"]) == [1, 2]
+    assert list(first_microframe.lookup("ccc")["num"]) == [2.5]
+    assert list(first_microframe["num"]) == [10.0, 2.0, 2.5]
@@ -0,0 +1,53 @@
+import threading
+import pytest
+import numpy as np
+from microframe.core import config
+from microframe.core.config import get_option, set_option, parallel_map, row_blocks
+from microframe.core.microframe import MicroFrame
+
+
+@pytest.fixture
+def four_threads():
+    set_option("threads", 4)
+    yield
+    set_option("threads", 1)
+
+
+def test_set_and_get_option(four_threads):
+    assert get_option("threads") == 4
+    with pytest.raises(ValueError):
+        set_option("threads", 0)
+    with pytest.raises(KeyError):
+        set_option("colour", 1)
+    with pytest.raises(KeyError):
+        get_option("colour")
+
+
+def test_parallel_map_keeps_order_and_uses_pool(four_threads):
+    names = parallel_map(lambda item: (item, threading.current_thread().name), range(20))
+
+    assert [item for item, _ in names] == list(range(20))
+    assert all(name.startswith("microframe") for _, name in names)
+    assert parallel_map(lambda item: parallel_map(lambda inner: inner * item, [1, 2]), [3]) == [[3, 6]]
+
+
+def test_row_blocks(four_threads):
+    assert row_blocks(10) == [(0, 10)]
+    blocks = row_blocks(4 * config._MIN_BLOCK_ROWS + 3)
+    assert len(blocks) == 4
+    assert blocks[0][0] == 0 and blocks[-1][1] == 4 * config._MIN_BLOCK_ROWS + 3
+    assert all(previous[1] == following[0] for previous, following in zip(blocks, blocks[1:]))
+
+
+def test_threaded_operations_match_serial(four_threads):
+    rng = np.random.default_rng(0)
+    values = np.empty(300_000, dtype=[("a", np.float64), ("b", np.int32), ("c", np.float32)])
+    values["a"], values["b"], values["c"] = rng.random(300_000), rng.integers(0, 9, 300_000), 1.5
+    mframe = MicroFrame.from_structured_array(values)
+
+    threaded = (mframe.describe().values, mframe.to_numpy(), mframe.query("a > 0.5 and b < 4").values)
+    set_option("threads", 1)
+    serial = (mframe.describe().values, mframe.to_numpy(), mframe.query("a > 0.5 and b < 4").values)
+
+    for threaded_result, serial_result in zip(threaded, serial):
+        assert np.array_equal(threaded_result, serial_result)
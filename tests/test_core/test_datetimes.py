@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from microframe.core.datetimes import ISO_FORMAT, datetime_unit, detect_datetime_format, parse_datetimes
+
+
+def test_detect_datetime_format():
+    assert detect_datetime_format("2024-01-31") == ISO_FORMAT
+    assert detect_datetime_format("2024-01-31T12:00:00.250") == ISO_FORMAT
+    assert detect_datetime_format("31/01/2024", ["%m/%d/%Y", "%d/%m/%Y"]) == "%d/%m/%Y"
+    assert detect_datetime_format("31/01/2024") is None
+    assert detect_datetime_format("EU") is None
+    assert datetime_unit(["2024-01-31 12:00:00.5"], ISO_FORMAT) == "ns"
+    assert datetime_unit(["2024-01-31"], ISO_FORMAT) == "s"
+    assert datetime_unit(np.array([b"2024-01-01", b"2024-01-02 10:00:00.25"]), ISO_FORMAT) == "ns"
+
+
+def test_parse_fixed_width_format():
+    column = np.array(["31/01/2024 10:30", "", "29/02/2024 00:05"])
+
+    parsed = parse_datetimes(column, "s", "%d/%m/%Y %H:%M")
+
+    expected = np.array(["2024-01-31T10:30", "NaT", "2024-02-29T00:05"], dtype="datetime64[s]")
+    np.testing.assert_array_equal(parsed, expected)
+    assert parsed.dtype == np.dtype("datetime64[s]")
+
+
+@pytest.mark.parametrize("value", ["30/02/2024 00:00", "3x/01/2024 00:00", "1/1/2024 0:0x", "31/01/2024 10:300"])
+def test_parse_fixed_width_format_errors(value):
+    with pytest.raises(ValueError):
+        parse_datetimes(np.array([value]), "s", "%d/%m/%Y %H:%M")
+
+
+def test_parse_fixed_width_format_accepts_unpadded_values():
+    column = np.array(["01/02/2024", "1/3/2024", "", "15/12/2024"])
+
+    parsed = parse_datetimes(column, "s", "%d/%m/%Y")
+
+    expected = np.array(["2024-02-01", "2024-03-01", "NaT", "2024-12-15"], dtype="datetime64[s]")
+    np.testing.assert_array_equal(parsed, expected)
+
+
+def test_parse_other_formats():
+    np.testing.assert_array_equal(parse_datetimes(np.array(["2024-01-05 10:00:00.5"]), "ns"),
+                                  np.array(["2024-01-05T10:00:00.5"], dtype="datetime64[ns]"))
+    np.testing.assert_array_equal(parse_datetimes(np.array(["Jan 05 2024"]), "s", "%b %d %Y"),
+                                  np.array(["2024-01-05"], dtype="datetime64[s]"))
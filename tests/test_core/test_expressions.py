@@ -0,0 +1,132 @@
+import ast
+import pytest
+import numpy as np
+from microframe.core import expressions
+from microframe.core.expressions import Expression, ExpressionError, compile_expression
+
+
+@pytest.fixture
+def values():
+    return np.array(
+        [(5.0, "EU", 1), (12.0, "EU", 2), (20.0, "US", 3), (11.0, "EU", 4)],
+        dtype=[("price", "f8"), ("region", "U2"), ("qty", "i4")],
+    )
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("price > 10", [False, True, True, True]),
+        ("price > 10 and region == 'EU'", [False, True, False, True]),
+        ("region == 'US' or qty < 2", [True, False, True, False]),
+        ("(price > 10) & ~(region == 'US')", [False, True, False, True]),
+        ("not price > 10", [True, False, False, False]),
+        ("10 < price <= 12", [False, True, False, True]),
+        ("region in ['US', 'XX']", [False, False, True, False]),
+        ("qty not in (1, 4)", [False, True, True, False]),
+        ("price * qty >= 24", [False, True, True, True]),
+        ("True", [True, True, True, True]),
+    ],
+)
+def test_expression_mask(values, source, expected):
+    assert Expression(source).mask(values).tolist() == expected
+
+
+def test_expression_short_circuits_rows(values, monkeypatch):
+    seen_rows = {}
+    compile_name = Expression._compile_name
+
+    def recording_compile_name(self, name):
+        lookup = compile_name(self, name)
+
+        def recording_lookup(values, rows, variables):
+            seen_rows[name] = None if rows is None else rows.tolist()
+            return lookup(values, rows, variables)
+
+        return recording_lookup
+
+    monkeypatch.setattr(Expression, "_compile_name", recording_compile_name)
+
+    Expression("price > 10 and region == 'EU' or qty == 1").mask(values)
+    assert seen_rows == {"price": None, "region": [1, 2, 3], "qty": [0, 2]}
+
+
+def test_expression_arithmetic(values):
+    result = Expression("price * qty + 1").evaluate(values)
+    assert result.tolist() == [6.0, 25.0, 61.0, 45.0]
+
+
+def test_expression_variables(values):
+    assert Expression("price > limit").mask(values, {"limit": 15}).tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize("source", ["price >", "price.real > 1", "abs(price) > 1", "lambda: 1"])
+def test_expression_invalid_syntax(source):
+    with pytest.raises(ExpressionError):
+        Expression(source)
+
+
+@pytest.mark.parametrize("source", ["missing > 1", "price + 1", "price > 'a' + 1"])
+def test_expression_evaluation_errors(values, source):
+    with pytest.raises(ExpressionError):
+        Expression(source).mask(values)
+
+
+def test_compile_expression_is_cached():
+    assert compile_expression("price > 1") is compile_expression("price > 1")
+
+
+def test_expression_does_not_modify_boolean_columns():
+    flags = np.array([(True, 1), (False, 2)], dtype=[("flag", "?"), ("qty", "i4")])
+    assert Expression("flag and qty > 1").mask(flags).tolist() == [False, False]
+    assert flags["flag"].tolist() == [True, False]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 4, 100])
+@pytest.mark.parametrize(
+    "source",
+    ["(price * qty + 1) / qty", "-price ** 2 + offset", "price > 10 and region == 'EU'", "qty", "2 * 3"],
+)
+def test_evaluate_blocks_matches_evaluate(values, source, block_size):
+    expression = Expression(source)
+    expected = np.broadcast_to(expression.evaluate(values, variables={"offset": 3}), values.shape)
+
+    result = expression.evaluate_blocks(values, block_size=block_size, variables={"offset": 3})
+
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected)
+
+
+def test_evaluate_blocks_reuses_scratch_buffers(values, monkeypatch):
+    allocations = []
+    original_multiply = np.multiply
+
+    def counting_multiply(*args, **kwargs):
+        if "out" not in kwargs:
+            allocations.append(args)
+        return original_multiply(*args, **kwargs)
+
+    monkeypatch.setitem(expressions._BINARY_OPERATORS, ast.Mult, counting_multiply)
+    out = np.zeros(4)
+
+    Expression("price * qty").evaluate_blocks(values, out=out, block_size=1)
+
+    assert len(allocations) == 1
+    assert list(out) == [5.0, 24.0, 60.0, 44.0]
+
+
+def test_byte_string_columns_compare_with_text():
+    values = np.array([(b"EU", 1), (b"US", 2), (b"APAC", 3)], dtype=[("region", "S4"), ("qty", "i4")])
+
+    assert list(Expression("region == 'EU'").mask(values)) == [True, False, False]
+    assert list(Expression("region in ['US', 'APAC']").mask(values)) == [False, True, True]
+    assert list(Expression("'F' > region").mask(values)) == [True, False, True]
+    names = {"name": np.array(["EU", "US", "X"])}
+    assert list(Expression("region != name").mask(values, names)) == [False, False, True]
+
+
+def test_date_columns_compare_with_text():
+    values = np.array([("2024-01-05",), ("2024-02-05",)], dtype=[("ts", "datetime64[s]")])
+
+    assert list(Expression("ts >= '2024-02-01'").mask(values)) == [False, True]
+    assert list(Expression("ts in ['2024-01-05']").mask(values)) == [True, False]
@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.groupby import GroupBy
+
+
+@pytest.fixture
+def sales_microframe():
+    data = [
+        ["US", "2023", "5", "1"],
+        ["EU", "2023", "12", "2"],
+        ["US", "2024", "nan", "3"],
+        ["EU", "2023", "11", "4"],
+        ["US", "2023", "7", "5"],
+    ]
+    return MicroFrame(data, ["U2", "int32", "float64", "int32"], ["region", "year", "price", "qty"])
+
+
+def test_groupby_single_key(sales_microframe):
+    result = sales_microframe.groupby("region").agg({"price": ["sum", "mean", "count", "min", "max"]})
+
+    assert list(result.columns) == ["region", "price_sum", "price_mean", "price_count", "price_min", "price_max"]
+    assert list(result.values["region"]) == ["EU", "US"]
+    assert list(result.values["price_sum"]) == [23.0, 12.0]
+    assert list(result.values["price_mean"]) == [11.5, 6.0]
+    assert list(result.values["price_count"]) == [2, 2]
+    assert list(result.values["price_min"]) == [11.0, 5.0]
+    assert list(result.values["price_max"]) == [12.0, 7.0]
+
+
+def test_groupby_multiple_keys(sales_microframe):
+    result = sales_microframe.groupby(["region", "year"]).agg({"qty": ["sum", "count"]})
+
+    assert result.values.tolist() == [("EU", 2023, 6, 2), ("US", 2023, 6, 2), ("US", 2024, 3, 1)]
+    assert result.values.dtype["qty_sum"] == np.int64
+    assert result.values.dtype["qty_count"] == np.int64
+
+
+def test_groupby_text_min_max(sales_microframe):
+    sales_microframe["city"] = np.array(["NY", "Oslo", "Austin", "Berlin", "LA"])
+    sales_microframe["code"] = np.array([b"ny", b"os", b"au", b"be", b"la"])
+
+    result = sales_microframe.groupby("year").agg({"city": ["min", "max"], "code": ["min", "max"]})
+
+    assert list(result.values["city_min"]) == ["Berlin", "Austin"]
+    assert list(result.values["city_max"]) == ["Oslo", "Austin"]
+    assert list(result.values["code_min"]) == [b"be", b"au"]
+    assert list(result.values["code_max"]) == [b"os", b"au"]
+
+
+def test_groupby_matches_python_loop():
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 50, size=1000)
+    amounts = rng.random(1000)
+    values = np.empty(1000, dtype=[("key", np.int64), ("amount", np.float64)])
+    values["key"], values["amount"] = keys, amounts
+    mframe = MicroFrame.from_structured_array(values)
+
+    result = mframe.groupby("key").agg({"amount": ["sum", "max"]})
+
+    expected_keys = np.unique(keys)
+    assert np.array_equal(result.values["key"], expected_keys)
+    assert np.allclose(result.values["amount_sum"], [amounts[keys == key].sum() for key in expected_keys])
+    assert np.allclose(result.values["amount_max"], [amounts[keys == key].max() for key in expected_keys])
+
+
+def test_groupby_nan_keys_form_one_group():
+    values = np.array([(np.nan, 1), (1.0, 2), (np.nan, 3)], dtype=[("key", np.float64), ("qty", np.int64)])
+    result = MicroFrame.from_structured_array(values).groupby("key").agg({"qty": "sum"})
+
+    assert result.shape == (2, 2)
+    assert list(result.values["qty_sum"]) == [2, 4]
+
+
+def test_groupby_without_keys_and_empty_frame(sales_microframe):
+    total = GroupBy(sales_microframe, []).agg({"qty": "sum"})
+    empty = sales_microframe.filter(np.zeros(5, dtype=bool)).groupby("region").agg({"price": ["mean", "count"]})
+
+    assert total.values.tolist() == [(15,)]
+    assert empty.shape == (0, 3)
+    assert empty.values.dtype["price_count"] == np.int64
+
+
+def test_groupby_errors(sales_microframe):
+    with pytest.raises(KeyError):
+        sales_microframe.groupby("missing")
+    with pytest.raises(KeyError):
+        sales_microframe.groupby("region").agg({"missing": "sum"})
+    with pytest.raises(ValueError):
+        sales_microframe.groupby("region").agg({"price": "median"})
+    with pytest.raises(ValueError):
+        sales_microframe.groupby("year").agg({"region": "sum"})
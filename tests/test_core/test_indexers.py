@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from microframe.core.indexers import StructuredArrayIndexer, IlocIndexer
+from microframe.core.indexers import StructuredArrayIndexer, IlocIndexer, LocIndexer
 from microframe.core.microframe import MicroFrame
 
 values = np.array([(1, "a"), (2, "b"), (3, "c")], dtype=[("num", "i4"), ("char", "U1")])
@@ -140,3 +140,164 @@ def test_iloc_indexer_setitem_microframe(default_microframe):
     iloc_indexer[2, 1] = "Test"  # Set a value in the third row, second column
     assert default_microframe.values[2][1] == "Test"
 
+
+
+def test_iloc_indexer_getitem_column_is_view(default_microframe):
+    iloc_indexer = IlocIndexer(default_microframe.values, default_microframe.columns, return_type=MicroFrame)
+    result = iloc_indexer[:, 0]
+    assert list(result.columns) == ["num"]
+    assert np.shares_memory(result.values, default_microframe.values)
+    assert np.array_equal(result.values["num"], [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize("row_index, expected", [(0, (1.0, "a")), (-1, (3.0, "c"))])
+def test_iloc_indexer_getitem_row_is_view(default_microframe, row_index, expected):
+    iloc_indexer = IlocIndexer(default_microframe.values, default_microframe.columns, return_type=MicroFrame)
+    result = iloc_indexer[row_index]
+    assert result.shape == (1, 2)
+    assert tuple(result.values[0]) == expected
+    assert np.shares_memory(result.values, default_microframe.values)
+
+
+def test_iloc_indexer_getitem_row_and_column(default_microframe):
+    iloc_indexer = IlocIndexer(default_microframe.values, default_microframe.columns, return_type=MicroFrame)
+    result = iloc_indexer[1:, 1]
+    assert np.array_equal(result.values, np.array([("b",), ("c",)], dtype=[("char", "<U100")]))
+    assert iloc_indexer[2, 1] == "c"
+
+
+@pytest.mark.parametrize("row_index", [3, -4])
+def test_iloc_indexer_getitem_row_out_of_bounds(default_microframe, row_index):
+    iloc_indexer = IlocIndexer(default_microframe.values, default_microframe.columns, return_type=MicroFrame)
+    with pytest.raises(IndexError):
+        _ = iloc_indexer[row_index]
+
+
+@pytest.fixture
+def wide_microframe():
+    data = [["1", "a", "10"], ["2", "b", "20"], ["3", "c", "30"], ["4", "d", "40"]]
+    dtypes = ["int32", "U1", "float64"]
+    columns = ["num", "char", "value"]
+    return MicroFrame(data, dtypes, columns)
+
+
+@pytest.mark.parametrize(
+    "row_index, expected_nums",
+    [
+        (np.array([True, False, True, False]), [1, 3]),
+        ([3, 0], [4, 1]),
+        (np.array([-1]), [4]),
+        (np.array([], dtype=int), []),
+    ],
+)
+def test_iloc_indexer_getitem_fancy_rows(wide_microframe, row_index, expected_nums):
+    result = wide_microframe.iloc[row_index]
+    assert list(result.columns) == ["num", "char", "value"]
+    assert list(result.values["num"]) == expected_nums
+    assert not np.shares_memory(result.values, wide_microframe.values)
+
+
+@pytest.mark.parametrize(
+    "col_index, expected_columns",
+    [
+        ([0, 2], ["num", "value"]),
+        (slice(1, None), ["char", "value"]),
+        (np.array([False, True, True]), ["char", "value"]),
+    ],
+)
+def test_iloc_indexer_getitem_column_list(wide_microframe, col_index, expected_columns):
+    result = wide_microframe.iloc[:2, col_index]
+    assert list(result.columns) == expected_columns
+    assert result.shape == (2, len(expected_columns))
+    assert np.shares_memory(result.values, wide_microframe.values)
+
+
+def test_iloc_indexer_getitem_mask_and_column_list_is_packed(wide_microframe):
+    mask = wide_microframe["value"] > 15
+    result = wide_microframe.iloc[mask, [2, 0]]
+
+    assert list(result.columns) == ["value", "num"]
+    assert result.values.dtype == np.dtype([("value", "f8"), ("num", "i4")])
+    assert list(result.values["value"]) == [20.0, 30.0, 40.0]
+    assert list(result.values["num"]) == [2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "idx",
+    [
+        (np.array([True, False]), 0),
+        ([0, 10], 0),
+        (slice(None), np.array([True, False])),
+        (slice(None), [0, 5]),
+    ],
+)
+def test_iloc_indexer_getitem_fancy_invalid(wide_microframe, idx):
+    with pytest.raises(IndexError):
+        _ = wide_microframe.iloc[idx]
+
+
+def test_iloc_indexer_setitem_mask_and_column_list(wide_microframe):
+    mask = np.array([True, False, False, True])
+    wide_microframe.iloc[mask, [0, 2]] = 0
+
+    assert list(wide_microframe.values["num"]) == [0, 2, 3, 0]
+    assert list(wide_microframe.values["value"]) == [0.0, 20.0, 30.0, 0.0]
+
+    wide_microframe.iloc[[1, 2], [0, 2]] = np.array([[7, 70], [8, 80]])
+    assert list(wide_microframe.values["num"]) == [0, 7, 8, 0]
+    assert list(wide_microframe.values["value"]) == [0.0, 70.0, 80.0, 0.0]
+
+
+def test_loc_indexer_instantiation(wide_microframe):
+    loc_indexer = LocIndexer(wide_microframe.values, wide_microframe.columns, return_type=MicroFrame)
+    assert isinstance(loc_indexer, LocIndexer)
+    assert loc_indexer.column_positions == {"num": 0, "char": 1, "value": 2}
+
+
+@pytest.mark.parametrize(
+    "idx, expected_columns, expected_nums",
+    [
+        ((slice(None), ["value", "num"]), ["value", "num"], [1, 2, 3, 4]),
+        ((slice(1, 2), slice("num", "char")), ["num", "char"], [2, 3]),
+        (([3, 1], slice(None)), ["num", "char", "value"], [4, 2]),
+        (slice(None, 1), ["num", "char", "value"], [1, 2]),
+        (slice(3, 1, -1), ["num", "char", "value"], [4, 3, 2]),
+        (slice(3, 0, -1), ["num", "char", "value"], [4, 3, 2, 1]),
+        (slice(None, None, -2), ["num", "char", "value"], [4, 2]),
+        (2, ["num", "char", "value"], [3]),
+    ],
+)
+def test_loc_indexer_getitem(wide_microframe, idx, expected_columns, expected_nums):
+    result = wide_microframe.loc[idx]
+    assert isinstance(result, MicroFrame)
+    assert list(result.columns) == expected_columns
+    assert list(result.values["num"]) == expected_nums
+
+
+def test_loc_indexer_getitem_single_column(wide_microframe):
+    result = wide_microframe.loc[:, "char"]
+    assert list(result.columns) == ["char"]
+    assert np.shares_memory(result.values, wide_microframe.values)
+    assert wide_microframe.loc[1, "char"] == "b"
+
+
+@pytest.mark.parametrize(
+    "idx",
+    [
+        (slice(None), "missing"),
+        (slice(None), ["num", "missing"]),
+        (10, "num"),
+        (-1, "num"),
+    ],
+)
+def test_loc_indexer_getitem_missing_label(wide_microframe, idx):
+    with pytest.raises(KeyError):
+        _ = wide_microframe.loc[idx]
+
+
+def test_loc_indexer_setitem(wide_microframe):
+    wide_microframe.loc[[0, 3], "value"] = -1.0
+    assert list(wide_microframe.values["value"]) == [-1.0, 20.0, 30.0, -1.0]
+
+    with pytest.raises(ValueError):
+        wide_microframe.loc[0] = 1
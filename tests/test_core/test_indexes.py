@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+from microframe.core.indexes import RowIndex, SortedIndex, HashIndex, expand_ranges
+
+
+@pytest.fixture
+def unsorted_keys():
+    return np.array([30, 10, 20, 10, 40], dtype="i8")
+
+
+@pytest.mark.parametrize("index_type", [RowIndex, SortedIndex, HashIndex])
+def test_get_locs(unsorted_keys, index_type):
+    index = index_type(unsorted_keys)
+    assert sorted(np.asarray(index.get_locs(10)).tolist()) == [1, 3]
+    assert np.asarray(index.get_locs(40)).tolist() == [4]
+
+
+@pytest.mark.parametrize("index_type", [RowIndex, SortedIndex, HashIndex])
+def test_get_locs_missing(unsorted_keys, index_type):
+    with pytest.raises(KeyError):
+        index_type(unsorted_keys).get_locs(25)
+
+
+@pytest.mark.parametrize("index_type", [RowIndex, SortedIndex, HashIndex])
+def test_get_indexer(unsorted_keys, index_type):
+    index = index_type(unsorted_keys)
+    assert index.get_indexer([40, 10]).tolist() == [4, 1, 3]
+    with pytest.raises(KeyError):
+        index.get_indexer([40, 25])
+
+
+def test_sorted_index_slice_locs_in_label_order(unsorted_keys):
+    index = SortedIndex(unsorted_keys)
+    assert index.slice_locs(15, 35).tolist() == [2, 0]
+    assert index.slice_locs(None, 10).tolist() == [1, 3]
+    assert index.slice_locs(35, None).tolist() == [4]
+    assert index.slice_locs(50, 60).tolist() == []
+
+
+def test_row_index_slice_locs_in_row_order(unsorted_keys):
+    index = RowIndex(unsorted_keys)
+    assert index.slice_locs(15, 35).tolist() == [0, 2]
+
+
+def test_sorted_index_on_sorted_keys_returns_slices():
+    index = SortedIndex(np.array([1.0, 2.0, 2.0, 5.0], dtype="f4"))
+    assert index.permutation is None
+    assert index.get_locs(2.0) == slice(1, 3)
+    assert index.slice_locs(1.5, 5.0) == slice(1, 4)
+
+
+def test_sorted_index_coerces_float_labels():
+    index = SortedIndex(np.array([0.1, 0.2, 0.3], dtype="f4"))
+    assert index.get_locs(0.2) == slice(1, 2)
+
+
+def test_sorted_index_with_string_keys():
+    index = SortedIndex(np.array(["b", "c", "a"]))
+    assert index.get_locs("a").tolist() == [2]
+    assert index.slice_locs("a", "b").tolist() == [2, 0]
+
+
+def test_expand_ranges():
+    assert expand_ranges(np.array([5, 0, 3]), np.array([7, 0, 4])).tolist() == [5, 6, 3]
+    assert expand_ranges(np.array([1]), np.array([1])).tolist() == []
+
+
+def test_hash_index_lookup_positions_skips_missing(unsorted_keys):
+    index = HashIndex(unsorted_keys)
+    assert index.lookup_positions([10, 25, 30]).tolist() == [1, 3, 0]
+    assert index.lookup_positions(25).tolist() == []
+
+
+def test_hash_index_with_string_and_float_keys():
+    strings = HashIndex(np.array(["C-1", "C-2", "C-1"]))
+    assert strings.get_locs("C-1").tolist() == [0, 2]
+
+    floats = HashIndex(np.array([0.1, 0.2], dtype="f4"))
+    assert floats.get_locs(0.2).tolist() == [1]
+
+
+def test_hash_index_empty_keys():
+    index = HashIndex(np.array([], dtype="i8"))
+    assert index.buckets == {}
+    assert index.lookup_positions([1]).tolist() == []
+
+
+@pytest.mark.parametrize(
+    "keys", [np.array([5, 3, 5, 9]), np.array([5, 3, 5, 9]) * 10**6, np.array(["b", "a", "b", "c"])]
+)
+def test_hash_index_probe(keys):
+    index = HashIndex(keys)
+    probes = np.concatenate((keys[[3, 0]], keys[:1] + keys[:1]))
+
+    starts, stops = index.probe(probes)
+
+    assert list(stops - starts) == [1, 2, 0]
+    assert list(index.permutation[starts[1]:stops[1]]) == [0, 2]
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from microframe.core.interop import ColumnBuffer
+from microframe.core.microframe import MicroFrame
+
+
+@pytest.fixture
+def mframe():
+    data = [["1", "a", "1.5"], ["2", "b", "2.5"], ["3", "c", "3.5"]]
+    return MicroFrame(data, ["int64", "U1", "float64"], ["id", "name", "price"])
+
+
+def test_array_export_is_a_stable_read_only_view(mframe):
+    rows = np.asarray(mframe)
+    assert np.shares_memory(rows, mframe.values)
+    assert not rows.flags.writeable
+
+    mframe["price"] = 0.0
+    assert list(rows["price"]) == [1.5, 2.5, 3.5]
+    assert list(mframe["price"]) == [0.0, 0.0, 0.0]
+
+    copied = np.array(mframe, copy=True)
+    assert copied.flags.writeable and not np.shares_memory(copied, mframe.values)
+    with pytest.raises(ValueError):
+        ColumnBuffer(mframe.values["id"]).__array__(dtype=np.float64, copy=False)
+
+
+def test_column_buffer(mframe):
+    buffer = mframe.column_buffer("price")
+    assert len(buffer) == 3 and buffer.dtype == np.float64
+
+    interface = buffer.__array_interface__
+    assert interface["data"][1] is True
+    assert interface["strides"] == (mframe.values.dtype.itemsize,)
+
+    prices = np.asarray(buffer)
+    assert np.shares_memory(prices, mframe.values)
+    view = buffer.as_memoryview()
+    assert view.readonly and view.shape == (3,)
+    assert list(np.asarray(view)) == [1.5, 2.5, 3.5]
+    assert np.asarray(buffer, dtype=np.float32).dtype == np.float32
+    with pytest.raises(KeyError):
+        mframe.column_buffer("missing")
@@ -0,0 +1,127 @@
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.joins import join
+
+
+@pytest.fixture
+def orders():
+    data = [["3", "10.5"], ["1", "4.0"], ["3", "2.5"], ["7", "1.0"]]
+    return MicroFrame(data, ["int64", "float64"], ["customer", "amount"])
+
+
+@pytest.fixture
+def customers():
+    data = [["1", "Ann", "5"], ["2", "Bob", "6"], ["3", "Cy", "7"]]
+    return MicroFrame(data, ["int64", "U3", "int32"], ["customer", "name", "amount"])
+
+
+def test_inner_join(orders, customers):
+    result = orders.join(customers, on="customer")
+
+    assert list(result.columns) == ["customer", "amount", "name", "amount_right"]
+    assert result.values.tolist() == [(3, 10.5, "Cy", 7), (1, 4.0, "Ann", 5), (3, 2.5, "Cy", 7)]
+
+
+def test_left_join_fills_missing(orders, customers):
+    result = orders.join(customers, on="customer", how="left")
+
+    assert list(result.values["customer"]) == [3, 1, 3, 7]
+    assert list(result.values["name"]) == ["Cy", "Ann", "Cy", ""]
+    assert result.values.dtype["amount_right"] == np.float64
+    assert np.isnan(result.values["amount_right"][3])
+
+
+def test_outer_join_coalesces_key(orders, customers):
+    result = orders.join(customers, on="customer", how="outer")
+
+    assert list(result.values["customer"]) == [3, 1, 3, 7, 2]
+    assert result.values["name"][4] == "Bob"
+    assert np.isnan(result.values["amount"][4])
+
+
+def test_outer_join_key_keeps_integer_dtype(orders, customers):
+    result = orders.join(customers, on="customer", how="outer")
+
+    assert result.values.dtype["customer"] == np.int64
+
+
+def test_outer_join_key_holds_both_text_widths():
+    left = MicroFrame([["ab", "1"]], ["U2", "int64"], ["key", "x"])
+    right = MicroFrame([["longkey", "2"], ["ab", "3"]], ["U7", "int64"], ["key", "y"])
+    ascii_left = MicroFrame([["ab", "1"]], ["S2", "int64"], ["key", "x"])
+    text_right = MicroFrame([["zürich", "2"]], ["U6", "int64"], ["key", "y"])
+
+    assert list(left.join(right, on="key", how="outer")["key"]) == ["ab", "longkey"]
+    assert list(ascii_left.join(text_right, on="key", how="outer")["key"]) == ["ab", "zürich"]
+
+
+def test_hash_join_builds_on_smaller_left_side(orders, customers):
+    result = customers.join(orders, on="customer", suffix="_order")
+
+    assert result.values.tolist() == [(1, "Ann", 5, 4.0), (3, "Cy", 7, 10.5), (3, "Cy", 7, 2.5)]
+    assert list(result.columns)[-1] == "amount_order"
+
+
+def test_sort_merge_join_matches_hash_join():
+    rng = np.random.default_rng(1)
+    left = np.empty(500, dtype=[("key", np.int64), ("a", np.float64)])
+    left["key"], left["a"] = np.sort(rng.integers(0, 100, 500)), rng.random(500)
+    right = np.empty(80, dtype=[("key", np.int64), ("b", np.int32)])
+    right["key"], right["b"] = np.sort(rng.integers(0, 100, 80)), np.arange(80)
+
+    merged = join(MicroFrame.from_structured_array(left), MicroFrame.from_structured_array(right), "key", "outer")
+    hashed = join(
+        MicroFrame.from_structured_array(left.copy()),
+        MicroFrame.from_structured_array(right[::-1].copy()),
+        "key",
+        "outer",
+    )
+
+    expected = sorted(
+        (int(lk), float(a), int(b)) for lk, a in left.tolist() for rk, b in right.tolist() if lk == rk
+    )
+    inner = merged.values[~np.isnan(merged.values["b"])]
+    assert sorted((int(k), a, int(b)) for k, a, b in inner.tolist()) == expected
+    assert merged.shape == hashed.shape
+    assert sorted(map(str, merged.values.tolist())) == sorted(map(str, hashed.values.tolist()))
+
+
+def test_join_reuses_hash_index(orders, customers):
+    customers.create_hash_index("customer")
+    index = customers._hash_indexes["customer"]
+
+    orders.join(customers, on="customer")
+
+    assert customers._hash_indexes["customer"] is index
+
+
+def test_join_errors(orders, customers):
+    with pytest.raises(KeyError):
+        orders.join(customers, on="name")
+    with pytest.raises(ValueError):
+        orders.join(customers, on="customer", how="cross")
+
+
+def test_hash_join_with_narrow_integer_keys():
+    keys = np.arange(-100, 101, dtype=np.int8)
+    left = np.empty(keys.shape[0], dtype=[("key", np.int8), ("a", np.int16)])
+    left["key"], left["a"] = keys, keys
+    right = np.empty(keys.shape[0], dtype=[("key", np.int8), ("b", np.int16)])
+    right["key"], right["b"] = keys[::-1], keys[::-1]
+
+    result = join(MicroFrame.from_structured_array(left), MicroFrame.from_structured_array(right), "key")
+
+    assert result.values.shape[0] == keys.shape[0]
+    assert (result.values["a"] == result.values["b"]).all()
+
+
+@pytest.mark.parametrize("left_kind, right_kind", [("S", "U"), ("U", "S")])
+def test_join_matches_byte_and_unicode_keys(left_kind, right_kind):
+    left = MicroFrame([["b", "1"], ["a", "2"], ["c", "3"]], [f"{left_kind}1", "int64"], ["key", "x"])
+    right = MicroFrame([["a", "10"], ["b", "20"]], [f"{right_kind}1", "int64"], ["key", "y"])
+    sorted_left = MicroFrame([["a", "2"], ["b", "1"]], [f"{left_kind}1", "int64"], ["key", "x"])
+
+    assert left.join(right, on="key").values[["x", "y"]].tolist() == [(1, 20), (2, 10)]
+    assert right.join(left, on="key").values[["y", "x"]].tolist() == [(10, 2), (20, 1)]
+    assert sorted_left.join(right, on="key").values[["x", "y"]].tolist() == [(2, 10), (1, 20)]
@@ -0,0 +1,133 @@
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.lazy import LazyFrame, PlanStep, Scan
+
+
+@pytest.fixture
+def sales_microframe():
+    data = [["5", "EU", "1"], ["12", "EU", "2"], ["20", "US", "3"], ["11", "EU", "4"]]
+    return MicroFrame(data, ["float64", "U2", "int32"], ["price", "region", "qty"])
+
+
+def test_lazy_records_without_executing(sales_microframe):
+    plan = sales_microframe.lazy().filter("price > 10").select(["price"])
+
+    assert isinstance(plan, LazyFrame)
+    assert plan.steps == [PlanStep("filter", "price > 10"), PlanStep("select", ["price"])]
+    assert sales_microframe.shape == (4, 3)
+
+
+def test_lazy_collect_matches_eager(sales_microframe):
+    result = (
+        sales_microframe.lazy()
+        .rename({"price": "unit_price"})
+        .cast({"qty": "float64"})
+        .filter("unit_price > 10 and region == 'EU'")
+        .select(["unit_price", "qty"])
+        .collect()
+    )
+
+    assert list(result.columns) == ["unit_price", "qty"]
+    assert list(result.values["unit_price"]) == [12.0, 11.0]
+    assert result.values.dtype["qty"] == np.float64
+    assert list(sales_microframe.columns) == ["price", "region", "qty"]
+
+
+def test_lazy_optimize_pushes_filter_and_projection_into_scan(sales_microframe):
+    plan = (
+        sales_microframe.lazy()
+        .rename({"price": "unit_price"})
+        .cast({"qty": "float64", "region": "U5"})
+        .filter("unit_price > 10")
+        .select(["unit_price", "qty"])
+        .optimize()
+    )
+
+    assert plan.scan.predicates == ["price > 10"]
+    assert plan.scan.columns == ["price", "qty"]
+    assert plan.steps == [
+        PlanStep("rename", {"price": "unit_price"}),
+        PlanStep("cast", {"qty": "float64"}),
+        PlanStep("select", ["unit_price", "qty"]),
+    ]
+
+
+def test_lazy_optimize_keeps_filter_after_cast_of_its_columns(sales_microframe):
+    plan = sales_microframe.lazy().cast({"qty": "float64"}).filter("qty > 1.5").optimize()
+
+    assert plan.scan.predicates == []
+    assert [step.kind for step in plan.steps] == ["cast", "filter"]
+
+
+def test_lazy_optimize_merges_adjacent_steps(sales_microframe):
+    plan = (
+        sales_microframe.lazy()
+        .cast({"qty": "int64"})
+        .cast({"qty": "float64", "price": "float32"})
+        .rename({"price": "p"})
+        .rename({"p": "unit_price", "qty": "quantity"})
+        .filter("unit_price > 1")
+        .filter("quantity < 4")
+        .optimize()
+    )
+
+    assert plan.scan.predicates == []
+    assert plan.steps == [
+        PlanStep("cast", {"qty": "float64", "price": "float32"}),
+        PlanStep("filter", "price > 1 and qty < 4"),
+        PlanStep("rename", {"price": "unit_price", "qty": "quantity"}),
+    ]
+
+
+def test_lazy_optimize_drops_dead_columns(sales_microframe):
+    plan = (
+        sales_microframe.lazy()
+        .rename({"region": "area"})
+        .cast({"region": "U5"})
+        .agg({"price": ["sum", "max"]})
+        .optimize()
+    )
+
+    assert plan.scan.columns == ["price"]
+    assert [step.kind for step in plan.steps] == ["aggregate"]
+
+
+def test_lazy_select_of_renamed_column_fails_like_eager(sales_microframe):
+    plan = sales_microframe.lazy().rename({"price": "p"}).select(["price"])
+
+    with pytest.raises(KeyError):
+        plan.collect()
+    eager = sales_microframe.copy()
+    eager.rename({"price": "p"})
+    with pytest.raises(KeyError):
+        eager.loc[:, ["price"]]
+
+
+def test_lazy_agg(sales_microframe):
+    spec = {"price": ["sum", "mean", "count"], "qty": "max"}
+    result = sales_microframe.lazy().filter("region == 'EU'").agg(spec).collect()
+
+    assert list(result.columns) == ["price_sum", "price_mean", "price_count", "qty_max"]
+    assert result.values[0].tolist() == (28.0, pytest.approx(28.0 / 3), 3, 4)
+
+
+def test_lazy_agg_unsupported():
+    with pytest.raises(ValueError):
+        LazyFrame(Scan(None)).agg({"price": "median"})
+
+
+def test_lazy_explain(sales_microframe):
+    plan = sales_microframe.lazy().filter("price > 10").select(["price"])
+
+    explained = plan.explain()
+    assert explained.splitlines()[0] == "SCAN MicroFrame (4, 3) columns=['price'] filter=price > 10"
+    assert "FILTER price > 10" in plan.explain(optimized=False)
+
+
+def test_lazy_groupby_agg(sales_microframe):
+    plan = sales_microframe.lazy().filter("price > 6").groupby("region").agg({"qty": "sum"})
+
+    assert plan.steps[-1] == PlanStep("aggregate", (("region",), {"qty": ["sum"]}))
+    assert plan.optimize().scan.columns == ["region", "qty", "price"]
+    assert plan.collect().values.tolist() == [("EU", 6), ("US", 3)]
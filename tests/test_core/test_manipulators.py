@@ -123,3 +123,120 @@ def test_to_numpy_empty_array():
     expected = np.empty((0, 2))
     np.testing.assert_array_equal(result, expected)
 
+
+
+@pytest.fixture
+def float_manipulator():
+    values = np.array(
+        [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)],
+        dtype=[("a", "f4"), ("b", "f4"), ("c", "f4")],
+    )
+    return StructuredArrayManipulator(values, np.array(["a", "b", "c"]))
+
+
+def test_to_numpy_homogeneous_returns_view(float_manipulator):
+    result = float_manipulator.to_numpy()
+
+    assert result.dtype == np.float32
+    assert np.shares_memory(result, float_manipulator.values)
+    np.testing.assert_array_equal(result, [[1, 2, 3], [4, 5, 6]])
+
+
+def test_to_numpy_column_subset_view(float_manipulator):
+    result = float_manipulator.to_numpy(columns=["b", "c"])
+
+    assert np.shares_memory(result, float_manipulator.values)
+    np.testing.assert_array_equal(result, [[2, 3], [5, 6]])
+
+
+def test_to_numpy_copy(float_manipulator):
+    result = float_manipulator.to_numpy(copy=True)
+
+    assert not np.shares_memory(result, float_manipulator.values)
+    np.testing.assert_array_equal(result, [[1, 2, 3], [4, 5, 6]])
+
+
+@pytest.mark.parametrize("columns", [["a", "c"], ["c", "b"]])
+def test_to_numpy_non_adjacent_columns_copy(float_manipulator, columns):
+    result = float_manipulator.to_numpy(columns=columns)
+
+    assert not np.shares_memory(result, float_manipulator.values)
+    np.testing.assert_array_equal(result, float_manipulator.values[columns].tolist())
+
+
+def test_to_numpy_with_dtype(default_manipulator):
+    result = default_manipulator.to_numpy(columns=["num"], dtype="float64")
+
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [[1.0], [2.0], [3.0]])
+
+
+def test_to_numpy_nonexistent_column(default_manipulator):
+    with pytest.raises(ArrayManipulationError):
+        default_manipulator.to_numpy(columns=["nonexistent_column"])
+
+
+def test_to_numpy_invalid_dtype(default_manipulator):
+    with pytest.raises(ArrayManipulationError):
+        default_manipulator.to_numpy(dtype="float64")
+
+
+def test_assign_new_column(default_manipulator):
+    default_manipulator.assign("double", default_manipulator.values["num"] * 2.0)
+
+    assert list(default_manipulator.columns) == ["num", "char", "double"]
+    assert default_manipulator.column_positions["double"] == 2
+    assert default_manipulator.values.tolist() == [(1, "a", 2.0), (2, "b", 4.0), (3, "c", 6.0)]
+
+
+def test_assign_replaces_column_dtype(default_manipulator):
+    default_manipulator.assign("num", np.array([0.5, 1.5, 2.5]))
+
+    assert default_manipulator.values.dtype == np.dtype([("num", "f8"), ("char", "U1")])
+    assert list(default_manipulator.values["char"]) == ["a", "b", "c"]
+
+
+def test_narrowest_dtypes():
+    values = np.array(
+        [(1.0, 0.5, 300, "abc", "héllo", np.nan), (2.0, 1.5, -5, "de", "a", 0.1)],
+        dtype=[("whole", "f4"), ("half", "f8"), ("big", "i8"), ("ascii", "U100"), ("text", "U100"), ("exact", "f8")],
+    )
+    manipulator = StructuredArrayManipulator(values, np.array(values.dtype.names))
+
+    assert manipulator.narrowest_dtypes() == {
+        "half": np.dtype("f4"),
+        "big": np.dtype("i2"),
+        "ascii": np.dtype("S3"),
+        "text": np.dtype("U5"),
+    }
+
+
+def test_memory_usage(default_manipulator):
+    assert default_manipulator.memory_usage() == {"num": 12, "char": 12}
+
+    values = np.array([("abc",)], dtype=[("obj", "O")])
+    manipulator = StructuredArrayManipulator(values, np.array(["obj"]))
+    assert manipulator.memory_usage(deep=True)["obj"] > manipulator.memory_usage()["obj"]
+
+
+def test_change_dtypes_parses_dates():
+    values = np.array([("31/01/2024",), ("01/02/2024",)], dtype=[("day", "U10")])
+    manipulator = StructuredArrayManipulator(values, np.array(["day"]))
+
+    manipulator.change_dtypes({"day": "datetime64"}, date_format="%d/%m/%Y")
+
+    assert manipulator.values.dtype["day"] == np.dtype("datetime64[s]")
+    assert manipulator.values["day"][1] == np.datetime64("2024-02-01")
+    with pytest.raises(ArrayManipulationError):
+        manipulator = StructuredArrayManipulator(values, np.array(["day"]))
+        manipulator.change_dtypes({"day": "datetime64[s]"}, date_format="%Y-%m-%d")
+
+
+def test_change_dtypes_keeps_fractional_seconds_after_first_row():
+    values = np.array([("2024-01-01",), ("2024-01-02 10:00:00.25",)], dtype=[("ts", "S22")])
+    manipulator = StructuredArrayManipulator(values, np.array(["ts"]))
+
+    manipulator.change_dtypes({"ts": "datetime64"})
+
+    assert manipulator.values.dtype["ts"] == np.dtype("datetime64[ns]")
+    assert manipulator.values["ts"][1] == np.datetime64("2024-01-02T10:00:00.25")
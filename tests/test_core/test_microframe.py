@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from hypothesis import given, strategies as st, assume
 import numpy as np
@@ -338,8 +339,8 @@ def test_describe_microframe(capsys):
     columns = ["int_col", "float_col"]
     mf = MicroFrame(data, dtypes, columns)
 
-    # Invoke describe
-    mf.describe()
+    # Invoke describe and print the result
+    mf.describe().head(num_rows=10)
 
     # Capture the output and verify it
     captured = capsys.readouterr()
@@ -351,3 +352,494 @@ def test_describe_microframe(capsys):
     assert "std" in captured.out and "1.0" in captured.out and "10.0" in captured.out
     assert "min" in captured.out and "1" in captured.out and "10.0" in captured.out
     assert "max" in captured.out and "3" in captured.out and "30.0" in captured.out
+
+
+def test_iloc_slice_shares_parent_buffer(default_microframe):
+    mf = default_microframe
+    child = mf.iloc[:2]
+
+    assert np.shares_memory(child.values, mf.values)
+
+
+def test_iloc_setitem_on_view_does_not_affect_parent(default_microframe):
+    mf = default_microframe
+    child = mf.iloc[:2]
+
+    child.iloc[0, 0] = 99.0
+
+    assert child.values["num"][0] == 99.0
+    assert mf.values["num"][0] == 1.0
+    assert not np.shares_memory(child.values, mf.values)
+
+
+def test_iloc_setitem_on_parent_does_not_affect_view(default_microframe):
+    mf = default_microframe
+    child = mf.iloc[:, 1]
+    grandchild = child.iloc[1:]
+
+    mf.iloc[1, 1] = "z"
+
+    assert mf.values["char"][1] == "z"
+    assert list(child.values["char"]) == ["a", "b", "c"]
+    assert list(grandchild.values["char"]) == ["b", "c"]
+
+
+def test_iloc_setitem_without_other_views_writes_in_place(default_microframe):
+    mf = default_microframe
+    values = mf.values
+
+    mf.iloc[0, 0] = 5.0
+
+    assert mf.values is values
+    assert values["num"][0] == 5.0
+
+
+def test_column_views_of_shared_buffer_are_read_only(default_microframe):
+    mf = default_microframe
+    child = mf.iloc[1:]
+
+    with pytest.raises(ValueError):
+        child["num"][0] = 42.0
+    with pytest.raises(ValueError):
+        mf["num"][0] = 42.0
+    assert list(mf.values["num"]) == [1.0, 2.0, 3.0]
+
+    del child
+    mf["num"][0] = 42.0
+    assert mf.values["num"][0] == 42.0
+
+
+def test_to_numpy_views_of_shared_buffer_are_read_only():
+    mf = MicroFrame([["1", "2"], ["3", "4"], ["5", "6"]], ["float64", "float64"], ["a", "b"])
+    child = mf.iloc[1:]
+
+    with pytest.raises(ValueError):
+        child.to_numpy(columns=["a"])[0, 0] = 44.0
+    assert mf.values["a"].tolist() == [1.0, 3.0, 5.0]
+    copied = child.to_numpy(columns=["a"], copy=True)
+    copied[0, 0] = 44.0
+    assert child.values["a"][0] == 3.0
+
+
+def test_memory_usage_counts_record_padding():
+    mf = MicroFrame([[str(value) for value in range(50)]], ["float64"] * 50, [f"c{index}" for index in range(50)])
+    selection = mf.select(["c3", "c7"])
+
+    assert sum(selection.memory_usage().values()) == selection.values.nbytes == 400
+    selection["c3"] = 0.0
+    assert selection.memory_usage() == {"c3": 8, "c7": 8}
+
+
+def test_copies_of_column_selections_are_packed():
+    mf = MicroFrame([[str(value) for value in range(50)]], ["float64"] * 50, [f"c{index}" for index in range(50)])
+    selection = mf.select(["c3", "c7"])
+
+    assert selection.copy().values.dtype.itemsize == 16
+    selection["c3"] = 0.0
+    assert selection.values.dtype.itemsize == 16
+    assert list(selection.values["c7"]) == [7.0]
+    assert mf.values["c3"][0] == 3.0
+
+
+def test_copy_microframe(default_microframe):
+    snapshot = default_microframe.copy()
+
+    assert not np.shares_memory(snapshot.values, default_microframe.values)
+    assert np.array_equal(snapshot.values, default_microframe.values)
+    assert list(snapshot.columns) == list(default_microframe.columns)
+
+
+def test_loc_column_positions_follow_rename(default_microframe):
+    mf = default_microframe
+    assert mf.loc[:, "char"].shape == (3, 1)
+
+    mf.rename({"char": "letter"})
+
+    assert list(mf.loc[:, "letter"].values["letter"]) == ["a", "b", "c"]
+    with pytest.raises(KeyError):
+        _ = mf.loc[:, "char"]
+
+
+@pytest.fixture
+def time_series_microframe():
+    data = [["3", "c"], ["1", "a"], ["2", "b"], ["5", "e"], ["4", "d"]]
+    return MicroFrame(data, ["int64", "U1"], ["ts", "name"])
+
+
+def test_set_index_sorted_point_and_range_lookups(time_series_microframe):
+    mf = time_series_microframe
+    mf.set_index("ts", sorted=True)
+
+    assert list(mf.loc[2].values["name"]) == ["b"]
+    assert list(mf.loc[2:4].values["name"]) == ["b", "c", "d"]
+    assert list(mf.loc[[5, 1], "name"].values["name"]) == ["e", "a"]
+    with pytest.raises(KeyError):
+        _ = mf.loc[6]
+
+
+def test_set_index_unsorted_lookups(time_series_microframe):
+    mf = time_series_microframe
+    mf.set_index("name")
+
+    assert list(mf.loc["d"].values["ts"]) == [4]
+    assert list(mf.loc["b":"d"].values["ts"]) == [3, 2, 4]
+
+
+def test_set_index_on_sorted_column_returns_views(time_series_microframe):
+    mf = time_series_microframe.iloc[[1, 2, 0, 4, 3]]
+    mf.set_index("ts", sorted=True)
+
+    result = mf.loc[2:4]
+
+    assert mf.index.permutation is None
+    assert list(result.values["ts"]) == [2, 3, 4]
+    assert np.shares_memory(result.values, mf.values)
+
+
+def test_set_index_rebuilt_after_mutation(time_series_microframe):
+    mf = time_series_microframe
+    mf.set_index("ts", sorted=True)
+    assert list(mf.loc[1].values["name"]) == ["a"]
+
+    mf.iloc[1, 0] = 10
+
+    assert list(mf.loc[10].values["name"]) == ["a"]
+    with pytest.raises(KeyError):
+        _ = mf.loc[1]
+
+
+def test_set_index_follows_rename_and_reset(time_series_microframe):
+    mf = time_series_microframe
+    mf.set_index("ts", sorted=True)
+    mf.rename({"ts": "time"})
+
+    assert list(mf.loc[3].values["time"]) == [3]
+
+    mf.reset_index()
+    assert mf.index is None
+    assert list(mf.loc[3].values["time"]) == [5]
+
+
+def test_set_index_missing_column(time_series_microframe):
+    with pytest.raises(KeyError):
+        time_series_microframe.set_index("missing")
+
+
+@pytest.fixture
+def customer_microframe():
+    data = [["7", "10"], ["3", "20"], ["7", "30"], ["9", "40"]]
+    return MicroFrame(data, ["int64", "float64"], ["customer_id", "amount"])
+
+
+def test_create_hash_index_and_lookup(customer_microframe):
+    mf = customer_microframe
+    mf.create_hash_index("customer_id")
+
+    result = mf.lookup([9, 7, 1])
+
+    assert isinstance(result, MicroFrame)
+    assert list(result.values["customer_id"]) == [9, 7, 7]
+    assert list(result.values["amount"]) == [40.0, 10.0, 30.0]
+
+
+def test_hash_index_rebuilt_after_mutation(customer_microframe):
+    mf = customer_microframe
+    mf.create_hash_index("customer_id")
+    index = mf._hash_indexes["customer_id"]
+
+    mf.iloc[0, 1] = 15.0
+    assert mf._hash_indexes["customer_id"] is index
+
+    mf.iloc[1, 0] = 7
+    assert list(mf.lookup(7).values["amount"]) == [15.0, 20.0, 30.0]
+    assert len(mf.lookup(3)) == 0
+
+
+def test_indexed_columns_are_read_only_views(customer_microframe):
+    mf = customer_microframe
+    mf.create_hash_index("customer_id")
+
+    with pytest.raises(ValueError):
+        mf["customer_id"][1] = 7
+    with pytest.raises(ValueError):
+        mf.to_numpy(columns=["customer_id"])[1, 0] = 7
+    mf["amount"][1] = 25.0
+
+    mf["customer_id"] = np.array([7, 7, 7, 9])
+    assert list(mf.lookup(7).values["amount"]) == [10.0, 25.0, 30.0]
+    assert len(mf.lookup(3)) == 0
+
+
+def test_row_index_column_is_read_only_view(time_series_microframe):
+    mf = time_series_microframe
+    mf.set_index("ts", sorted=True)
+
+    with pytest.raises(ValueError):
+        mf["ts"][0] = 0
+    assert list(mf.loc[3].values["name"]) == ["c"]
+
+
+def test_hash_index_follows_rename(customer_microframe):
+    mf = customer_microframe
+    mf.create_hash_index("customer_id")
+    mf.rename({"customer_id": "cid"})
+
+    assert list(mf.lookup(3, column="cid").values["amount"]) == [20.0]
+
+
+def test_reset_index_keeps_hash_indexes(customer_microframe):
+    mf = customer_microframe
+    mf.create_hash_index("customer_id")
+    mf.set_index("amount")
+
+    mf.reset_index()
+
+    assert mf.index is None
+    assert list(mf.lookup(3).values["amount"]) == [20.0]
+
+
+def test_lookup_without_hash_index(customer_microframe):
+    with pytest.raises(ValueError):
+        customer_microframe.lookup([7])
+    with pytest.raises(ValueError):
+        customer_microframe.lookup([7], column="amount")
+    with pytest.raises(KeyError):
+        customer_microframe.create_hash_index("missing")
+
+
+@pytest.fixture
+def sales_microframe():
+    data = [["5", "EU"], ["12", "EU"], ["20", "US"], ["11", "EU"]]
+    return MicroFrame(data, ["float64", "U2"], ["price", "region"])
+
+
+def test_query_microframe(sales_microframe):
+    result = sales_microframe.query("price > 10 and region == 'EU'")
+
+    assert isinstance(result, MicroFrame)
+    assert list(result.values["price"]) == [12.0, 11.0]
+    assert list(result.columns) == ["price", "region"]
+
+
+def test_query_microframe_with_variables(sales_microframe):
+    result = sales_microframe.query("price > limit", limit=15)
+    assert list(result.values["region"]) == ["US"]
+
+
+def test_filter_microframe(sales_microframe):
+    result = sales_microframe.filter(sales_microframe["region"] == "US")
+    assert list(result.values["price"]) == [20.0]
+
+    with pytest.raises(TypeError):
+        sales_microframe.filter([1, 0, 0, 0])
+    with pytest.raises(IndexError):
+        sales_microframe.filter([True, False])
+
+
+@pytest.fixture
+def unsorted_microframe():
+    data = [["b", "2", "1.5"], ["a", "1", "nan"], ["b", "1", "0.5"], ["a", "3", "2.5"], ["c", "2", "1.5"]]
+    return MicroFrame(data, ["U1", "int32", "float64"], ["group", "rank", "score"])
+
+
+def test_sort_values_multiple_keys(unsorted_microframe):
+    result = unsorted_microframe.sort_values(by=["group", "rank"], ascending=[True, False])
+
+    assert list(result["group"]) == ["a", "a", "b", "b", "c"]
+    assert list(result["rank"]) == [3, 1, 2, 1, 2]
+    assert list(unsorted_microframe["rank"]) == [2, 1, 1, 3, 2]
+
+
+def test_sort_values_descending_keeps_ties_and_nan_last(unsorted_microframe):
+    assert list(unsorted_microframe.argsort("score", ascending=False)) == [3, 0, 4, 2, 1]
+    assert list(unsorted_microframe.argsort("score")) == [2, 0, 4, 3, 1]
+    assert list(unsorted_microframe.sort_values("group", ascending=False)["group"]) == ["c", "b", "b", "a", "a"]
+
+
+def test_argsort_is_cached_until_keys_change(unsorted_microframe):
+    first = unsorted_microframe.argsort(["group", "rank"])
+
+    assert unsorted_microframe.argsort(["group", "rank"]) is first
+    assert not first.flags.writeable
+
+    unsorted_microframe.iloc[0, 2] = 9.0
+    assert unsorted_microframe.argsort(["group", "rank"]) is first
+
+    unsorted_microframe.iloc[0, 1] = 0
+    assert unsorted_microframe.argsort(["group", "rank"]) is not first
+    assert list(unsorted_microframe.argsort(["group", "rank"])) == [1, 3, 0, 2, 4]
+
+
+def test_sorted_columns_are_read_only_views(unsorted_microframe):
+    mf = unsorted_microframe
+    mf.argsort("rank")
+
+    with pytest.raises(ValueError):
+        mf["rank"][0] = 0
+    mf["score"][0] = 0.0
+
+    mf["rank"] = np.array([0, 1, 1, 3, 2], dtype=np.int32)
+    assert list(mf.argsort("rank")) == [0, 1, 2, 4, 3]
+    assert list(mf.sort_values("rank")["group"]) == ["b", "a", "b", "c", "a"]
+
+
+def test_sort_values_errors(unsorted_microframe):
+    with pytest.raises(KeyError):
+        unsorted_microframe.sort_values("missing")
+    with pytest.raises(ValueError):
+        unsorted_microframe.sort_values(["group", "rank"], ascending=[True])
+
+
+@pytest.fixture
+def revenue_microframe():
+    data = [["10", "4", "a"], ["20", "5", "b"], ["30", "9", "c"]]
+    return MicroFrame(data, ["float64", "float64", "U1"], ["rev", "cost", "name"])
+
+
+def test_setitem_adds_derived_column(revenue_microframe):
+    revenue_microframe["margin"] = revenue_microframe["rev"] - revenue_microframe["cost"]
+
+    assert list(revenue_microframe.columns) == ["rev", "cost", "name", "margin"]
+    assert list(revenue_microframe["margin"]) == [6.0, 15.0, 21.0]
+    assert revenue_microframe.loc[1, "margin"] == 15.0
+
+
+def test_setitem_existing_column(revenue_microframe):
+    view = revenue_microframe.iloc[:]
+    revenue_microframe["cost"] = np.array([1.0, 2.0, 3.0])
+    revenue_microframe["rev"] = 0
+    revenue_microframe["name"] = np.array([1, 2, 3])
+
+    assert list(revenue_microframe["cost"]) == [1.0, 2.0, 3.0]
+    assert list(revenue_microframe["rev"]) == [0.0, 0.0, 0.0]
+    assert revenue_microframe.values.dtype["name"] == np.dtype(int)
+    assert list(view["cost"]) == [4.0, 5.0, 9.0]
+
+
+def test_setitem_wrong_length(revenue_microframe):
+    with pytest.raises(ValueError):
+        revenue_microframe["margin"] = np.array([1.0, 2.0])
+
+
+def test_select_and_drop_are_views(revenue_microframe):
+    selected = revenue_microframe.select(["name", "rev"])
+    dropped = revenue_microframe.drop(columns="name")
+
+    assert list(selected.columns) == ["name", "rev"]
+    assert list(dropped.columns) == ["rev", "cost"]
+    assert np.may_share_memory(selected.values, revenue_microframe.values)
+    assert np.array_equal(dropped.to_numpy(), [[10.0, 4.0], [20.0, 5.0], [30.0, 9.0]])
+
+    dropped.iloc[0, 0] = 99.0
+    assert revenue_microframe["rev"][0] == 10.0
+    with pytest.raises(KeyError):
+        revenue_microframe.select(["missing"])
+    with pytest.raises(KeyError):
+        revenue_microframe.drop(columns=["missing"])
+
+
+def test_eval_into_new_and_existing_columns(revenue_microframe):
+    result = revenue_microframe.eval("(rev - cost) / rev", block_size=2)
+    assert np.allclose(result, [0.6, 0.75, 0.7])
+
+    view = revenue_microframe.iloc[:]
+    revenue_microframe.eval("rev - cost", out="margin", block_size=2)
+    revenue_microframe.eval("rev * rate", out="rev", rate=2)
+
+    assert list(revenue_microframe["margin"]) == [6.0, 15.0, 21.0]
+    assert list(revenue_microframe["rev"]) == [20.0, 40.0, 60.0]
+    assert list(view["rev"]) == [10.0, 20.0, 30.0]
+
+
+def test_eval_into_array(revenue_microframe):
+    out = np.empty(3, dtype=np.float32)
+    assert revenue_microframe.eval("cost * 2", out=out) is out
+    assert list(out) == [8.0, 10.0, 18.0]
+    with pytest.raises(ValueError):
+        revenue_microframe.eval("cost * 2", out=np.empty(2))
+
+
+def test_describe_returns_microframe():
+    data = [["1", "10.0", "a"], ["2", "nan", "b"], ["3", "30.0", "c"], ["4", "40.0", "d"]]
+    mf = MicroFrame(data, ["int32", "float64", "U1"], ["int_col", "float_col", "char"])
+
+    summary = mf.describe(percentiles=[0.25, 0.5])
+
+    assert list(summary.columns) == ["stats", "int_col", "float_col"]
+    assert list(summary["stats"]) == ["count", "mean", "std", "25%", "50%", "min", "max"]
+    assert np.allclose(summary["int_col"], [4, 2.5, np.std([1, 2, 3, 4], ddof=1), 1.75, 2.5, 1, 4])
+    assert np.allclose(summary["float_col"], [3, 80 / 3, np.std([10, 30, 40], ddof=1), 20, 30, 10, 40])
+    with pytest.raises(ValueError):
+        mf.describe(percentiles=[50])
+
+
+def test_pickle_round_trip(revenue_microframe):
+    revenue_microframe.set_index("cost")
+    view = revenue_microframe.select(["rev"])
+
+    restored = pickle.loads(pickle.dumps(revenue_microframe))
+    assert np.array_equal(restored.values, revenue_microframe.values)
+    assert restored.loc[5.0]["rev"][0] == 20.0
+
+    buffers = []
+    data = pickle.dumps(view, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1 and len(data) < 1000
+    restored = pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers])
+    assert restored.values.dtype.names == ("rev",) and restored.values.dtype.itemsize == 8
+    restored["rev"] = 0.0
+    assert list(restored["rev"]) == [0.0, 0.0, 0.0]
+
+
+def test_pickle_buffers_in_process_do_not_share_writes(revenue_microframe):
+    buffers = []
+    data = pickle.dumps(revenue_microframe, protocol=5, buffer_callback=buffers.append)
+    restored = pickle.loads(data, buffers=buffers)
+
+    restored["rev"] = 0.0
+    assert list(revenue_microframe["rev"]) == [10.0, 20.0, 30.0]
+    revenue_microframe["cost"] = 1.0
+    assert list(restored["cost"]) == [4.0, 5.0, 9.0]
+
+
+def test_optimize_dtypes():
+    data = [["1", "abc", "1.5"], ["2", "de", "2.5"]]
+    mf = MicroFrame(data, ["float32", "U100", "float64"], ["id", "name", "price"])
+    before = mf.memory_usage()
+
+    saved = mf.optimize_dtypes()
+
+    assert mf.values.dtype == np.dtype([("id", "f4"), ("name", "S3"), ("price", "f4")])
+    assert saved == sum(before.values()) - sum(mf.memory_usage().values())
+    assert list(mf["price"]) == [1.5, 2.5]
+    assert mf.optimize_dtypes() == 0
+
+
+def test_optimize_dtypes_keeps_floats_as_floats():
+    mf = MicroFrame([["1.0", "-0.0"], ["2.0", "3.0"]], ["float64", "float64"], ["price", "signed"])
+
+    mf.optimize_dtypes()
+
+    assert mf.values.dtype == np.dtype([("price", "f4"), ("signed", "f4")])
+    assert list(mf.eval("price * 100")) == [100.0, 200.0]
+    assert np.signbit(mf["signed"][0])
+
+
+def test_change_dtypes_fits_text_width():
+    mf = MicroFrame([["1", "abc"], ["2", "de"]], ["int64", "U100"], ["id", "name"])
+
+    mf.change_dtypes({"name": "S"})
+
+    assert mf.dtypes["name"] == "S3"
+    assert list(mf.query("name == 'de'")["id"]) == [2]
+    mf.set_index("name", sorted=True)
+    assert list(mf.loc["abc"]["id"]) == [1]
+
+
+def test_byte_string_column_compares_with_str():
+    mf = MicroFrame([["1", "ab"], ["2", "cd"]], ["int64", "S2"], ["id", "name"])
+
+    assert list(mf["name"] == "ab") == [True, False]
+    assert list(mf["name"] != np.array(["ab", "xx"])) == [False, True]
+    assert list(mf.filter(mf["name"] >= "b")["id"]) == [2]
+    assert type(mf["name"] == "ab") is np.ndarray
+    assert mf["name"][0] == b"ab"
@@ -254,3 +254,7 @@ def test_structured_print_truncated_tail(printer_with_many_columns, capsys):
         "4 rows x 4 columns\n"
     )
     assert captured.out == expected_output
+
+
+def test_byte_strings_print_as_text(default_printer):
+    assert default_printer._truncate_value(b"EU") == "EU"
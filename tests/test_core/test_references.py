@@ -0,0 +1,36 @@
+import gc
+from microframe.core.references import BufferReferences
+
+
+class Referrer:
+    pass
+
+
+def test_buffer_references_owner():
+    owner = Referrer()
+    references = BufferReferences(owner)
+
+    assert len(references) == 1
+    assert not references.has_other_referrers(owner)
+
+
+def test_buffer_references_other_referrers():
+    owner = Referrer()
+    view = Referrer()
+    references = BufferReferences(owner)
+    references.add(view)
+
+    assert references.has_other_referrers(owner)
+    assert references.has_other_referrers(view)
+
+    references.discard(view)
+    assert not references.has_other_referrers(owner)
+
+
+def test_buffer_references_drop_collected_referrers():
+    owner = Referrer()
+    references = BufferReferences(owner)
+    references.add(Referrer())
+    gc.collect()
+
+    assert not references.has_other_referrers(owner)
@@ -0,0 +1,110 @@
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+from microframe.core.microframe import MicroFrame
+from microframe.core.shared import attach_shared_values, create_shared_values
+
+
+def double_price(part):
+    assert not part.values.flags.writeable
+    part["price"] = part["price"] * 2
+    return part
+
+
+def partition_size(part):
+    values = np.zeros(1, dtype=[("rows", np.int64)])
+    values["rows"] = part.values.shape[0]
+    return values
+
+
+def not_a_frame(part):
+    return 1
+
+
+def total_price(name):
+    return float(MicroFrame.attach(name)["price"].sum())
+
+
+@pytest.fixture
+def mframe():
+    data = [[index, f"item{index}", float(index)] for index in range(10)]
+    return MicroFrame(data, dtypes=["int", "U8", "float"], columns=["id", "name", "price"])
+
+
+def test_shared_values_round_trip(mframe):
+    segment = create_shared_values(mframe.values)
+    try:
+        values = attach_shared_values(segment.name)
+        assert values.dtype == mframe.values.dtype
+        assert not values.flags.writeable
+        np.testing.assert_array_equal(values, mframe.values)
+        del values
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def test_shared_values_header_holds_nested_and_padded_fields():
+    values = np.zeros(3, dtype=[("id", "i8"), ("point", [("x", "f4"), ("y", "f4")]), ("pair", "f8", (2,))])
+    values["pair"] = [[1, 2], [3, 4], [5, 6]]
+    selected = values[["id", "pair"]]
+    segment = create_shared_values(selected)
+    try:
+        attached = attach_shared_values(segment.name)
+        assert attached.dtype.names == ("id", "pair") and attached.dtype.itemsize == 24
+        assert attached["id"].tolist() == [0, 0, 0]
+        np.testing.assert_array_equal(attached["pair"], values["pair"])
+        del attached
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def test_map_partitions(mframe):
+    result = mframe.map_partitions(double_price, partitions=3, workers=2)
+
+    np.testing.assert_array_equal(result["id"], np.arange(10))
+    np.testing.assert_array_equal(result["price"], np.arange(10) * 2.0)
+    np.testing.assert_array_equal(mframe["price"], np.arange(10, dtype=float))
+    np.testing.assert_array_equal(mframe.map_partitions(partition_size, partitions=4, workers=2)["rows"], [2, 3, 2, 3])
+
+
+def test_map_partitions_errors(mframe):
+    with pytest.raises(ValueError):
+        mframe.map_partitions(double_price, partitions=0, workers=1)
+    with pytest.raises(TypeError):
+        mframe.map_partitions(not_a_frame, workers=1)
+
+
+def test_to_shared_and_attach(mframe):
+    segment = mframe.to_shared()
+    try:
+        attached = MicroFrame.attach(segment.name)
+        assert list(attached.columns) == ["id", "name", "price"]
+        np.testing.assert_array_equal(attached.values, mframe.values)
+        attached["price"] = 0.0
+        assert MicroFrame.attach(segment.name)["price"].sum() == 45.0
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(total_price, segment.name).result() == 45.0
+        del attached
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def test_attach_from_independent_processes(mframe):
+    script = "import sys; from microframe import MicroFrame; print(MicroFrame.attach(sys.argv[1])['price'].sum())"
+    segment = mframe.to_shared()
+    try:
+        for _ in range(2):
+            completed = subprocess.run(
+                [sys.executable, "-c", script, segment.name], capture_output=True, text=True, check=True
+            )
+            assert completed.stdout.strip() == "45.0"
+            assert "leaked" not in completed.stderr
+        assert MicroFrame.attach(segment.name)["price"].sum() == 45.0
+    finally:
+        segment.close()
+        segment.unlink()
@@ -0,0 +1,77 @@
+import pickle
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.sketches import KLLSketch, HyperLogLog, hash_values
+
+
+def test_kll_sketch_quantiles_within_rank_error():
+    values = np.random.default_rng(0).normal(size=200_000)
+    sketch = KLLSketch(k=200, seed=0)
+    for start in range(0, values.size, 10_000):
+        sketch.update(values[start:start + 10_000])
+
+    quantiles = [0.0, 0.1, 0.5, 0.9, 1.0]
+    estimates = sketch.quantiles(quantiles)
+    ranks = np.searchsorted(np.sort(values), estimates) / values.size
+
+    assert sketch.count == values.size
+    assert len(sketch) < 1000
+    assert np.abs(ranks - quantiles).max() < 0.02
+    assert (estimates[0], estimates[-1]) == (values.min(), values.max())
+
+
+def test_kll_sketch_merge_and_pickle():
+    values = np.arange(10_000, dtype=np.float64)
+    first = KLLSketch(seed=1).update(values[:5000])
+    second = pickle.loads(pickle.dumps(KLLSketch(seed=2).update(values[5000:])))
+
+    merged = first.merge(second)
+
+    assert merged.count == 10_000
+    assert abs(merged.quantiles([0.5])[0] - 5000) < 200
+    assert np.isnan(KLLSketch().update(np.array([np.nan])).quantiles([0.5])).all()
+    with pytest.raises(ValueError):
+        merged.quantiles([1.5])
+
+
+def test_hyperloglog_estimate_and_merge():
+    ids = np.random.default_rng(3).integers(0, 50_000, 200_000)
+    first = HyperLogLog().update(ids[:100_000])
+    second = HyperLogLog().update(ids[100_000:])
+
+    exact = np.unique(ids).size
+    assert abs(first.merge(second).estimate() - exact) / exact < 0.03
+    assert HyperLogLog().update(np.array([1.0, np.nan, 1.0, 2.0])).estimate() == 2
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(precision=10))
+
+
+def test_hash_values_ignores_string_width():
+    short = np.array(["ab", "c"], dtype="U2")
+    wide = np.array(["ab", "c"], dtype="U8")
+
+    assert np.array_equal(hash_values(short), hash_values(wide))
+    assert hash_values(short)[0] != hash_values(short)[1]
+    with pytest.raises(TypeError):
+        hash_values(np.array([object()]))
+
+
+def test_microframe_approx_quantiles_and_nunique():
+    values = np.empty(1000, dtype=[("x", np.float64), ("name", "U3")])
+    values["x"] = np.arange(1000)
+    values["name"] = np.array(["a", "b", "c", "d"])[np.arange(1000) % 4]
+    mframe = MicroFrame.from_structured_array(values)
+
+    quantiles = mframe.approx_quantiles("x", [0.0, 0.5, 1.0])
+
+    assert list(quantiles.columns) == ["quantile", "x"]
+    assert quantiles["x"][0] == 0.0 and quantiles["x"][2] == 999.0
+    assert abs(quantiles["x"][1] - 500) < 20
+    counts = mframe.approx_nunique()
+    assert abs(counts["x"] - 1000) < 30
+    assert counts["name"] == 4
+    with pytest.raises(TypeError):
+        mframe.approx_quantiles("name", [0.5])
+    with pytest.raises(KeyError):
+        mframe.approx_nunique("missing")
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from microframe.core.microframe import MicroFrame
+from microframe.core.stats import EMPTY_MOMENTS, StatsAccumulator, column_moments, column_quantiles, merge_moments
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1000])
+def test_column_moments_matches_numpy(block_size):
+    column = np.random.default_rng(0).normal(1e6, 3.0, size=500)
+    column[::10] = np.nan
+    valid = column[~np.isnan(column)]
+
+    moments = column_moments(column, block_size=block_size)
+
+    assert moments.count == valid.size
+    assert moments.mean == pytest.approx(valid.mean())
+    assert moments.m2 / (moments.count - 1) == pytest.approx(valid.var(ddof=1))
+    assert (moments.min, moments.max) == (valid.min(), valid.max())
+
+
+def test_merge_moments_with_empty():
+    moments = column_moments(np.array([1, 2, 3], dtype=np.int8))
+
+    assert merge_moments(EMPTY_MOMENTS, moments) == pytest.approx(moments)
+    assert merge_moments(moments, EMPTY_MOMENTS) == pytest.approx(moments)
+
+    empty = column_moments(np.array([np.nan]))
+    assert empty.count == 0 and np.isnan(empty.min) and np.isnan(empty.max)
+
+
+def test_column_quantiles_matches_numpy():
+    column = np.random.default_rng(1).random(101)
+    quantiles = [0, 0.1, 0.25, 0.5, 0.999, 1]
+
+    assert np.allclose(column_quantiles(column, quantiles), np.quantile(column, quantiles))
+    assert np.isnan(column_quantiles(np.array([np.nan]), [0.5])).all()
+
+
+def test_stats_accumulator_matches_describe():
+    rng = np.random.default_rng(2)
+    values = np.empty(1000, dtype=[("a", np.float64), ("b", np.int16), ("name", "U2")])
+    values["a"], values["b"], values["name"] = rng.normal(size=1000), rng.integers(0, 100, 1000), "x"
+    values["a"][::7] = np.nan
+    frame = MicroFrame.from_structured_array(values)
+
+    accumulator = StatsAccumulator()
+    for start in range(0, 1000, 300):
+        accumulator.update(frame.iloc[start:start + 300])
+
+    assert accumulator.columns == ["a", "b"]
+    expected = frame.describe().values
+    result = accumulator.to_frame().values
+    assert list(result["stats"]) == list(expected["stats"])
+    for column in ["a", "b"]:
+        assert np.allclose(result[column], expected[column])
+
+
+def test_stats_accumulator_merge():
+    frame = MicroFrame([["1"], ["2"], ["3"], ["10"]], ["float64"], ["x"])
+    first = StatsAccumulator().update(frame.iloc[:2])
+    second = StatsAccumulator().update(frame.iloc[2:])
+
+    merged = StatsAccumulator().merge(first).merge(second)
+
+    assert np.allclose(merged.to_frame()["x"], frame.describe()["x"])
+    with pytest.raises(ValueError):
+        merged.merge(StatsAccumulator(["y"]))
+    with pytest.raises(KeyError):
+        StatsAccumulator(["y"]).update(frame)
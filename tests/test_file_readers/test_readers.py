@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 from unittest.mock import mock_open, patch
-from microframe.readers.readers import read_csv
+from microframe.readers.readers import read_csv, scan_csv
 from microframe.core.microframe import MicroFrame
 
 
@@ -46,3 +46,81 @@ def test_incorrect_csv_content_format(tmpdir):
     file_path.write("This is not a CSV format")
     with pytest.raises(ValueError):  # Change to expect ValueError
         read_csv(str(file_path))
+
+
+def test_read_csv_usecols(tmpdir):
+    file_path = tmpdir.join("usecols.csv")
+    file_path.write("a,b,c\n1,x,3\n2,y,4")
+    microframe = read_csv(str(file_path), usecols=["c", "a"])
+    assert list(microframe.columns) == ["a", "c"]
+    assert list(microframe["c"]) == [3.0, 4.0]
+
+    with pytest.raises(ValueError):
+        read_csv(str(file_path), usecols=["missing"])
+
+
+def test_scan_csv(tmpdir):
+    file_path = tmpdir.join("scan.csv")
+    file_path.write("price,region,qty\n5,EU,1\n12,EU,2\n20,US,3")
+    plan = scan_csv(str(file_path)).filter("price > 10").select(["region"])
+
+    assert plan.optimize().scan.columns == ["region", "price"]
+    result = plan.collect()
+    assert list(result.columns) == ["region"]
+    assert list(result["region"]) == ["EU", "US"]
+
+
+def test_read_csv_chunksize(tmpdir):
+    file_path = tmpdir.join("chunks.csv")
+    file_path.write("id,price,name\n" + "".join(f"{i},{i}.5,n{i}\n" for i in range(7)))
+
+    chunks = list(read_csv(str(file_path), chunksize=3, usecols=["id", "price"]))
+
+    assert [chunk.shape for chunk in chunks] == [(3, 2), (3, 2), (1, 2)]
+    assert all(chunk.dtypes == chunks[0].dtypes for chunk in chunks)
+    assert list(chunks[2]["id"]) == [6]
+
+
+def test_read_csv_chunksize_errors(tmpdir):
+    file_path = tmpdir.join("header_only.csv")
+    file_path.write("id,price\n")
+
+    with pytest.raises(ValueError):
+        list(read_csv(str(file_path), chunksize=2))
+    with pytest.raises(ValueError):
+        read_csv(str(file_path), chunksize=0)
+
+
+def test_read_csv_compact_strings(tmpdir):
+    file_path = tmpdir.join("text.csv")
+    file_path.write("id,region,city\n1,EU,Zürich\n2,US,Austin\n")
+
+    result = read_csv(str(file_path), compact_strings=True)
+
+    assert result.dtypes["region"] == "S2" and result.dtypes["city"] == "U6"
+    assert list(result.query("region == 'EU'")["id"]) == [1]
+    chunks = list(read_csv(str(file_path), chunksize=1, compact_strings=True))
+    assert [chunk.dtypes["city"] for chunk in chunks] == ["U6", "S6"]
+
+
+def test_read_csv_dates(tmpdir):
+    file_path = tmpdir.join("dates.csv")
+    file_path.write("id,ts,day\n1,2024-01-05 10:00:00,05/01/2024\n2,2024-02-05 11:30:00,06/02/2024\n3,,\n")
+
+    result = read_csv(str(file_path), date_formats=["%d/%m/%Y"])
+
+    assert result.dtypes["ts"] == "datetime64[s]" and result.dtypes["day"] == "datetime64[s]"
+    assert result["day"][1] == np.datetime64("2024-02-06")
+    assert np.isnat(result["ts"][2])
+    assert list(result.query("ts >= '2024-02-01'")["id"]) == [2]
+
+
+def test_read_csv_dates_scan_every_row(tmpdir):
+    file_path = tmpdir.join("dates.csv")
+    file_path.write("id,ts,day\n1,2024-01-01,01/02/2024\n2,2024-01-02 10:00:00.25,1/3/2024\n")
+
+    result = read_csv(str(file_path), date_formats=["%d/%m/%Y"])
+
+    assert result.dtypes["ts"] == "datetime64[ns]"
+    assert result["ts"][1] == np.datetime64("2024-01-02T10:00:00.25")
+    assert result["day"][1] == np.datetime64("2024-03-01")
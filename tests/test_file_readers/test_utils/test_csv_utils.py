@@ -85,3 +85,15 @@ def test_infer_column_dtypes_expected(input_data, expected_output):
 def test_infer_column_dtypes_exceptions(input_data, expected_exception):
     with pytest.raises(expected_exception):
         csv_utils.infer_column_dtypes(input_data)
+
+
+def test_fit_text_dtypes():
+    data = [["1", "abc", "é"], ["2", "de", "ab"]]
+    assert csv_utils.fit_text_dtypes(data, ["float32", "U100", "U100"]) == ["float32", "S3", "U2"]
+
+
+def test_infer_column_dtypes_dates():
+    data = [["1", "2024-01-31", "2024-01-31 10:00:00.5", "31/01/2024", "EU"]]
+    assert csv_utils.infer_column_dtypes(data, ["%d/%m/%Y"]) == [
+        "float32", "datetime64[s]", "datetime64[ns]", "datetime64[s]", "U100"
+    ]